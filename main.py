@@ -8,7 +8,7 @@ import pygame
 
 from src.data_loader import StatsBombDataLoader, get_player_info
 from src.game_engine import GameEngine
-from src.renderer import Renderer, UIState
+from src.renderer import Renderer, UIState, coalesce_motion
 from src.stats_tracker import StatsTracker
 from src.config import *
 
@@ -29,7 +29,15 @@ def main():
     
     # Initialize Pygame
     pygame.init()
-    screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    # SCALED: SDL presents the logical SCREEN_WIDTH x SCREEN_HEIGHT buffer
+    # through its renderer (GPU scaling where available) instead of a
+    # software window surface
+    try:
+        screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT),
+                                         pygame.SCALED | pygame.DOUBLEBUF, vsync=1)
+    except pygame.error:
+        # No vsync support on this driver
+        screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SCALED | pygame.DOUBLEBUF)
     pygame.display.set_caption("Football Match Simulator")
     clock = pygame.time.Clock()
     
@@ -163,11 +171,15 @@ def main():
             else:
                 renderer.team_b_dropdown.selected_index = -1
 
-        # 4. Handle events
-        for event in pygame.event.get():
+        # 4. Handle events (one batch per frame, intermediate mouse motion dropped)
+        for event in coalesce_motion(pygame.event.get()):
             if event.type == pygame.QUIT:
                 running = False
             
+            elif event.type == pygame.WINDOWEXPOSED:
+                # Only dirty regions are presented normally; repaint everything
+                renderer.request_full_redraw()
+            
             elif event.type == pygame.KEYDOWN:
                 if event.key == pygame.K_ESCAPE:
                     if renderer.state == UIState.SIMULATION:
@@ -358,7 +370,8 @@ def main():
         elif renderer.state == UIState.ML_SIMULATION:
             renderer.render()
         
-        pygame.display.flip()
+        # Only push the regions the renderer actually changed
+        pygame.display.update(renderer.dirty_rects)
     
     # Cleanup
     pygame.quit()
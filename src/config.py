@@ -11,10 +11,13 @@ import os
 BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 DATA_DIR = os.path.join(BASE_DIR, 'data', 'matches')
 ASSETS_DIR = os.path.join(BASE_DIR, 'assets')
+CACHE_DIR = os.path.join(BASE_DIR, '.cache')  # Trained models, derived data
 
 # ============================================================================
 # SCREEN SETTINGS
 # ============================================================================
+# Logical resolution: all layout is in these pixels; the window is opened
+# with pygame.SCALED so SDL scales the buffer to the actual window size
 SCREEN_WIDTH = 1280      # Total window width
 SCREEN_HEIGHT = 720      # Total window height
 FPS = 60                 # Frames per second
@@ -18,7 +18,7 @@ from typing import List, Dict, Tuple, Optional
 from dataclasses import dataclass
 from enum import Enum
 
-from kloppy.domain import Dataset, Event, EventType, Team, Player
+from kloppy.domain import Dataset, Event, EventType, ShotResult, Team, Player
 
 # Import MatchState wrapper (lazy to avoid circular imports)
 _match_state_module = None
@@ -34,8 +34,11 @@ def _get_match_state_class():
 # ============================================================================
 # DATA STRUCTURES
 # ============================================================================
+# slots=True: these are read and written per player every frame by the
+# engines and renderer; slotted attributes are faster on CPython and let
+# PyPy's JIT specialise attribute access.
 
-@dataclass
+@dataclass(slots=True)
 class PlayerState:
     """
     Represents a player's state at a specific moment.
@@ -47,7 +50,7 @@ class PlayerState:
     is_active: bool = True  # False if substituted off
     
     
-@dataclass
+@dataclass(slots=True)
 class BallState:
     """
     Represents the ball's state at a specific moment.
@@ -58,7 +61,7 @@ class BallState:
     in_play: bool = True
     
 
-@dataclass
+@dataclass(slots=True)
 class GameState:
     """
     Complete game state at any moment in time.
@@ -71,6 +74,8 @@ class GameState:
     players: Dict[str, PlayerState]  # player_id -> PlayerState
     ball: BallState
     last_event: Optional[Event] = None
+    roster_version: int = 0        # Bumped whenever players join or is_active flips
+    positions: Optional[np.ndarray] = None  # Live (N, 2) x/y in players order, if the engine keeps one
     
 
 class AnimationPhase(Enum):
@@ -392,16 +397,14 @@ class GameEngine:
     def _get_global_time(self, event: Event) -> float:
         """Convert event period/timestamp to global match seconds."""
         t = event.timestamp
-        if hasattr(t, 'total_seconds'):
-            t = t.total_seconds()
+        total_seconds = getattr(t, 'total_seconds', None)
+        if total_seconds is not None:
+            t = total_seconds()
             
-        period = 1
-        if hasattr(event, 'period'):
-             # Handle integer or object with id
-             if hasattr(event.period, 'id'):
-                 period = event.period.id
-             else:
-                 period = int(event.period)
+        # Handle integer or object with id
+        period = getattr(event, 'period', 1)
+        period_id = getattr(period, 'id', None)
+        period = int(period) if period_id is None else period_id
                  
         offset = self.period_offsets.get(period, 0.0)
         return offset + t
@@ -497,10 +500,12 @@ class GameEngine:
             event_time = self._get_global_time(event)
             
             # Get freeze frame data if available
-            if hasattr(event, 'freeze_frame') and event.freeze_frame:
+            freeze_frame = getattr(event, 'freeze_frame', None)
+            if freeze_frame:
                 try:
-                    if hasattr(event.freeze_frame, 'players_coordinates'):
-                         for player, point in event.freeze_frame.players_coordinates.items():
+                    players_coordinates = getattr(freeze_frame, 'players_coordinates', None)
+                    if players_coordinates is not None:
+                         for player, point in players_coordinates.items():
                             player_id = player.player_id
                             
                             if player_id in position_timeline:
@@ -548,7 +553,7 @@ class GameEngine:
                 timeline.append((t, event.coordinates.x, event.coordinates.y, 0.0))
                 
                 # If there's an end coordinate and duration, add the end point
-                if hasattr(event, 'end_coordinates') and event.end_coordinates:
+                if getattr(event, 'end_coordinates', None):
                     # Estimate duration or valid end time? 
                     # Usually next event time is better, but if it has end_coordinates it implies movement *during* event
                     # For now, let's just stick to point-to-point between events for simplicity
@@ -781,8 +786,8 @@ class GameEngine:
             self.current_state.period = event.period.id
         
         # Update score on goal events
-        if event.event_type == EventType.SHOT and hasattr(event, 'result'):
-            if event.result and event.result.name == 'GOAL':
+        if event.event_type is EventType.SHOT:
+            if getattr(event, 'result', None) is ShotResult.GOAL:
                 if event.team == self.teams[0]:
                     self.current_state.score_home += 1
                 else:
@@ -816,6 +821,7 @@ class GameEngine:
                     has_ball=True,
                     is_active=True
                 )
+                self.current_state.roster_version += 1
     
     def seek_to_time(self, timestamp: float):
         """
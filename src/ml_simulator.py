@@ -5,7 +5,7 @@ Predicts match outcomes using ELO ratings and RandomForest classifier
 
 import os
 import sys
-import random
+import hashlib
 from dataclasses import dataclass, field
 from typing import Dict, List, Tuple, Optional
 
@@ -17,8 +17,15 @@ BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 ML_SANDBOX_DIR = os.path.join(BASE_DIR, 'laliga_ml_sandbox')
 sys.path.insert(0, ML_SANDBOX_DIR)
 
+import joblib
+import sklearn
 from sklearn.ensemble import RandomForestClassifier
 
+from src.config import CACHE_DIR
+
+# Bump when training/feature code changes so stale model caches are ignored
+MODEL_CACHE_VERSION = 1
+
 
 @dataclass
 class MatchEvent:
@@ -97,22 +104,150 @@ class EloRating:
         return (self.get_rating(home_team) + self.home_advantage) - self.get_rating(away_team)
 
 
+# Per-team averages, one record per team (indexed via MLSimulator._team_index)
+TEAM_STATS_DTYPE = np.dtype([
+    ('home_goals_avg', 'f8'),
+    ('away_goals_avg', 'f8'),
+    ('home_conceded_avg', 'f8'),
+    ('away_conceded_avg', 'f8'),
+    ('win_rate', 'f8'),
+    ('avg_shots', 'f8'),
+])
+
+
+class CompiledForest:
+    """
+    Flattened, NumPy-only predictor for a fitted RandomForestClassifier.
+
+    All trees are packed into one set of structure-of-arrays (feature,
+    threshold, left, right, leaf value) and traversed in lock-step with
+    predicated updates, so a prediction is ~max_depth vectorised steps
+    instead of one Python-level ``predict_proba`` dispatch per tree.
+    Leaves point back at themselves, which lets every tree run for the
+    same number of steps without branching.
+    """
+
+    def __init__(self, model: RandomForestClassifier):
+        features, thresholds, lefts, rights, values, roots = [], [], [], [], [], []
+        offset = 0
+        depth = 0
+        for estimator in model.estimators_:
+            tree = estimator.tree_
+            n = tree.node_count
+            idx = np.arange(n)
+            is_leaf = tree.children_left == -1
+
+            roots.append(offset)
+            features.append(np.where(is_leaf, 0, tree.feature))
+            # Thresholds stay float64: they are midpoints between float32
+            # samples and rounding them could flip a split
+            thresholds.append(np.where(is_leaf, np.inf, tree.threshold))
+            lefts.append(np.where(is_leaf, idx, tree.children_left) + offset)
+            rights.append(np.where(is_leaf, idx, tree.children_right) + offset)
+
+            # Same normalisation sklearn applies per tree in predict_proba
+            value = tree.value[:, 0, :].astype(np.float64)
+            totals = value.sum(axis=1, keepdims=True)
+            totals[totals == 0.0] = 1.0
+            values.append((value / totals).astype(np.float32))
+
+            offset += n
+            depth = max(depth, tree.max_depth)
+
+        self.classes_ = model.classes_
+        self.n_trees = len(roots)
+        self.depth = depth
+        self.feature = np.concatenate(features).astype(np.intp)
+        self.threshold = np.concatenate(thresholds)
+        self.left = np.concatenate(lefts).astype(np.intp)
+        self.right = np.concatenate(rights).astype(np.intp)
+        self.value = np.concatenate(values)
+        self.roots = np.asarray(roots, dtype=np.intp)
+
+    def predict_proba(self, X) -> np.ndarray:
+        """Class probabilities, matching ``RandomForestClassifier.predict_proba``."""
+        # sklearn evaluates splits on float32 inputs
+        X = np.atleast_2d(np.asarray(X, dtype=np.float32))
+        rows = np.arange(X.shape[0])[:, None]
+        node = np.broadcast_to(self.roots, (X.shape[0], self.n_trees))
+
+        for _ in range(self.depth):
+            go_left = X[rows, self.feature[node]] <= self.threshold[node]
+            node = np.where(go_left, self.left[node], self.right[node])
+
+        return self.value[node].mean(axis=1, dtype=np.float64)
+
+
 class MLSimulator:
     """ML-based match simulator using LaLiga data and trained models."""
     
-    def __init__(self):
+    def __init__(self, seed: Optional[int] = None):
         self.df = None
         self.elo = None
         self.model = None
+        self.predictor = None
         self.teams = []
-        self.team_stats = {}
+        self._team_index = {}  # team name -> row in _team_stats_np
+        self._team_stats_np = np.zeros(0, dtype=TEAM_STATS_DTYPE)
+        self._team_stats_dict = None  # (record array, team_stats dict built from it)
+        self._fixture_cache = {}  # (home, away) -> deterministic simulate_match inputs
+        # Single generator for all match sampling (seedable for tests)
+        self._rng = np.random.default_rng(seed)
+        self._data_path = os.path.join(ML_SANDBOX_DIR, 'data', 'LaLiga_24-25.csv')
         self._load_data()
-        self._build_elo()
-        self._train_model()
+        
+        if not self._load_cached_model():
+            self._calculate_team_stats()
+            self._build_elo()
+            self._train_model()
+            self._save_cached_model()
+    
+    def _cache_path(self) -> str:
+        """Model cache file, keyed on the CSV contents and training code version."""
+        digest = hashlib.sha1()
+        with open(self._data_path, 'rb') as f:
+            digest.update(f.read())
+        digest.update(f"{MODEL_CACHE_VERSION}:{sklearn.__version__}".encode())
+        return os.path.join(CACHE_DIR, f"mlsim_{digest.hexdigest()}.joblib")
+    
+    def _load_cached_model(self) -> bool:
+        """Restore ELO, team stats and the trained model from disk if cached."""
+        path = self._cache_path()
+        if not os.path.exists(path):
+            return False
+        
+        try:
+            cached = joblib.load(path)
+        except Exception as e:
+            print(f"[ML Simulator] Ignoring unreadable model cache: {e}")
+            return False
+        
+        self.elo = EloRating()
+        self.elo.ratings = cached['elo']
+        self._team_index = cached['team_index']
+        self._team_stats_np = cached['team_stats']
+        self.model = cached['model']
+        self.predictor = cached['predictor']
+        print(f"[ML Simulator] Loaded cached model from {path}")
+        return True
+    
+    def _save_cached_model(self):
+        """Persist everything derived from the CSV so later startups skip training."""
+        try:
+            os.makedirs(CACHE_DIR, exist_ok=True)
+            joblib.dump({
+                'elo': self.elo.ratings,
+                'team_index': self._team_index,
+                'team_stats': self._team_stats_np,
+                'model': self.model,
+                'predictor': self.predictor,
+            }, self._cache_path())
+        except OSError as e:
+            print(f"[ML Simulator] Could not write model cache: {e}")
     
     def _load_data(self):
         """Load LaLiga match data."""
-        data_path = os.path.join(ML_SANDBOX_DIR, 'data', 'LaLiga_24-25.csv')
+        data_path = self._data_path
         
         if not os.path.exists(data_path):
             raise FileNotFoundError(f"LaLiga data not found at {data_path}")
@@ -126,14 +261,30 @@ class MLSimulator:
         away_teams = set(self.df['AwayTeam'].unique())
         self.teams = sorted(list(home_teams | away_teams))
         
-        # Calculate team stats
-        self._calculate_team_stats()
-        
         print(f"[ML Simulator] Loaded {len(self.df)} matches, {len(self.teams)} teams")
     
+    @property
+    def team_stats(self) -> Dict[str, Dict[str, float]]:
+        """
+        Per-team averages as a dict of dicts, the form they used to be stored in.
+        
+        Built from the record array the first time it is read after the
+        stats are (re)computed or loaded, then shared; treat it as read-only.
+        """
+        cached = self._team_stats_dict
+        if cached is None or cached[0] is not self._team_stats_np:
+            names = TEAM_STATS_DTYPE.names
+            stats = {team: dict(zip(names, self._team_stats_np[i].tolist()))
+                     for team, i in self._team_index.items()}
+            cached = self._team_stats_dict = (self._team_stats_np, stats)
+        return cached[1]
+    
     def _calculate_team_stats(self):
         """Calculate average stats for each team."""
-        for team in self.teams:
+        self._team_index = {team: i for i, team in enumerate(self.teams)}
+        self._team_stats_np = np.zeros(len(self.teams), dtype=TEAM_STATS_DTYPE)
+        
+        for i, team in enumerate(self.teams):
             home_matches = self.df[self.df['HomeTeam'] == team]
             away_matches = self.df[self.df['AwayTeam'] == team]
             
@@ -154,26 +305,17 @@ class MLSimulator:
             # Shots
             avg_shots = (home_matches['HS'].mean() + away_matches['AS'].mean()) / 2 if total_matches > 0 else 10
             
-            self.team_stats[team] = {
-                'home_goals_avg': home_goals,
-                'away_goals_avg': away_goals,
-                'home_conceded_avg': home_conceded,
-                'away_conceded_avg': away_conceded,
-                'win_rate': win_rate,
-                'avg_shots': avg_shots
-            }
+            self._team_stats_np[i] = (home_goals, away_goals, home_conceded,
+                                      away_conceded, win_rate, avg_shots)
     
     def _build_elo(self):
         """Build ELO ratings from historical data."""
         self.elo = EloRating()
         
-        for _, match in self.df.iterrows():
-            self.elo.update(
-                match['HomeTeam'],
-                match['AwayTeam'],
-                match['FTHG'],
-                match['FTAG']
-            )
+        df = self.df
+        for home, away, fthg, ftag in zip(df['HomeTeam'].to_numpy(), df['AwayTeam'].to_numpy(),
+                                          df['FTHG'].to_numpy(), df['FTAG'].to_numpy()):
+            self.elo.update(home, away, fthg, ftag)
         
         print(f"[ML Simulator] Built ELO ratings for {len(self.elo.ratings)} teams")
     
@@ -184,185 +326,230 @@ class MLSimulator:
         
         temp_elo = EloRating()
         
-        for idx, row in self.df.iterrows():
+        # Missing match stats fall back to league-typical values
+        stat_defaults = {'HS': 10, 'AS': 10, 'HST': 4, 'AST': 4, 'HC': 5, 'AC': 5}
+        df = self.df
+        columns = [df['HomeTeam'], df['AwayTeam'], df['FTHG'], df['FTAG'], df['FTR']]
+        columns += [df[col].fillna(default) for col, default in stat_defaults.items()]
+        
+        for home, away, fthg, ftag, ftr, hs, as_, hst, ast, hc, ac in zip(
+                *(col.to_numpy() for col in columns)):
             # Get ELO before match
-            elo_diff = temp_elo.get_elo_diff(row['HomeTeam'], row['AwayTeam'])
+            elo_diff = temp_elo.get_elo_diff(home, away)
             
             # Features: elo_diff + match stats
-            features = [
-                elo_diff,
-                row['HS'] if pd.notna(row['HS']) else 10,
-                row['AS'] if pd.notna(row['AS']) else 10,
-                row['HST'] if pd.notna(row['HST']) else 4,
-                row['AST'] if pd.notna(row['AST']) else 4,
-                row['HC'] if pd.notna(row['HC']) else 5,
-                row['AC'] if pd.notna(row['AC']) else 5
-            ]
-            X.append(features)
+            X.append([elo_diff, hs, as_, hst, ast, hc, ac])
             
             # Target: home win = 1, otherwise = 0
-            y.append(1 if row['FTR'] == 'H' else 0)
+            y.append(1 if ftr == 'H' else 0)
             
             # Update ELO after match
-            temp_elo.update(row['HomeTeam'], row['AwayTeam'], row['FTHG'], row['FTAG'])
+            temp_elo.update(home, away, fthg, ftag)
         
-        X = np.array(X)
+        # float32 is what the trees split on internally anyway
+        X = np.array(X, dtype=np.float32)
         y = np.array(y)
         
-        # Train model
+        # Train model (380 rows: a small, shallow forest generalises as
+        # well as 200 deep trees at a fraction of the memory)
         self.model = RandomForestClassifier(
-            n_estimators=200,
-            max_depth=10,
+            n_estimators=50,
+            max_depth=6,
+            min_samples_leaf=5,
             class_weight='balanced',
             random_state=42,
             n_jobs=-1
         )
         self.model.fit(X, y)
+        self.predictor = CompiledForest(self.model)
         print(f"[ML Simulator] Trained RandomForest classifier")
     
     def get_teams(self) -> List[str]:
         """Return list of available teams."""
         return self.teams
     
-    def simulate_match(self, home_team: str, away_team: str) -> MLMatchResult:
-        """Simulate a match between two teams using ML predictions."""
-        
-        if home_team not in self.teams:
-            raise ValueError(f"Unknown team: {home_team}")
-        if away_team not in self.teams:
-            raise ValueError(f"Unknown team: {away_team}")
+    def _get_fixture(self, home_team: str, away_team: str) -> Dict:
+        """
+        Deterministic, per-fixture inputs to simulate_match.
+        
+        Everything here depends only on (home, away) - ELO, team averages,
+        expected goals, form - so it is computed once per fixture and
+        reused across repeated simulations. The model probabilities are
+        not cached since they depend on the sampled match stats.
+        """
+        key = (home_team, away_team)
+        fixture = self._fixture_cache.get(key)
+        if fixture is not None:
+            return fixture
         
         # Get ELO ratings
-        home_elo = self.elo.get_rating(home_team)
-        away_elo = self.elo.get_rating(away_team)
         elo_diff = self.elo.get_elo_diff(home_team, away_team)
         
         # Get team stats for average shots etc
-        home_stats = self.team_stats.get(home_team, {})
-        away_stats = self.team_stats.get(away_team, {})
-        
-        # Generate realistic match stats
-        home_shots = int(np.random.normal(home_stats.get('avg_shots', 12), 3))
-        away_shots = int(np.random.normal(away_stats.get('avg_shots', 10), 3))
-        home_shots_on_target = max(1, int(home_shots * random.uniform(0.3, 0.5)))
-        away_shots_on_target = max(1, int(away_shots * random.uniform(0.3, 0.5)))
-        home_corners = random.randint(3, 8)
-        away_corners = random.randint(3, 8)
-        
-        # Build feature vector for prediction
-        features = np.array([[
+        home_stats = self._team_stats_np[self._team_index[home_team]]
+        away_stats = self._team_stats_np[self._team_index[away_team]]
+        
+        # Simulate goals based on outcome and team strength
+        home_attack = home_stats['home_goals_avg']
+        away_attack = away_stats['away_goals_avg']
+        home_defense = home_stats['home_conceded_avg']
+        away_defense = away_stats['away_conceded_avg']
+        
+        # Expected goals
+        home_xg = (home_attack + away_defense) / 2 * (1 + elo_diff / 1000)
+        away_xg = (away_attack + home_defense) / 2 * (1 - elo_diff / 1000)
+        
+        fixture = {
+            'home_elo': self.elo.get_rating(home_team),
+            'away_elo': self.elo.get_rating(away_team),
+            'elo_diff': elo_diff,
+            'avg_shots': (home_stats['avg_shots'], away_stats['avg_shots']),
+            # Adjust for draws (simple heuristic based on ELO closeness)
+            'draw_prob': 0.25 * (1 - min(abs(elo_diff) / 400, 0.5)),
+            # Clamp xG
+            'xg': (max(0.5, min(home_xg, 4.0)), max(0.3, min(away_xg, 3.5))),
+            # Build form stats
+            'home_form': {
+                'goals_per_match': round(home_attack, 2),
+                'conceded_per_match': round(home_defense, 2),
+                'win_rate': f"{home_stats['win_rate']*100:.0f}%"
+            },
+            'away_form': {
+                'goals_per_match': round(away_attack, 2),
+                'conceded_per_match': round(away_defense, 2),
+                'win_rate': f"{away_stats['win_rate']*100:.0f}%"
+            },
+        }
+        self._fixture_cache[key] = fixture
+        return fixture
+    
+    def simulate_match(self, home_team: str, away_team: str) -> MLMatchResult:
+        """Simulate a match between two teams using ML predictions."""
+        return self.simulate_matches([(home_team, away_team)])[0]
+    
+    def simulate_matches(self, pairs: List[Tuple[str, str]]) -> List[MLMatchResult]:
+        """
+        Simulate many (home, away) fixtures at once, e.g. a full season.
+        
+        Match stats, model probabilities, outcomes and goals are sampled
+        for all fixtures as arrays with a single predict_proba call; only
+        the per-match event lists are built in Python.
+        """
+        for home_team, away_team in pairs:
+            if home_team not in self.teams:
+                raise ValueError(f"Unknown team: {home_team}")
+            if away_team not in self.teams:
+                raise ValueError(f"Unknown team: {away_team}")
+        
+        n = len(pairs)
+        if n == 0:
+            return []
+        
+        fixtures = [self._get_fixture(home_team, away_team) for home_team, away_team in pairs]
+        elo_diff = np.array([f['elo_diff'] for f in fixtures])
+        avg_shots = np.array([f['avg_shots'] for f in fixtures])
+        draw_base = np.array([f['draw_prob'] for f in fixtures])
+        xg = np.array([f['xg'] for f in fixtures])
+        
+        rng = self._rng
+        
+        # Generate realistic match stats (columns: home, away)
+        shots = rng.normal(avg_shots, 3).astype(int)
+        shots_on_target = np.maximum(1, (shots * rng.uniform(0.3, 0.5, (n, 2))).astype(int))
+        corners = rng.integers(3, 9, (n, 2))
+        
+        # Uniforms for outcome pick, winning margin and draw score
+        u = rng.random((n, 3))
+        
+        # Build feature matrix for prediction
+        features = np.column_stack([
             elo_diff,
-            home_shots,
-            away_shots,
-            home_shots_on_target,
-            away_shots_on_target,
-            home_corners,
-            away_corners
-        ]])
+            shots[:, 0],
+            shots[:, 1],
+            shots_on_target[:, 0],
+            shots_on_target[:, 1],
+            corners[:, 0],
+            corners[:, 1]
+        ])
         
         # Get prediction probabilities
-        proba = self.model.predict_proba(features)[0]
-        home_win_prob = proba[1] if len(proba) > 1 else 0.5
+        proba = self.predictor.predict_proba(features)
+        home_win_prob = proba[:, 1] if proba.shape[1] > 1 else np.full(n, 0.5)
         away_win_prob = 1 - home_win_prob
         
-        # Adjust for draws (simple heuristic based on ELO closeness)
-        elo_closeness = 1 - min(abs(elo_diff) / 400, 0.5)
-        draw_prob = 0.25 * elo_closeness
-        home_win_prob = home_win_prob * (1 - draw_prob)
-        away_win_prob = away_win_prob * (1 - draw_prob)
+        home_win_prob = home_win_prob * (1 - draw_base)
+        away_win_prob = away_win_prob * (1 - draw_base)
         
         # Normalize probabilities
-        total = home_win_prob + draw_prob + away_win_prob
-        home_win_prob /= total
-        draw_prob /= total  
-        away_win_prob /= total
+        total = home_win_prob + draw_base + away_win_prob
+        home_win_prob = home_win_prob / total
+        draw_prob = draw_base / total
+        away_win_prob = away_win_prob / total
         
         # Simulate actual result based on probabilities
-        rand = random.random()
-        if rand < home_win_prob:
-            predicted_outcome = 'H'
-        elif rand < home_win_prob + draw_prob:
-            predicted_outcome = 'D'
-        else:
-            predicted_outcome = 'A'
-        
-        # Simulate goals based on outcome and team strength
-        home_attack = home_stats.get('home_goals_avg', 1.5)
-        away_attack = away_stats.get('away_goals_avg', 1.0)
-        home_defense = home_stats.get('home_conceded_avg', 1.0)
-        away_defense = away_stats.get('away_conceded_avg', 1.5)
-        
-        # Expected goals
-        home_xg = (home_attack + away_defense) / 2 * (1 + elo_diff / 1000)
-        away_xg = (away_attack + home_defense) / 2 * (1 - elo_diff / 1000)
-        
-        # Clamp xG
-        home_xg = max(0.5, min(home_xg, 4.0))
-        away_xg = max(0.3, min(away_xg, 3.5))
+        home_win = u[:, 0] < home_win_prob
+        draw = ~home_win & (u[:, 0] < home_win_prob + draw_prob)
+        away_win = ~home_win & ~draw
         
         # Generate goals using Poisson distribution
-        home_goals = np.random.poisson(home_xg)
-        away_goals = np.random.poisson(away_xg)
+        goals = rng.poisson(xg)
+        home_goals, away_goals = goals[:, 0], goals[:, 1]
         
         # Adjust goals to match predicted outcome
-        if predicted_outcome == 'H' and home_goals <= away_goals:
-            home_goals = away_goals + random.randint(1, 2)
-        elif predicted_outcome == 'A' and away_goals <= home_goals:
-            away_goals = home_goals + random.randint(1, 2)
-        elif predicted_outcome == 'D':
-            home_goals = away_goals = random.choice([0, 1, 1, 2, 2])
+        margin = np.where(u[:, 1] < 0.5, 1, 2)
+        draw_goals = np.array([0, 1, 1, 2, 2])[(u[:, 2] * 5).astype(int)]
+        home_goals = np.where(home_win & (home_goals <= away_goals), away_goals + margin, home_goals)
+        away_goals = np.where(away_win & (away_goals <= home_goals), home_goals + margin, away_goals)
+        home_goals = np.where(draw, draw_goals, home_goals)
+        away_goals = np.where(draw, draw_goals, away_goals)
         
         # Cap goals
-        home_goals = min(home_goals, 6)
-        away_goals = min(away_goals, 6)
+        home_goals = np.minimum(home_goals, 6).tolist()
+        away_goals = np.minimum(away_goals, 6).tolist()
         
-        # Generate match events
-        events = self._generate_events(home_team, away_team, home_goals, away_goals)
+        outcomes = np.where(home_win, 'H', np.where(draw, 'D', 'A')).tolist()
         
-        # Build form stats
-        home_form = {
-            'goals_per_match': round(home_stats.get('home_goals_avg', 1.5), 2),
-            'conceded_per_match': round(home_stats.get('home_conceded_avg', 1.0), 2),
-            'win_rate': f"{home_stats.get('win_rate', 0.33)*100:.0f}%"
-        }
-        
-        away_form = {
-            'goals_per_match': round(away_stats.get('away_goals_avg', 1.0), 2),
-            'conceded_per_match': round(away_stats.get('away_conceded_avg', 1.5), 2),
-            'win_rate': f"{away_stats.get('win_rate', 0.33)*100:.0f}%"
-        }
+        results = []
+        for i, ((home_team, away_team), fixture) in enumerate(zip(pairs, fixtures)):
+            # Generate match events
+            events = self._generate_events(home_team, away_team, home_goals[i], away_goals[i])
+            
+            results.append(MLMatchResult(
+                home_team=home_team,
+                away_team=away_team,
+                home_elo=round(fixture['home_elo'], 1),
+                away_elo=round(fixture['away_elo'], 1),
+                elo_diff=round(fixture['elo_diff'], 1),
+                home_win_prob=round(float(home_win_prob[i]), 3),
+                draw_prob=round(float(draw_prob[i]), 3),
+                away_win_prob=round(float(away_win_prob[i]), 3),
+                predicted_outcome=outcomes[i],
+                home_goals=home_goals[i],
+                away_goals=away_goals[i],
+                events=events,
+                # Results get their own copies so callers can't mutate the cache
+                home_form=dict(fixture['home_form']),
+                away_form=dict(fixture['away_form'])
+            ))
         
-        return MLMatchResult(
-            home_team=home_team,
-            away_team=away_team,
-            home_elo=round(home_elo, 1),
-            away_elo=round(away_elo, 1),
-            elo_diff=round(elo_diff, 1),
-            home_win_prob=round(home_win_prob, 3),
-            draw_prob=round(draw_prob, 3),
-            away_win_prob=round(away_win_prob, 3),
-            predicted_outcome=predicted_outcome,
-            home_goals=home_goals,
-            away_goals=away_goals,
-            events=events,
-            home_form=home_form,
-            away_form=away_form
-        )
+        return results
     
     def _generate_events(self, home_team: str, away_team: str, 
                          home_goals: int, away_goals: int) -> List[MatchEvent]:
         """Generate realistic match events."""
         events = []
+        rng = self._rng
+        n_goals = home_goals + away_goals
         
         # Generate goal events
-        all_goal_minutes = sorted(random.sample(range(1, 91), home_goals + away_goals)
-                                  if home_goals + away_goals > 0 else [])
+        all_goal_minutes = np.sort(rng.choice(np.arange(1, 91), n_goals, replace=False)).tolist()
+        coin = rng.random(n_goals)
         
         home_goal_count = 0
         away_goal_count = 0
         
-        for minute in all_goal_minutes:
-            if home_goal_count < home_goals and (away_goal_count >= away_goals or random.random() < 0.5):
+        for i, minute in enumerate(all_goal_minutes):
+            if home_goal_count < home_goals and (away_goal_count >= away_goals or coin[i] < 0.5):
                 home_goal_count += 1
                 events.append(MatchEvent(
                     minute=minute,
@@ -380,9 +567,11 @@ class MLSimulator:
                 ))
         
         # Add some yellow cards
-        for _ in range(random.randint(1, 4)):
-            minute = random.randint(10, 85)
-            team = random.choice(['home', 'away'])
+        n_cards = int(rng.integers(1, 5))
+        card_minutes = rng.integers(10, 86, n_cards).tolist()
+        card_home = (rng.random(n_cards) < 0.5).tolist()
+        for minute, is_home in zip(card_minutes, card_home):
+            team = 'home' if is_home else 'away'
             team_name = home_team if team == 'home' else away_team
             events.append(MatchEvent(
                 minute=minute,
@@ -4,12 +4,16 @@ Handles menu, match simulation, and stats display
 """
 
 import os
+import functools
+import itertools
 import pygame
+import pygame.gfxdraw
+import numpy as np
 from typing import Optional, Tuple, Dict, List
 from enum import Enum
 
 from src.config import *
-from src.game_engine import GameState
+from src.game_engine import GameState, PlayerState
 
 # Import ML constraints if available
 try:
@@ -19,6 +23,153 @@ except ImportError:
     MODE_REPLAY = "replay"
     MODE_ML = "ml"
 
+# Older configs don't define a dropdown border colour
+try:
+    from src.config import DROPDOWN_BORDER
+except ImportError:
+    DROPDOWN_BORDER = (70, 75, 95)
+
+
+# Player token colours
+PLAYER_SHADOW_COLOR = (20, 20, 25)
+TEAM_A_HIGHLIGHT = tuple(min(255, c + 50) for c in TEAM_A_COLOR)
+TEAM_B_HIGHLIGHT = tuple(min(255, c + 50) for c in TEAM_B_COLOR)
+TEAM_HIGHLIGHTS = {TEAM_A_COLOR: TEAM_A_HIGHLIGHT, TEAM_B_COLOR: TEAM_B_HIGHLIGHT}
+# Golden possession glow rings as (radius, colour), outermost first
+POSSESSION_GLOW_RINGS = tuple(
+    (r, (255, min(255, 215 + int(80 * (1 - (r - PLAYER_RADIUS - 2) / 6)) // 4), 50))
+    for r in range(PLAYER_RADIUS + 8, PLAYER_RADIUS + 2, -2)
+)
+# Ball glow rings as (radius, colour), outermost first
+BALL_GLOW_RINGS = (
+    (BALL_RADIUS + 3, (255, 255, 255)),
+    (BALL_RADIUS + 2, (255, 255, 240)),
+    (BALL_RADIUS + 1, (255, 255, 200)),
+)
+
+
+# Screen regions for dirty-rect updates in the simulation view
+SIDEBAR_RECT = pygame.Rect(0, 0, SIDEBAR_WIDTH, SCREEN_HEIGHT)
+TOP_BAR_RECT = pygame.Rect(SIDEBAR_WIDTH, 0, PITCH_WIDTH_PX, 100)
+MATCH_INFO_LINE_HEIGHT = 30
+STATS_PANEL_RECT = pygame.Rect(SIDEBAR_WIDTH + PITCH_WIDTH_PX, 0, STATS_PANEL_WIDTH, SCREEN_HEIGHT)
+CONTROLS_RECT = pygame.Rect(SIDEBAR_WIDTH, SCREEN_HEIGHT - 80, PITCH_WIDTH_PX, 80)
+# Part of the pitch not covered by the top bar / controls; sprites are clipped to it
+PITCH_VIEW_RECT = pygame.Rect(SIDEBAR_WIDTH, 100, PITCH_WIDTH_PX, SCREEN_HEIGHT - 180)
+# Half-extent of everything drawn around a player / ball centre (glow, shadow, rings)
+PLAYER_SPRITE_HALF = PLAYER_RADIUS + 9
+BALL_SPRITE_HALF = BALL_RADIUS + 4
+PLAYER_HIT_RADIUS = PLAYER_RADIUS + 5  # click tolerance around a player's centre
+
+# Player stats panel rows (values come from the player's 'stats' dict in
+# the same order) and the y of the line above them
+PLAYER_STAT_LABELS = ("Touches", "Passes", "Pass Acc.", "Shots", "Goals",
+                      "Shot Acc.", "Dribbles", "Tackles", "Interceptions")
+STATS_SEPARATOR_Y = 200
+STAT_ROW_YS = tuple(STATS_SEPARATOR_Y + 30 + i * 35 for i in range(len(PLAYER_STAT_LABELS)))
+
+# The seek bar spans 0-125 mins, enough for extra time in either engine
+SEEK_BAR_SECONDS = 7500.0
+
+# Step labels above each mode's menu controls, as (text, y)
+MENU_STEP_LABELS = {
+    MODE_REPLAY: (("1. Competition", 240), ("2. Season", 300), ("3. Teams", 370)),
+    MODE_ML: (("Competition (La Liga)", 240), ("Season", 300), ("Teams", 370)),
+}
+
+# ML prediction outcome badge text and colours, by MLMatchResult.predicted_outcome
+OUTCOME_LABELS = {'H': 'HOME WIN', 'D': 'DRAW', 'A': 'AWAY WIN'}
+OUTCOME_COLORS = {'H': (100, 255, 100), 'D': (255, 255, 100), 'A': (255, 100, 100)}
+OUTCOME_BADGE_COLORS = {'H': (100, 200, 100), 'D': (200, 200, 100), 'A': (200, 100, 100)}  # results screen
+# Win-probability rows as (label, MLMatchResult attribute, bar colour)
+PROB_SLOTS = (
+    ("Home", "home_win_prob", TEAM_A_COLOR),
+    ("Draw", "draw_prob", (200, 200, 100)),
+    ("Away", "away_win_prob", TEAM_B_COLOR),
+)
+
+
+@functools.lru_cache(maxsize=32)
+def get_font(size: int, path: Optional[str] = None) -> pygame.font.Font:
+    """
+    Shared Font per (size, path); path None is pygame's default font.
+    Each Font() opens the TTF again, and the text cache below is keyed
+    by font object, so everything asking for the same font gets one.
+    """
+    return pygame.font.Font(path, size)
+
+
+# Rendered text surfaces keyed by (font, text, color). Most UI strings are
+# static or change rarely, so re-rasterizing them every frame is wasted work.
+TEXT_CACHE_SIZE = 512
+TEXT_CACHE_SWEEP_FRAMES = 600  # frames between evictions of unused entries
+_TEXT_CACHE: Dict[tuple, pygame.Surface] = {}
+_TEXT_SEEN: set = set()  # keys requested since the last sweep
+
+
+def render_cached(font, text: str, color) -> pygame.Surface:
+    """Antialiased font.render() with a bounded (FIFO) surface cache."""
+    key = (font, text, color)
+    _TEXT_SEEN.add(key)
+    surface = _TEXT_CACHE.get(key)
+    if surface is None:
+        surface = font.render(text, True, color)
+        if pygame.display.get_surface() is not None:
+            # Match the display's pixel layout so blits take the fast path
+            surface = surface.convert_alpha()
+        if len(_TEXT_CACHE) >= TEXT_CACHE_SIZE:
+            # Dicts keep insertion order: drop the oldest entry
+            del _TEXT_CACHE[next(iter(_TEXT_CACHE))]
+        _TEXT_CACHE[key] = surface
+    return surface
+
+
+def sweep_text_cache():
+    """Drop cached text not requested since the previous sweep."""
+    for key in [key for key in _TEXT_CACHE if key not in _TEXT_SEEN]:
+        del _TEXT_CACHE[key]
+    _TEXT_SEEN.clear()
+
+
+# Event types this UI never handles; blocked so SDL doesn't queue them at all
+UNUSED_EVENT_TYPES = [
+    pygame.AUDIODEVICEADDED, pygame.AUDIODEVICEREMOVED,
+    pygame.TEXTINPUT, pygame.TEXTEDITING,
+    pygame.JOYAXISMOTION, pygame.JOYBALLMOTION, pygame.JOYHATMOTION,
+    pygame.JOYBUTTONDOWN, pygame.JOYBUTTONUP,
+    pygame.JOYDEVICEADDED, pygame.JOYDEVICEREMOVED,
+    pygame.CONTROLLERAXISMOTION, pygame.CONTROLLERBUTTONDOWN, pygame.CONTROLLERBUTTONUP,
+    pygame.CONTROLLERDEVICEADDED, pygame.CONTROLLERDEVICEREMOVED, pygame.CONTROLLERDEVICEREMAPPED,
+    pygame.FINGERDOWN, pygame.FINGERUP, pygame.FINGERMOTION, pygame.MULTIGESTURE,
+    pygame.DROPFILE, pygame.DROPTEXT, pygame.DROPBEGIN, pygame.DROPCOMPLETE,
+    pygame.KEYMAPCHANGED, pygame.CLIPBOARDUPDATE,
+]
+
+
+# Event types each widget kind reacts to (see their handle_event methods),
+# so handlers can skip widgets an event can't affect
+BUTTON_EVENT_TYPES = frozenset((pygame.MOUSEMOTION, pygame.MOUSEBUTTONDOWN))
+DROPDOWN_EVENT_TYPES = BUTTON_EVENT_TYPES | {pygame.MOUSEWHEEL}
+SEEK_BAR_EVENT_TYPES = BUTTON_EVENT_TYPES | {pygame.MOUSEBUTTONUP}
+
+
+def coalesce_motion(events: List[pygame.event.Event]) -> List[pygame.event.Event]:
+    """
+    Collapse each run of consecutive MOUSEMOTION events to its last one.
+    
+    Widgets only care about the latest pointer position (hover, drag),
+    so a high-rate mouse shouldn't cost one dispatch per motion event.
+    Motion is only merged up to the next other event, so e.g. a seek-bar
+    drag still sees where the pointer was when the button came up.
+    """
+    coalesced = []
+    for event in events:
+        if event.type == pygame.MOUSEMOTION and coalesced and coalesced[-1].type == pygame.MOUSEMOTION:
+            coalesced[-1] = event
+        else:
+            coalesced.append(event)
+    return coalesced
+
 
 class UIState(Enum):
     """Application UI states."""
@@ -31,7 +182,7 @@ class Button:
     """Enhanced button class with rounded corners and visual effects."""
     
     def __init__(self, x: int, y: int, width: int, height: int, text: str, font, 
-                 color=None, hover_color=None, text_color=None, border_radius=8):
+                 color=None, hover_color=None, text_color=None, border_radius=8, active_color=None):
         self.rect = pygame.Rect(x, y, width, height)
         self.text = text
         self.font = font
@@ -42,33 +193,54 @@ class Button:
         self.color = color or BUTTON_BG
         self.hover_color = hover_color or BUTTON_HOVER
         self.text_color = text_color or TEXT_WHITE
+        self.active_color = active_color or BUTTON_ACTIVE
+        
+        # Pre-rendered faces (shadow, body, border and label) per
+        # (background colour, text), so the derived border colour is computed
+        # once per face, not per draw. Idle and hover faces for the initial
+        # label are baked here so the first hover doesn't build one mid-frame;
+        # the rest are built on first draw in each state.
+        self._faces: Dict[tuple, pygame.Surface] = {
+            (bg_color, text): self._build_face(bg_color, text)
+            for bg_color in (self.color, self.hover_color)
+        }
     
-    def draw(self, screen, active=False):
-        """Draw the button with rounded corners and effects."""
-        # Determine background color
-        if active:
-            bg_color = BUTTON_ACTIVE if hasattr(self, 'active_color') is False else self.active_color
-        elif self.hovered:
-            bg_color = self.hover_color
-        else:
-            bg_color = self.color
+    def _build_face(self, bg_color, text: str) -> pygame.Surface:
+        """Draw the whole button, shadow included, onto its own surface."""
+        body = pygame.Rect(0, 0, self.rect.width, self.rect.height)
+        face = pygame.Surface((body.width + 2, body.height + 2), pygame.SRCALPHA)
         
         # Draw shadow (offset rectangle)
-        shadow_rect = self.rect.move(2, 2)
         shadow_color = (15, 15, 20)
-        pygame.draw.rect(screen, shadow_color, shadow_rect, border_radius=self.border_radius)
+        pygame.draw.rect(face, shadow_color, body.move(2, 2), border_radius=self.border_radius)
         
         # Draw main button
-        pygame.draw.rect(screen, bg_color, self.rect, border_radius=self.border_radius)
+        pygame.draw.rect(face, bg_color, body, border_radius=self.border_radius)
         
         # Draw subtle border
         border_color = tuple(min(255, c + 30) for c in bg_color)
-        pygame.draw.rect(screen, border_color, self.rect, width=1, border_radius=self.border_radius)
+        pygame.draw.rect(face, border_color, body, width=1, border_radius=self.border_radius)
         
         # Draw text
-        text_surface = self.font.render(self.text, True, self.text_color)
-        text_rect = text_surface.get_rect(center=self.rect.center)
-        screen.blit(text_surface, text_rect)
+        text_surface = render_cached(self.font, text, self.text_color)
+        face.blit(text_surface, text_surface.get_rect(center=body.center))
+        
+        if pygame.display.get_surface() is not None:
+            face = face.convert_alpha()
+        return face
+    
+    def draw(self, screen, active=False):
+        """Draw the button with rounded corners and effects."""
+        bg_color = self.active_color if active else (self.hover_color if self.hovered else self.color)
+        key = (bg_color, self.text)
+        face = self._faces.get(key)
+        if face is None:
+            face = self._faces[key] = self._build_face(bg_color, self.text)
+        screen.blit(face, self.rect.topleft)
+    
+    def visual_state(self) -> tuple:
+        """Everything draw() depends on besides the `active` flag."""
+        return (self.hovered, self.text)
     
     def handle_event(self, event) -> bool:
         """Handle mouse events. Returns True if clicked."""
@@ -85,7 +257,6 @@ class Dropdown:
     
     def __init__(self, x: int, y: int, width: int, height: int, options: List[str], font, default_text: str = "Select..."):
         self.rect = pygame.Rect(x, y, width, height)
-        self.options = options
         self.font = font
         self.default_text = default_text
         self.selected_index = -1
@@ -94,6 +265,53 @@ class Dropdown:
         self.enabled = True 
         self.scroll_offset = 0
         self.max_visible = 6  # Reduced to fit screen better with teams
+        
+        # Option-list hit-test bounds (the dropdown never moves)
+        self._list_left = self.rect.x
+        self._list_right = self.rect.right
+        self._list_top = self.rect.bottom
+        self._row_height = height
+        # Everything handle_event() can hit: the box and its fully open list
+        self.hit_area = self.rect.union(
+            pygame.Rect(x, self._list_top, width, self.max_visible * height))
+        
+        # Row rects of the open list
+        self._option_rects = [
+            pygame.Rect(x + 4, self.rect.bottom + 4 + i * (height - 2), width - 8, height - 4)
+            for i in range(self.max_visible)
+        ]
+        
+        # Pre-rendered rounded boxes (button, list container, row highlights);
+        # see _face()
+        self._faces: Dict[tuple, pygame.Surface] = {}
+        
+        self.options = options
+    
+    @property
+    def options(self) -> List[str]:
+        return self._options
+    
+    @options.setter
+    def options(self, options: List[str]):
+        """Replace the option list and recompute what draw() derives from it."""
+        self._options = options
+        # Rendered text owned by this widget: (text, color) -> surface.
+        # Dropped with the option list it was rendered for.
+        self._text_cache: Dict[Tuple[str, tuple], pygame.Surface] = {}
+        # Option texts cut to fit the list width
+        self._option_labels = [option if len(option) < 22 else option[:19] + "..."
+                               for option in options]
+        self._label_width = max((self.font.size(label)[0] for label in self._option_labels), default=0)
+        # Per option: (normal, selected) label surfaces, rendered on first show
+        self._option_surfaces: List[Optional[Tuple[pygame.Surface, pygame.Surface]]] = [None] * len(options)
+        
+        # Scroll bar geometry (only drawn when the list overflows, i.e. a full
+        # page of max_visible rows is showing)
+        track_height = self.max_visible * self.rect.height - 8
+        self._bar_height = max(20, track_height * (self.max_visible / max(1, len(options))))
+        self._scroll_span = track_height - self._bar_height
+        self._scroll_steps = max(1, len(options) - self.max_visible)
+        self._scroll_rect = pygame.Rect(self.rect.right - 8, 0, 4, self._bar_height)  # y set per draw
     
     @property
     def selected(self) -> Optional[str]:
@@ -102,6 +320,11 @@ class Dropdown:
             return self.options[self.selected_index]
         return None
     
+    def visual_state(self) -> tuple:
+        """Everything draw() depends on (options compared by identity first)."""
+        return (self.options, self.selected_index, self.is_open, self.hovered_option,
+                self.scroll_offset, self.enabled)
+    
     def draw(self, screen):
         """Draw the dropdown with modern styling."""
         # Determine if disabled
@@ -117,73 +340,119 @@ class Dropdown:
             border_color = HIGHLIGHT_YELLOW
         else:
             color = DROPDOWN_BG
-            border_color = DROPDOWN_BORDER if hasattr(__import__('src.config', fromlist=['DROPDOWN_BORDER']), 'DROPDOWN_BORDER') else (70, 75, 95)
-        
-        # Draw shadow
-        shadow_rect = self.rect.move(2, 2)
-        pygame.draw.rect(screen, (15, 15, 20), shadow_rect, border_radius=border_radius)
+            border_color = DROPDOWN_BORDER
         
-        # Draw main dropdown button
-        pygame.draw.rect(screen, color, self.rect, border_radius=border_radius)
-        pygame.draw.rect(screen, border_color if not is_disabled else (40, 42, 50), self.rect, 1, border_radius=border_radius)
+        # Main dropdown button with its shadow
+        button_border = border_color if not is_disabled else (40, 42, 50)
+        screen.blit(self._face(self.rect.size, color, button_border, (15, 15, 20), border_radius),
+                    self.rect.topleft)
         
         # Text
         text = self.selected or self.default_text
         text_color = TEXT_DARK_GRAY if is_disabled else TEXT_WHITE
-        text_surface = self.font.render(text, True, text_color)
+        text_surface = self._render_cached(text, text_color)
         screen.blit(text_surface, (self.rect.x + 12, self.rect.y + 11))
         
         # Arrow with highlight
         if not is_disabled:
             arrow = "▼" if not self.is_open else "▲"
             arrow_color = HIGHLIGHT_YELLOW if self.is_open else TEXT_GRAY
-            arrow_surface = self.font.render(arrow, True, arrow_color)
+            arrow_surface = self._render_cached(arrow, arrow_color)
             screen.blit(arrow_surface, (self.rect.right - 26, self.rect.y + 11))
         
         # Options (if open)
         if self.is_open and self.options:
-            visible_options = self.options[self.scroll_offset : self.scroll_offset + self.max_visible]
+            labels = self._option_labels
+            visible_count = max(0, min(self.max_visible, len(labels) - self.scroll_offset))
             
-            # Draw dropdown container shadow
-            container_height = len(visible_options) * self.rect.height
-            container_rect = pygame.Rect(self.rect.x, self.rect.bottom + 2, self.rect.width, container_height)
-            shadow_container = container_rect.move(2, 2)
-            pygame.draw.rect(screen, (10, 10, 15), shadow_container, border_radius=6)
-            pygame.draw.rect(screen, DROPDOWN_BG, container_rect, border_radius=6)
-            pygame.draw.rect(screen, border_color, container_rect, 1, border_radius=6)
+            # Dropdown container with its shadow
+            container_size = (self.rect.width, visible_count * self.rect.height)
+            screen.blit(self._face(container_size, DROPDOWN_BG, border_color, (10, 10, 15), 6),
+                        (self.rect.x, self.rect.bottom + 2))
             
-            for i, option in enumerate(visible_options):
-                # Calculate rect relative to scroll window
-                option_rect = pygame.Rect(
-                    self.rect.x + 4,
-                    self.rect.bottom + 4 + i * (self.rect.height - 2),
-                    self.rect.width - 8,
-                    self.rect.height - 4
-                )
+            row_size = self._option_rects[0].size
+            for i in range(visible_count):
+                option_rect = self._option_rects[i]
                 
                 # Background based on state
                 option_index = self.scroll_offset + i
                 if option_index == self.hovered_option:
-                    pygame.draw.rect(screen, BUTTON_HOVER, option_rect, border_radius=4)
+                    screen.blit(self._face(row_size, BUTTON_HOVER, None, None, 4), option_rect.topleft)
                 elif option_index == self.selected_index:
-                    pygame.draw.rect(screen, (50, 55, 75), option_rect, border_radius=4)
+                    screen.blit(self._face(row_size, (50, 55, 75), None, None, 4), option_rect.topleft)
                 
-                # Text (truncate if too long)
-                option_text = option if len(option) < 22 else option[:19] + "..."
-                text_col = HIGHLIGHT_YELLOW if option_index == self.selected_index else TEXT_WHITE
-                option_surface = self.font.render(option_text, True, text_col)
+                surfaces = self._option_surfaces[option_index]
+                if surfaces is None:
+                    option_text = labels[option_index]
+                    surfaces = self._option_surfaces[option_index] = (
+                        self._render_cached(option_text, TEXT_WHITE),
+                        self._render_cached(option_text, HIGHLIGHT_YELLOW))
+                option_surface = surfaces[option_index == self.selected_index]
                 screen.blit(option_surface, (option_rect.x + 8, option_rect.y + 6))
             
             # Scroll indicator (modern pill style)
             if len(self.options) > self.max_visible:
-                track_height = container_height - 8
-                bar_height = max(20, track_height * (self.max_visible / len(self.options)))
-                scroll_ratio = self.scroll_offset / max(1, (len(self.options) - self.max_visible))
-                bar_y = self.rect.bottom + 6 + scroll_ratio * (track_height - bar_height)
-                
-                scrollbar_rect = pygame.Rect(self.rect.right - 8, bar_y, 4, bar_height)
+                bar_y = self.rect.bottom + 6 + self.scroll_offset / self._scroll_steps * self._scroll_span
+                scrollbar_rect = self._scroll_rect
+                scrollbar_rect.y = int(bar_y)  # truncate, as Rect() does
                 pygame.draw.rect(screen, (80, 85, 100), scrollbar_rect, border_radius=2)
     
+    def bounds(self) -> pygame.Rect:
+        """
+        Screen area draw() paints in the current state: shadows included,
+        and labels too wide for the box, which are drawn past its edge.
+        """
+        area = pygame.Rect(self.rect.topleft, (self.rect.width + 2, self.rect.height + 2))
+        text_width = self.font.size(self.selected or self.default_text)[0]
+        area.union_ip(pygame.Rect(self.rect.x + 12, self.rect.y, text_width, self.rect.height))
+        if self.is_open and self.options:
+            visible_count = max(0, min(self.max_visible, len(self.options) - self.scroll_offset))
+            container = pygame.Rect(self.rect.x, self.rect.bottom + 2,
+                                    self.rect.width + 2, visible_count * self.rect.height + 2)
+            area.union_ip(container)
+            area.union_ip(pygame.Rect(self.rect.x + 12, container.y, self._label_width, container.height))
+        return area
+    
+    def _face(self, size, color, border_color, shadow_color, border_radius: int) -> pygame.Surface:
+        """
+        Rounded box of the given size (shadow offset by 2px, body, 1px
+        border), drawn once per combination and then just blitted.
+        """
+        key = (size, color, border_color, shadow_color, border_radius)
+        face = self._faces.get(key)
+        if face is None:
+            body = pygame.Rect((0, 0), size)
+            face = pygame.Surface((body.width + 2, body.height + 2), pygame.SRCALPHA)
+            if shadow_color:
+                pygame.draw.rect(face, shadow_color, body.move(2, 2), border_radius=border_radius)
+            pygame.draw.rect(face, color, body, border_radius=border_radius)
+            if border_color:
+                pygame.draw.rect(face, border_color, body, 1, border_radius=border_radius)
+            if pygame.display.get_surface() is not None:
+                face = face.convert_alpha()
+            self._faces[key] = face
+        return face
+    
+    def _render_cached(self, text: str, color) -> pygame.Surface:
+        """
+        Label surface from this widget's own cache. Long team lists would
+        otherwise churn the shared FIFO text cache while scrolling.
+        """
+        key = (text, color)
+        surface = self._text_cache.get(key)
+        if surface is None:
+            surface = self._text_cache[key] = render_cached(self.font, text, color)
+        return surface
+    
+    def _option_at(self, pos) -> int:
+        """Row under pos within the open option list, or -1 if outside it."""
+        x, y = pos
+        dy = y - self._list_top
+        if dy < 0 or not self._list_left <= x < self._list_right:
+            return -1
+        row = dy // self._row_height
+        return row if row < len(self.options) and row < self.max_visible else -1
+    
     def handle_event(self, event) -> bool:
         """Handle events. Returns True if selection changed."""
         # Don't handle events if disabled
@@ -203,14 +472,9 @@ class Dropdown:
             
             # Check options
             if self.is_open:
-                # Calculate visible area rect
-                visible_height = min(len(self.options), self.max_visible) * self.rect.height
-                dropdown_area = pygame.Rect(self.rect.x, self.rect.bottom, self.rect.width, visible_height)
-                
-                if dropdown_area.collidepoint(event.pos):
-                    # Find which index was clicked
-                    relative_y = event.pos[1] - self.rect.bottom
-                    click_index = int(relative_y // self.rect.height)
+                # Find which index was clicked
+                click_index = self._option_at(event.pos)
+                if click_index >= 0:
                     actual_index = self.scroll_offset + click_index
                     
                     if 0 <= actual_index < len(self.options):
@@ -222,13 +486,8 @@ class Dropdown:
                 self.is_open = False
         
         elif event.type == pygame.MOUSEMOTION and self.is_open:
-             # Calculate visible area rect
-            visible_height = min(len(self.options), self.max_visible) * self.rect.height
-            dropdown_area = pygame.Rect(self.rect.x, self.rect.bottom, self.rect.width, visible_height)
-            
-            if dropdown_area.collidepoint(event.pos):
-                relative_y = event.pos[1] - self.rect.bottom
-                hover_index = int(relative_y // self.rect.height)
+            hover_index = self._option_at(event.pos)
+            if hover_index >= 0:
                 self.hovered_option = self.scroll_offset + hover_index
             else:
                 self.hovered_option = -1
@@ -243,41 +502,68 @@ class SeekBar:
         self.rect = pygame.Rect(x, y, width, height)
         self.hovered = False
         self.dragging = False
+        # Hit areas are a little larger than the track; the bar never moves
+        self._hover_rect = self.rect.inflate(10, 10)
+        self._grab_rect = self.rect.inflate(10, 15)
+        self.hit_area = self._hover_rect.union(self._grab_rect)
+        self._inv_width = 1.0 / width  # pointer x -> progress without a division
+        self._fill_rect = pygame.Rect(self.rect)  # width set per draw
+        
+        # Pre-rendered track and knob (plain, and ringed while hovered or
+        # dragged); only the progress fill is drawn per frame
+        track = pygame.Surface(self.rect.size, pygame.SRCALPHA)
+        pygame.draw.rect(track, (40, 40, 50), track.get_rect(), border_radius=4)
+        pygame.draw.rect(track, TEXT_GRAY, track.get_rect(), 1, border_radius=4)
+        knob = pygame.Surface((21, 21), pygame.SRCALPHA)
+        pygame.draw.circle(knob, TEXT_WHITE, (10, 10), 8)
+        ringed_knob = knob.copy()
+        pygame.draw.circle(ringed_knob, SELECTED_RING, (10, 10), 10, 2)
+        if pygame.display.get_surface() is not None:
+            track, knob, ringed_knob = (surface.convert_alpha() for surface in (track, knob, ringed_knob))
+        self._track = track
+        self._knobs = (knob, ringed_knob)
+    
+    def visual_state(self) -> tuple:
+        """Everything draw() depends on besides the progress value."""
+        return (self.hovered, self.dragging)
+    
+    def fill_width(self, progress: float) -> int:
+        """Pixels of the track filled at this progress; draw() only changes with it."""
+        return int(self.rect.width * progress)
     
     def draw(self, screen, progress: float):
         """Draw seek bar with current progress (0.0 to 1.0)."""
         # Background track
-        pygame.draw.rect(screen, (40, 40, 50), self.rect, border_radius=4)
-        pygame.draw.rect(screen, TEXT_GRAY, self.rect, 1, border_radius=4)
+        screen.blit(self._track, self.rect.topleft)
         
         # Progress fill
-        fill_width = int(self.rect.width * progress)
+        fill_width = self.fill_width(progress)
         if fill_width > 0:
-            fill_rect = pygame.Rect(self.rect.x, self.rect.y, fill_width, self.rect.height)
+            fill_rect = self._fill_rect
+            fill_rect.width = fill_width
             pygame.draw.rect(screen, HIGHLIGHT_YELLOW, fill_rect, border_radius=4)
             
         # Handle knob (circle at end of progress)
         knob_x = self.rect.x + fill_width
-        pygame.draw.circle(screen, TEXT_WHITE, (knob_x, self.rect.centery), 8)
-        if self.hovered or self.dragging:
-            pygame.draw.circle(screen, SELECTED_RING, (knob_x, self.rect.centery), 10, 2)
+        knob = self._knobs[self.hovered or self.dragging]
+        screen.blit(knob, (knob_x - 10, self.rect.centery - 10))
 
     def handle_event(self, event) -> Optional[float]:
         """
         Handle mouse events. Returns new progress (0.0-1.0) if changed, else None.
         """
         if event.type == pygame.MOUSEMOTION:
-            self.hovered = self.rect.collidepoint(event.pos) or self.rect.inflate(10, 10).collidepoint(event.pos)
+            self.hovered = self._hover_rect.collidepoint(event.pos)
             if self.dragging:
                 # Clamp x to bar range
                 x = max(self.rect.left, min(event.pos[0], self.rect.right))
-                return (x - self.rect.left) / self.rect.width
+                return (x - self.rect.left) * self._inv_width
                 
         elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
-            if self.rect.inflate(10, 15).collidepoint(event.pos):
+            if self._grab_rect.collidepoint(event.pos):
                 self.dragging = True
                 x = max(self.rect.left, min(event.pos[0], self.rect.right))
-                return (x - self.rect.left) / self.rect.width
+                return (x - self.rect.left) * self._inv_width
                 
         elif event.type == pygame.MOUSEBUTTONUP and event.button == 1:
             self.dragging = False
@@ -294,15 +580,40 @@ class PitchRenderer:
         self.surface = pygame.Surface((width, height))
         self.texture = None
         
+        # StatsBomb -> pixel transform (pitch-local and screen-space offsets)
+        self.padding = 30
+        self._sx = (width - 2 * self.padding) / PITCH_LENGTH
+        self._sy = (height - 2 * self.padding) / PITCH_WIDTH_STAT
+        # Screen space: px = x * sx + ox, py = y * sy + oy
+        ox = float(self.padding + SIDEBAR_WIDTH)
+        oy = float(self.padding + 100)
+        self._screen_transform = (self._sx, ox, self._sy, oy)
+        self._screen_scale = np.array([self._sx, self._sy])
+        self._screen_offset = np.array([ox, oy])
+        
         # Try loading texture
         if os.path.exists("assets/pitch_texture.png"):
             try:
                 self.texture = pygame.image.load("assets/pitch_texture.png")
                 self.texture = pygame.transform.scale(self.texture, (width, height))
+                if pygame.display.get_surface() is not None:
+                    # Convert before baking so the one blit below is a plain copy
+                    self.texture = self.texture.convert()
             except Exception as e:
                 print(f"Could not load pitch texture: {e}")
                 
         self._draw_pitch()
+        
+        # Match the display pixel format so the per-frame blits are plain
+        # copies; retried lazily if the display isn't set up yet
+        self._converted = self._convert_to_display()
+    
+    def _convert_to_display(self) -> bool:
+        """Convert the baked pitch surface to the display format, if possible."""
+        if pygame.display.get_surface() is None:
+            return False
+        self.surface = self.surface.convert()
+        return True
     
     def _draw_pitch(self):
         """Draw the pitch with all markings."""
@@ -310,10 +621,8 @@ class PitchRenderer:
         if self.texture:
             self.surface.blit(self.texture, (0, 0))
             return
-
-        self.surface.fill(PITCH_GREEN)
         
-        padding = 30
+        padding = self.padding
         pitch_x = padding
         pitch_y = padding
         pitch_w = self.width - 2 * padding
@@ -367,14 +676,21 @@ class PitchRenderer:
         pygame.draw.circle(self.surface, LINE_WHITE, (penalty_spot_x_right, center_y), 4)
     
     def get_surface(self):
+        if not self._converted:
+            self._converted = self._convert_to_display()
         return self.surface
     
     def statsbomb_to_pixels(self, x: float, y: float) -> Tuple[int, int]:
         """Convert StatsBomb coordinates to pixels."""
-        padding = 30
-        pixel_x = padding + (x / PITCH_LENGTH) * (self.width - 2 * padding)
-        pixel_y = padding + (y / PITCH_WIDTH_STAT) * (self.height - 2 * padding)
-        return (int(pixel_x), int(pixel_y))
+        return (int(self.padding + x * self._sx), int(self.padding + y * self._sy))
+    
+    def screen_transform(self) -> Tuple[float, float, float, float]:
+        """(sx, ox, sy, oy) of the StatsBomb -> screen pixel affine map, for inlining."""
+        return self._screen_transform
+    
+    def statsbomb_to_screen(self, coords: np.ndarray) -> np.ndarray:
+        """Convert an (N, 2) array of StatsBomb coordinates to screen pixels."""
+        return (coords * self._screen_scale + self._screen_offset).astype(np.int32)
 
 
 class Renderer:
@@ -382,20 +698,65 @@ class Renderer:
     
     def __init__(self, screen: pygame.Surface):
         self.screen = screen
-        self.state = UIState.MENU
-        
-        # Fonts
+        self.set_state(UIState.MENU)
+        
+        pygame.event.set_blocked(UNUSED_EVENT_TYPES)
+        
+        # Dirty-rect tracking: regions changed by the last render() call,
+        # meant for pygame.display.update(renderer.dirty_rects)
+        self.dirty_rects: List[pygame.Rect] = []
+        self._full_redraw = True
+        self._rendered_state = None
+        self._sprite_rects: List[pygame.Rect] = []  # player/ball regions drawn last frame
+        self._panel_sigs: Dict[str, tuple] = {}  # region name -> state it was last drawn with
+        self._frame_game_state = None  # GameState of the last simulation frame (held: ids get reused)
+        self._stats_panel_info = None  # player_info the stats panel was last drawn from (held likewise)
+        self._bg_menu: Dict[Optional[str], pygame.Surface] = {}  # menu mode -> static backdrop
+        self._bg_simulation = None  # pitch + panel chrome, built per simulation
+        self._match_info_rect = pygame.Rect(0, 0, 0, 0)  # sidebar match-info lines (the only live sidebar text)
+        self._label_surfs: Dict[str, Tuple[str, pygame.Surface]] = {}  # slot -> (text, surface)
+        self._clock: Tuple[int, str] = (-1, '')  # (match second, its MM:SS text)
+        self._player_tokens: Dict[tuple, pygame.Surface] = {}  # (color, has_ball, selected) -> token
+        self._instruction_blits: Dict[tuple, list] = {}  # (mode, x, y) -> [(surface, pos)]
+        self._ml_result_blits = None  # (ml_result, (x, y), [(surface, pos)]) of the menu result panel
+        self._frames_since_sweep = 0
+        self._stats_panel_chrome: Dict[str, pygame.Surface] = {}  # layout -> static panel
+        self._ml_panel = None  # (ml_result, pre-rendered ML predictions panel)
+        self._bg_ml_simulation = None  # (ml_result, ML results screen without its buttons)
+        self._players_snapshot: List[Tuple[str, PlayerState]] = []  # active players as a list
+        # (players dict, len, roster_version) the snapshot was taken at. The
+        # dict itself is held and compared with 'is': a freed dict's id()
+        # can be reused, and roster_version restarts with every GameState
+        self._players_snapshot_key = (None, 0, 0)
+        self._drawn_players = ([], None)  # (active roster, (N, 2) screen positions) of the last frame
+        
+        # Fonts. Stays on pygame.font: for these short labels SDL_ttf renders
+        # ~15x faster than pygame.freetype (render or render_to), and labels
+        # drawn every frame go through render_cached() anyway.
         pygame.font.init()
-        self.font_title = pygame.font.Font(None, 56)
-        self.font_large = pygame.font.Font(None, 40)
-        self.font_medium = pygame.font.Font(None, 28)
-        self.font_small = pygame.font.Font(None, 22)
+        self.font_title = get_font(56)
+        self.font_large = get_font(40)
+        self.font_medium = get_font(28)
+        self.font_small = get_font(22)
+        
+        # The menu is the first screen shown, so build its backdrops up front
+        # rather than checking for them every frame
+        self._bg_menu[None] = self._build_menu_background()
+        for mode, step_labels in MENU_STEP_LABELS.items():
+            surface = self._bg_menu[None].copy()
+            for label, y in step_labels:
+                surface.blit(render_cached(self.font_small, label, TEXT_GRAY), (20, y))
+            self._bg_menu[mode] = surface
+        
+        # The ball never changes appearance: rasterize it once
+        self._ball_sprite = self._build_ball_sprite()
+        # Same for the results-timeline markers: (event type, team) -> surface
+        self._timeline_markers = self._build_timeline_markers()
         
         # Menu UI
         self.competition_dropdown = None
         self.team_a_dropdown = None
         self.team_b_dropdown = None
-        self.team_b_dropdown = None
         self.season_dropdown = None
         self.start_button = None
         
@@ -425,6 +786,8 @@ class Renderer:
         self.btn_speed_2x = None
         self.btn_speed_4x = None
         self.seek_bar = None
+        self._speed_buttons = ()
+        self._control_buttons = ()
     
     def _init_simulation_ui(self):
         """Initialize controls for simulation view."""
@@ -446,6 +809,10 @@ class Renderer:
         self.btn_speed_4x = Button(
             SIDEBAR_WIDTH + 240, bar_y + 15, 40, 40, "4x", self.font_small
         )
+        self._speed_buttons = ((self.btn_speed_1x, 1.0), (self.btn_speed_2x, 2.0), (self.btn_speed_4x, 4.0))
+        # (dirty-tracking key, button); constant keys so per-frame checks build no strings
+        self._control_buttons = (('btn_play_pause', self.btn_play_pause), ('btn_speed_1x', self.btn_speed_1x),
+                                 ('btn_speed_2x', self.btn_speed_2x), ('btn_speed_4x', self.btn_speed_4x))
         
         # Seek bar
         # Adjusted layout to fit time labels:
@@ -456,12 +823,47 @@ class Renderer:
         seek_w = PITCH_WIDTH_PX - 440 # Leaves ~80px on right for total time
         self.seek_bar = SeekBar(seek_x, bar_y + 25, seek_w, 20)
         
+        # Seek bar plus the clock label left of it; redrawn apart from the buttons
+        strip_left = self.seek_bar.rect.left - 50
+        self._seek_strip_rect = pygame.Rect(strip_left, CONTROLS_RECT.top,
+                                            CONTROLS_RECT.right - strip_left, CONTROLS_RECT.height)
+        
+        # Same idea as the menu's hit area: motion elsewhere (over the
+        # pitch) only matters while dragging or just after leaving
+        self._controls_hit_area = self.seek_bar.hit_area.unionall(
+            [button.rect for _, button in self._control_buttons])
+        self._pointer_in_controls = True
+        
     
     def _init_menu_ui(self):
-        """Initialize menu UI elements with mode-first design."""
-        # ================================================================
-        # MODE SELECTION BUTTONS (Primary - shown first)
-        # ================================================================
+        """
+        Initialize menu UI elements with mode-first design.
+        
+        Both modes' controls are built up front: main.py keeps the replay
+        dropdowns in sync and _reset_selections() clears both modes on a
+        switch, so they must always exist.
+        """
+        self._init_mode_buttons()
+        self._init_replay_ui()
+        self._init_ml_ui()
+        
+        # Loading state
+        self.is_loading = False
+        
+        # Pointer motion outside every menu widget (and their lists) can't
+        # change anything once the widgets have seen it leave
+        self._menu_hit_area = self.mode_replay_button.rect.unionall(
+            [self.mode_ml_button.rect, self.start_button.rect, self.ml_button.rect] +
+            [dropdown.hit_area for dropdown in (
+                self.competition_dropdown, self.season_dropdown, self.team_a_dropdown,
+                self.team_b_dropdown, self.ml_competition_dropdown, self.ml_season_dropdown,
+                self.ml_home_dropdown, self.ml_away_dropdown)])
+        self._pointer_in_menu_widgets = True
+        # The current mode's open lists; they only open or close on clicks
+        self._open_dropdowns: Tuple[Dropdown, ...] = ()
+    
+    def _init_mode_buttons(self):
+        """Mode selection buttons (primary - shown first)."""
         self.mode_replay_button = Button(
             20, 100, 260, 55, "Replay Match", self.font_medium,
             color=BUTTON_SUCCESS, hover_color=BUTTON_SUCCESS_HOVER
@@ -471,10 +873,9 @@ class Renderer:
             20, 170, 260, 55, "ML Prediction", self.font_medium,
             color=BUTTON_PRIMARY, hover_color=BUTTON_PRIMARY_HOVER
         )
-        
-        # ================================================================
-        # REPLAY MODE CONTROLS
-        # ================================================================
+    
+    def _init_replay_ui(self):
+        """Replay mode controls: competition, season and team dropdowns, start button."""
         # Competition dropdown - all StatsBomb supported
         competitions = list(COMPETITIONS.keys())
         self.competition_dropdown = Dropdown(
@@ -500,10 +901,9 @@ class Renderer:
             20, 460, 260, 48, "Start Replay", self.font_medium,
             color=BUTTON_SUCCESS, hover_color=BUTTON_SUCCESS_HOVER
         )
-        
-        # ================================================================
-        # ML MODE CONTROLS
-        # ================================================================
+    
+    def _init_ml_ui(self):
+        """ML prediction mode controls, limited to what the model supports."""
         # ML Competition dropdown (locked to supported competitions)
         ml_competitions = list(ML_SUPPORTED.keys()) if ML_SUPPORTED else ["La Liga"]
         self.ml_competition_dropdown = Dropdown(
@@ -537,9 +937,6 @@ class Renderer:
             20, 460, 260, 48, "Predict Match", self.font_medium,
             color=BUTTON_PRIMARY, hover_color=BUTTON_PRIMARY_HOVER
         )
-        
-        # Loading state
-        self.is_loading = False
     
     
     def init_simulation(self, team_a: str, team_b: str, player_info: Dict):
@@ -548,44 +945,185 @@ class Renderer:
         self.team_a_name = team_a
         self.team_b_name = team_b
         self.player_info = player_info
-        self.pitch = PitchRenderer(PITCH_WIDTH_PX, PITCH_HEIGHT_PX)
+        
+        # Per-player draw invariants, resolved once instead of every frame.
+        # The tokens only depend on the team colours, so every simulation
+        # after the first reuses them.
+        if not self._player_tokens:
+            self._build_player_tokens()
+        # Sprites are resolved once per (team colour, jersey) and shared by
+        # every player wearing that kit
+        sprites_by_kit = {}
+        self._player_sprites = {}
+        for player_id, info in player_info.items():
+            kit = (TEAM_A_COLOR if info.get('team', '') == team_a else TEAM_B_COLOR,
+                   str(info.get('jersey_number', '?')))
+            sprite = sprites_by_kit.get(kit)
+            if sprite is None:
+                sprite = sprites_by_kit[kit] = self._player_sprite(*kit)
+            self._player_sprites[player_id] = sprite
+        self._unknown_player_sprite = (sprites_by_kit.get((TEAM_B_COLOR, '?'))
+                                       or self._player_sprite(TEAM_B_COLOR, '?'))
+        
+        # The pitch geometry never changes, so it is baked once (texture load
+        # included) and reused by every later match
+        if self.pitch is None:
+            self.pitch = PitchRenderer(PITCH_WIDTH_PX, PITCH_HEIGHT_PX)
+        self._drawn_players = ([], None)
         self._init_simulation_ui()
+        self._bg_simulation = self._build_simulation_background()
+        self._full_redraw = True
     
-    def render_menu(self):
-        """Render the menu screen with mode-first design."""
-        # ================================================================
-        # BACKGROUND RENDERING
-        # ================================================================
-        # Draw gradient background for main area
-        for y in range(SCREEN_HEIGHT):
-            ratio = y / SCREEN_HEIGHT
-            r = int(BACKGROUND_GRADIENT_TOP[0] + (BACKGROUND_GRADIENT_BOTTOM[0] - BACKGROUND_GRADIENT_TOP[0]) * ratio)
-            g = int(BACKGROUND_GRADIENT_TOP[1] + (BACKGROUND_GRADIENT_BOTTOM[1] - BACKGROUND_GRADIENT_TOP[1]) * ratio)
-            b = int(BACKGROUND_GRADIENT_TOP[2] + (BACKGROUND_GRADIENT_BOTTOM[2] - BACKGROUND_GRADIENT_TOP[2]) * ratio)
-            pygame.draw.line(self.screen, (r, g, b), (SIDEBAR_WIDTH, y), (SCREEN_WIDTH, y))
-        
-        # Draw left sidebar with subtle gradient
-        for y in range(SCREEN_HEIGHT):
-            ratio = y / SCREEN_HEIGHT
-            base = SIDEBAR_BG
-            r = int(base[0] * (1 - ratio * 0.2))
-            g = int(base[1] * (1 - ratio * 0.2))
-            b = int(base[2] * (1 - ratio * 0.2))
-            pygame.draw.line(self.screen, (r, g, b), (0, y), (SIDEBAR_WIDTH, y))
+    def request_full_redraw(self):
+        """Repaint and present the whole screen on the next render()."""
+        self._full_redraw = True
+    
+    def _build_menu_background(self) -> pygame.Surface:
+        """Draw everything static on the menu (gradients, title) once."""
+        surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+        
+        # Vertical gradients, one row colour per scanline: main area fades
+        # between the configured colours, the sidebar darkens by up to 20%.
+        # The sidebar also covers column SIDEBAR_WIDTH.
+        ratio = (np.arange(SCREEN_HEIGHT) / SCREEN_HEIGHT)[:, None]
+        top = np.array(BACKGROUND_GRADIENT_TOP, dtype=float)
+        bottom = np.array(BACKGROUND_GRADIENT_BOTTOM, dtype=float)
+        main_rows = (top + (bottom - top) * ratio).astype(np.uint8)
+        sidebar_rows = (np.array(SIDEBAR_BG, dtype=float) * (1 - ratio * 0.2)).astype(np.uint8)
+        pixels = pygame.surfarray.pixels3d(surface)  # (x, y, rgb) view
+        pixels[SIDEBAR_WIDTH + 1:] = main_rows
+        pixels[:SIDEBAR_WIDTH + 1] = sidebar_rows
+        del pixels  # unlock the surface before drawing on it
         
         # Sidebar border accent line
-        pygame.draw.line(self.screen, (50, 55, 75), (SIDEBAR_WIDTH - 1, 0), (SIDEBAR_WIDTH - 1, SCREEN_HEIGHT), 1)
+        pygame.draw.line(surface, (50, 55, 75), (SIDEBAR_WIDTH - 1, 0), (SIDEBAR_WIDTH - 1, SCREEN_HEIGHT), 1)
+        
+        # Title and mode selection label
+        surface.blit(render_cached(self.font_title, "Match Selector", TEXT_WHITE), (20, 25))
+        pygame.draw.line(surface, HIGHLIGHT_YELLOW, (20, 75), (200, 75), 2)
+        surface.blit(render_cached(self.font_small, "Select Mode:", TEXT_GRAY), (20, 85))
+        
+        return surface.convert()
+    
+    def _build_simulation_background(self) -> pygame.Surface:
+        """Draw everything static on the simulation screen (pitch, panel chrome, legends) once."""
+        surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+        surface.fill(BACKGROUND_DARK)
+        surface.blit(self.pitch.get_surface(), (SIDEBAR_WIDTH, 100))
+        
+        # Top scoreboard and bottom control bar
+        pygame.draw.rect(surface, PANEL_BG, TOP_BAR_RECT)
+        pygame.draw.rect(surface, PANEL_BG, CONTROLS_RECT)
+        pygame.draw.line(surface, TEXT_GRAY, CONTROLS_RECT.topleft, (CONTROLS_RECT.right - 1, CONTROLS_RECT.top), 1)
+        # Seek bar scale end (125:00)
+        total_text = render_cached(self.font_small, f"{int(SEEK_BAR_SECONDS) // 60}:00", TEXT_GRAY)
+        surface.blit(total_text, (self.seek_bar.rect.right + 10, self.seek_bar.rect.y))
+        
+        # Left sidebar: key legend and match info heading
+        pygame.draw.rect(surface, SIDEBAR_BG, SIDEBAR_RECT)
+        surface.blit(render_cached(self.font_medium, "Controls", TEXT_WHITE), (20, 20))
+        
+        controls = [
+            ("SPACE", "Play/Pause"),
+            ("left / right", "Seek ±5s"),
+            ("Click", "Select Player"),
+            ("ESC", "Back to Menu")
+        ]
+        
+        y = 70
+        for key, action in controls:
+            surface.blit(render_cached(self.font_small, key, HIGHLIGHT_YELLOW), (20, y))
+            surface.blit(render_cached(self.font_small, action, TEXT_GRAY), (20, y + 25))
+            y += 70
+        
+        pygame.draw.line(surface, TEXT_GRAY, (20, y), (SIDEBAR_WIDTH - 20, y), 1)
+        y += 20
+        surface.blit(render_cached(self.font_small, "Match Info", TEXT_WHITE), (20, y))
+        self._match_info_rect = pygame.Rect(0, y + 35, SIDEBAR_WIDTH, 3 * MATCH_INFO_LINE_HEIGHT)
+        
+        # Right stats panel
+        pygame.draw.rect(surface, PANEL_BG, STATS_PANEL_RECT)
+        
+        return surface.convert()
+    
+    def _menu_widgets(self) -> tuple:
+        """Every widget on the menu in the current mode, mode buttons first."""
+        if self.menu_mode == MODE_REPLAY:
+            return (self.mode_replay_button, self.mode_ml_button,
+                    self.competition_dropdown, self.season_dropdown,
+                    self.team_a_dropdown, self.team_b_dropdown, self.start_button)
+        if self.menu_mode == MODE_ML:
+            return (self.mode_replay_button, self.mode_ml_button,
+                    self.ml_competition_dropdown, self.ml_season_dropdown,
+                    self.ml_home_dropdown, self.ml_away_dropdown, self.ml_button)
+        return (self.mode_replay_button, self.mode_ml_button)
+    
+    def _mode_dropdowns(self) -> tuple:
+        """The current mode's dropdowns, in event-handling order."""
+        if self.menu_mode == MODE_REPLAY:
+            return (self.competition_dropdown, self.season_dropdown,
+                    self.team_a_dropdown, self.team_b_dropdown)
+        if self.menu_mode == MODE_ML:
+            return (self.ml_competition_dropdown, self.ml_season_dropdown,
+                    self.ml_home_dropdown, self.ml_away_dropdown)
+        return ()
+    
+    def _menu_signature(self) -> tuple:
+        """
+        Snapshot of all state the menu frame depends on: screen-wide state,
+        then one entry per _menu_widgets() widget.
+        """
+        return ((self.menu_mode, self.ml_result, self.is_loading),
+                tuple(widget.visual_state() for widget in self._menu_widgets()))
+    
+    def _panel_changed(self, name: str, signature: tuple) -> bool:
+        """Record a region's draw state; True if it differs from last frame."""
+        if self._panel_sigs.get(name) == signature:
+            return False
+        self._panel_sigs[name] = signature
+        return True
+    
+    @property
+    def state(self) -> UIState:
+        return self._state
+    
+    @state.setter
+    def state(self, state: UIState):
+        self.set_state(state)
+    
+    def set_state(self, state: UIState):
+        """Switch UI state and pick the matching per-frame render method."""
+        self._state = state
+        if state == UIState.MENU:
+            self._render_impl = self.render_menu
+        elif state == UIState.SIMULATION:
+            self._render_impl = self.render_simulation
+        else:
+            self._render_impl = self.render_ml_simulation
+    
+    def render_menu(self, game_state: Optional[GameState] = None):
+        """Render the menu screen with mode-first design. game_state is ignored."""
+        # Nothing visible changed (idle mouse): keep last frame on screen
+        previous = self._panel_sigs.get('menu')
+        signature = self._menu_signature()
+        if not self._panel_changed('menu', signature):
+            return
+        # Only hover/scroll state moved: present just those widgets' areas.
+        # Buttons are repainted in place; an open list can overlap anything,
+        # so the frame is redrawn and only the list's area presented.
+        changed = self._changed_menu_widgets(previous, signature) if previous is not None else None
+        if changed and all(isinstance(widget, Button) for widget in changed):
+            self._redraw_menu_buttons(changed)
+            return
+        if changed:
+            self.dirty_rects = [widget.bounds() for widget in changed]
+        else:
+            self.dirty_rects = [self.screen.get_rect()]
         
         # ================================================================
-        # TITLE AND MODE SELECTION (Always visible)
+        # BACKGROUND, TITLE AND MODE LABEL (static, pre-rendered)
         # ================================================================
-        title = self.font_title.render("Match Selector", True, TEXT_WHITE)
-        self.screen.blit(title, (20, 25))
-        pygame.draw.line(self.screen, HIGHLIGHT_YELLOW, (20, 75), (200, 75), 2)
-        
-        # Mode selection label
-        mode_label = self.font_small.render("Select Mode:", True, TEXT_GRAY)
-        self.screen.blit(mode_label, (20, 85))
+        self.screen.blit(self._bg_menu[self.menu_mode], (0, 0))
         
         # Draw mode buttons with active state
         is_replay_active = self.menu_mode == MODE_REPLAY
@@ -611,18 +1149,50 @@ class Renderer:
         # ================================================================
         self._render_expanded_dropdowns()
     
+    def _changed_menu_widgets(self, previous: tuple, signature: tuple) -> Optional[list]:
+        """
+        Widgets whose own state changed since the last menu frame, when
+        that change stays inside their own area: button hover (with no
+        list open above them) or hover/scroll inside the one open list.
+        None if anything else changed and the whole screen is affected.
+        """
+        if previous[0] != signature[0] or len(previous[1]) != len(signature[1]):
+            return None
+        widgets = self._menu_widgets()
+        changed = [(widget, old, new) for widget, old, new in zip(widgets, previous[1], signature[1])
+                   if old != new]
+        open_lists = self._open_dropdowns
+        
+        if open_lists:
+            if len(open_lists) > 1 or len(changed) != 1:
+                return None
+            dropdown, old, new = changed[0]
+            # Same options, selection, open flag and enabled flag: only the
+            # hovered row or scroll position differ, so the list keeps its size
+            if dropdown is not open_lists[0] or old[:3] != new[:3] or old[5:] != new[5:]:
+                return None
+            return [dropdown]
+        
+        if not all(isinstance(widget, Button) for widget, _, _ in changed):
+            return None
+        return [widget for widget, _, _ in changed]
+    
+    def _redraw_menu_buttons(self, buttons: list):
+        """Repaint just these buttons over the backdrop and mark their areas dirty."""
+        self.dirty_rects = []
+        for button in buttons:
+            area = pygame.Rect(button.rect.topleft, (button.rect.width + 2, button.rect.height + 2))
+            self.screen.blit(self._bg_menu[self.menu_mode], area, area)
+            if button is self.mode_replay_button:
+                button.draw(self.screen, active=self.menu_mode == MODE_REPLAY)
+            elif button is self.mode_ml_button:
+                button.draw(self.screen, active=self.menu_mode == MODE_ML)
+            else:
+                button.draw(self.screen)
+            self.dirty_rects.append(area)
+    
     def _render_replay_controls(self):
-        """Render controls for Replay mode."""
-        # Labels
-        labels = [
-            ("1. Competition", 240),
-            ("2. Season", 300),
-            ("3. Teams", 370),
-        ]
-        for label, y in labels:
-            text = self.font_small.render(label, True, TEXT_GRAY)
-            self.screen.blit(text, (20, y))
-        
+        """Render controls for Replay mode (step labels are in the backdrop)."""
         # Dropdowns (only draw if not expanded elsewhere)
         if not self.competition_dropdown.is_open:
             self.competition_dropdown.draw(self.screen)
@@ -632,24 +1202,14 @@ class Renderer:
             self.team_a_dropdown.draw(self.screen)
             self.team_b_dropdown.draw(self.screen)
             # VS text
-            vs_text = self.font_small.render("VS", True, TEXT_WHITE)
+            vs_text = render_cached(self.font_small, "VS", TEXT_WHITE)
             self.screen.blit(vs_text, (140, 400))
         
         # Start button
         self.start_button.draw(self.screen)
     
     def _render_ml_controls(self):
-        """Render controls for ML Prediction mode."""
-        # Labels
-        labels = [
-            ("Competition (La Liga)", 240),
-            ("Season", 300),
-            ("Teams", 370),
-        ]
-        for label, y in labels:
-            text = self.font_small.render(label, True, TEXT_GRAY)
-            self.screen.blit(text, (20, y))
-        
+        """Render controls for ML Prediction mode (step labels are in the backdrop)."""
         # ML Dropdowns
         if not self.ml_competition_dropdown.is_open:
             self.ml_competition_dropdown.draw(self.screen)
@@ -659,7 +1219,7 @@ class Renderer:
             self.ml_home_dropdown.draw(self.screen)
             self.ml_away_dropdown.draw(self.screen)
             # VS text
-            vs_text = self.font_small.render("VS", True, TEXT_WHITE)
+            vs_text = render_cached(self.font_small, "VS", TEXT_WHITE)
             self.screen.blit(vs_text, (140, 400))
         
         # Predict button
@@ -679,155 +1239,195 @@ class Renderer:
         
         # Loading indicator
         if hasattr(self, 'is_loading') and self.is_loading:
-            loading_text = self.font_medium.render("Loading...", True, HIGHLIGHT_YELLOW)
+            loading_text = render_cached(self.font_medium, "Loading...", HIGHLIGHT_YELLOW)
             self.screen.blit(loading_text, (content_x, SCREEN_HEIGHT - 100))
     
     def _render_instructions(self, x, y):
         """Render context-aware instructions based on mode."""
-        if self.menu_mode is None:
-            # No mode selected yet
-            instructions = [
-                "Welcome to Football Match Simulator!",
-                "",
-                "Choose a mode to get started:",
-                "",
-                "Replay Match",
-                "  Watch real match data with player",
-                "  movement, events, and live stats.",
-                "",
-                "ML Prediction", 
-                "  AI-powered match prediction using",
-                "  trained models on La Liga data.",
-                "",
-                "Select a mode on the left to continue."
-            ]
-        elif self.menu_mode == MODE_REPLAY:
-            instructions = [
-                "Replay Match Mode",
-                "",
-                "Watch real matches with:",
-                "  - Actual player positions",
-                "  - Real match events",
-                "  - Live statistics",
-                "",
-                "Controls during replay:",
-                "  SPACE - Play/Pause",
-                "  Left/Right - Seek +/-5s",
-                "  Click player - View stats",
-                "  ESC - Return to menu",
-                "",
-                "Select competition, season, and teams."
-            ]
-        else:  # MODE_ML
-            instructions = [
-                "ML Prediction Mode",
-                "",
-                "AI-powered predictions using:",
-                "  - ELO ratings",
-                "  - Historical La Liga data",
-                "  - Random Forest classifier",
-                "",
-                "Outputs:",
-                "  - Win probability",
-                "  - Expected score",
-                "  - Simulated goal events",
-                "",
-                "Select season and teams, then predict."
-            ]
-        
-        for inst in instructions:
-            color = TEXT_WHITE if inst and not inst.startswith(" ") else TEXT_GRAY
-            text = self.font_small.render(inst, True, color)
-            self.screen.blit(text, (x, y))
-            y += 26
+        # Text, colours and positions are fixed per mode: classify, render
+        # and lay out each mode's lines once
+        key = (self.menu_mode, x, y)
+        blit_seq = self._instruction_blits.get(key)
+        if blit_seq is None:
+            if self.menu_mode is None:
+                # No mode selected yet
+                instructions = [
+                    "Welcome to Football Match Simulator!",
+                    "",
+                    "Choose a mode to get started:",
+                    "",
+                    "Replay Match",
+                    "  Watch real match data with player",
+                    "  movement, events, and live stats.",
+                    "",
+                    "ML Prediction", 
+                    "  AI-powered match prediction using",
+                    "  trained models on La Liga data.",
+                    "",
+                    "Select a mode on the left to continue."
+                ]
+            elif self.menu_mode == MODE_REPLAY:
+                instructions = [
+                    "Replay Match Mode",
+                    "",
+                    "Watch real matches with:",
+                    "  - Actual player positions",
+                    "  - Real match events",
+                    "  - Live statistics",
+                    "",
+                    "Controls during replay:",
+                    "  SPACE - Play/Pause",
+                    "  Left/Right - Seek +/-5s",
+                    "  Click player - View stats",
+                    "  ESC - Return to menu",
+                    "",
+                    "Select competition, season, and teams."
+                ]
+            else:  # MODE_ML
+                instructions = [
+                    "ML Prediction Mode",
+                    "",
+                    "AI-powered predictions using:",
+                    "  - ELO ratings",
+                    "  - Historical La Liga data",
+                    "  - Random Forest classifier",
+                    "",
+                    "Outputs:",
+                    "  - Win probability",
+                    "  - Expected score",
+                    "  - Simulated goal events",
+                    "",
+                    "Select season and teams, then predict."
+                ]
+            
+            blit_seq = []
+            for inst in instructions:
+                color = TEXT_WHITE if inst and not inst.startswith(" ") else TEXT_GRAY
+                blit_seq.append((render_cached(self.font_small, inst, color), (x, y)))
+                y += 26
+            self._instruction_blits[key] = blit_seq
+        
+        self.screen.blits(blit_seq, doreturn=False)
     
     def _render_ml_result(self, x, y):
         """Render ML prediction results."""
+        # Everything here is fixed for a given result: lay it out once as
+        # one blit list (probability bars as filled surfaces)
+        cached = self._ml_result_blits
+        if cached is None or cached[0] is not self.ml_result or cached[1] != (x, y):
+            cached = self._ml_result_blits = (self.ml_result, (x, y), self._layout_ml_result(x, y))
+        self.screen.blits(cached[2], doreturn=False)
+    
+    def _layout_ml_result(self, x, y) -> list:
+        """(surface, position) pairs drawing the ML result panel at (x, y)."""
         result = self.ml_result
+        blit_seq = []
         
         # Title
-        title = self.font_title.render("ML Match Prediction", True, HIGHLIGHT_YELLOW)
-        self.screen.blit(title, (x, y))
+        title = render_cached(self.font_title, "ML Match Prediction", HIGHLIGHT_YELLOW)
+        blit_seq.append((title, (x, y)))
         y += 60
         
         # Teams and Score
         match_text = f"{result.home_team}  vs  {result.away_team}"
-        self.screen.blit(self.font_large.render(match_text, True, TEXT_WHITE), (x, y))
+        blit_seq.append((render_cached(self.font_large, match_text, TEXT_WHITE), (x, y)))
         y += 50
         
         # Predicted Score
         score_text = f"Predicted: {result.home_goals} - {result.away_goals}"
-        self.screen.blit(self.font_large.render(score_text, True, TEXT_WHITE), (x, y))
+        blit_seq.append((render_cached(self.font_large, score_text, TEXT_WHITE), (x, y)))
         y += 45
         
         # Outcome
-        outcome_colors = {'H': (100, 255, 100), 'D': (255, 255, 100), 'A': (255, 100, 100)}
-        outcome_labels = {'H': 'HOME WIN', 'D': 'DRAW', 'A': 'AWAY WIN'}
-        outcome_color = outcome_colors.get(result.predicted_outcome, TEXT_GRAY)
-        outcome_text = outcome_labels.get(result.predicted_outcome, 'UNKNOWN')
-        self.screen.blit(self.font_medium.render(outcome_text, True, outcome_color), (x, y))
+        outcome_color = OUTCOME_COLORS.get(result.predicted_outcome, TEXT_GRAY)
+        outcome_text = OUTCOME_LABELS.get(result.predicted_outcome, 'UNKNOWN')
+        blit_seq.append((render_cached(self.font_medium, outcome_text, outcome_color), (x, y)))
         y += 50
         
         # ELO Ratings
-        self.screen.blit(self.font_medium.render("ELO Ratings", True, TEXT_WHITE), (x, y))
+        blit_seq.append((render_cached(self.font_medium, "ELO Ratings", TEXT_WHITE), (x, y)))
         y += 28
-        self.screen.blit(self.font_small.render(f"  {result.home_team}: {result.home_elo:.0f}", True, TEAM_A_COLOR), (x, y))
+        blit_seq.append((render_cached(self.font_small, f"  {result.home_team}: {result.home_elo:.0f}", TEAM_A_COLOR), (x, y)))
         y += 22
-        self.screen.blit(self.font_small.render(f"  {result.away_team}: {result.away_elo:.0f}", True, TEAM_B_COLOR), (x, y))
+        blit_seq.append((render_cached(self.font_small, f"  {result.away_team}: {result.away_elo:.0f}", TEAM_B_COLOR), (x, y)))
         y += 22
         diff_color = (100, 255, 100) if result.elo_diff > 0 else (255, 100, 100)
-        self.screen.blit(self.font_small.render(f"  Diff: {result.elo_diff:+.0f}", True, diff_color), (x, y))
+        blit_seq.append((render_cached(self.font_small, f"  Diff: {result.elo_diff:+.0f}", diff_color), (x, y)))
         y += 35
         
         # Win Probabilities (compact)
-        self.screen.blit(self.font_medium.render("Win Probability", True, TEXT_WHITE), (x, y))
+        blit_seq.append((render_cached(self.font_medium, "Win Probability", TEXT_WHITE), (x, y)))
         y += 28
         bar_width = 280
         bar_height = 20
-        probs = [
-            (f"Home: {result.home_win_prob*100:.0f}%", result.home_win_prob, TEAM_A_COLOR),
-            (f"Draw: {result.draw_prob*100:.0f}%", result.draw_prob, (200, 200, 100)),
-            (f"Away: {result.away_win_prob*100:.0f}%", result.away_win_prob, TEAM_B_COLOR)
-        ]
-        for text, prob, color in probs:
-            pygame.draw.rect(self.screen, (50, 50, 60), (x, y, bar_width, bar_height))
-            pygame.draw.rect(self.screen, color, (x, y, int(bar_width * prob), bar_height))
-            self.screen.blit(self.font_small.render(text, True, TEXT_WHITE), (x + 5, y + 2))
+        # Display-format surfaces, so the panel's blits need no per-pixel
+        # conversion; all three bars share one track
+        track = pygame.Surface((bar_width, bar_height)).convert()
+        track.fill((50, 50, 60))
+        for label, attr, color in PROB_SLOTS:
+            prob = getattr(result, attr)
+            fill = pygame.Surface((int(bar_width * prob), bar_height)).convert()
+            fill.fill(color)
+            blit_seq.append((track, (x, y)))
+            blit_seq.append((fill, (x, y)))
+            blit_seq.append((render_cached(self.font_small, f"{label}: {prob*100:.0f}%", TEXT_WHITE), (x + 5, y + 2)))
             y += 26
         
         # Hint
         y += 15
-        self.screen.blit(self.font_small.render("Click 'Predict Match' to resimulate", True, TEXT_DARK_GRAY), (x, y))
+        blit_seq.append((render_cached(self.font_small, "Click 'Predict Match' to resimulate", TEXT_DARK_GRAY), (x, y)))
+        return blit_seq
     
     def _render_expanded_dropdowns(self):
         """Render expanded dropdowns on top of other elements."""
-        if self.menu_mode == MODE_REPLAY:
-            if self.competition_dropdown.is_open:
-                self.competition_dropdown.draw(self.screen)
-            if self.season_dropdown.is_open:
-                self.season_dropdown.draw(self.screen)
-            if self.team_a_dropdown.is_open:
-                self.team_a_dropdown.draw(self.screen)
-            if self.team_b_dropdown.is_open:
-                self.team_b_dropdown.draw(self.screen)
-        elif self.menu_mode == MODE_ML:
-            if self.ml_competition_dropdown.is_open:
-                self.ml_competition_dropdown.draw(self.screen)
-            if self.ml_season_dropdown.is_open:
-                self.ml_season_dropdown.draw(self.screen)
-            if self.ml_home_dropdown.is_open:
-                self.ml_home_dropdown.draw(self.screen)
-            if self.ml_away_dropdown.is_open:
-                self.ml_away_dropdown.draw(self.screen)
+        for dropdown in self._open_dropdowns:
+            dropdown.draw(self.screen)
 
     
     def render_simulation(self, game_state: GameState):
-        """Render the simulation screen."""
-        self.screen.fill(BACKGROUND_DARK)
+        """
+        Render the simulation screen.
+        
+        After the first full frame only the pitch regions under last
+        frame's players/ball are restored from the pitch surface before
+        the sprites and panels are drawn again. A frame identical to the
+        last one (e.g. while paused) is skipped, leaving dirty_rects empty.
+        Returns False when there is no game state to draw yet.
+        """
+        if not game_state:
+            return False
+        
+        controls = (self.btn_play_pause, self.btn_speed_1x, self.btn_speed_2x, self.btn_speed_4x, self.seek_bar)
+        widget_states = tuple(w.visual_state() for w in controls)
+        # The engines only move players when time advances (or on a seek,
+        # which can swap the state object), so this covers the whole frame
+        frame = (game_state.timestamp, self.selected_player_id, self.ml_result, widget_states)
+        frame_changed = self._panel_changed('frame', frame)
+        if game_state is not self._frame_game_state:
+            self._frame_game_state = game_state
+            frame_changed = True
+        if not frame_changed:
+            return
+        
+        prev_rects = self._sprite_rects
+        self._sprite_rects = []
+        full = self._full_redraw or not self.pitch
+        
+        if full:
+            if self._bg_simulation:
+                self.screen.blit(self._bg_simulation, (0, 0))
+            else:
+                self.screen.fill(BACKGROUND_DARK)
+            self.dirty_rects = [self.screen.get_rect()]
+        else:
+            # Restore the pitch under last frame's sprites
+            background = self._bg_simulation
+            self.screen.blits([(background, rect, rect) for rect in prev_rects], doreturn=False)
+            self.dirty_rects = prev_rects
         
-        # Draw pitch
-        if self.pitch:
-            self.screen.blit(self.pitch.get_surface(), (SIDEBAR_WIDTH, 100))
+        # Sprites never spill onto the panels, so those only need redrawing
+        # when their own content changes
+        self.screen.set_clip(PITCH_VIEW_RECT)
         
         # Draw players
         self._draw_players(game_state)
@@ -835,369 +1435,455 @@ class Renderer:
         # Draw ball
         self._draw_ball(game_state)
         
-        # Draw UI panels
-        self._draw_top_bar(game_state)
-        self._draw_left_sidebar(game_state)
-        self._draw_top_bar(game_state)
-        self._draw_left_sidebar(game_state)
-        self._draw_stats_panel(game_state)
-        self._draw_controls(game_state)
-    
-    def _draw_controls(self, game_state: GameState):
-        """Draw simulation controls at bottom."""
-        # Background bar
-        ctrl_y = SCREEN_HEIGHT - 80
-        pygame.draw.rect(self.screen, PANEL_BG, (SIDEBAR_WIDTH, ctrl_y, PITCH_WIDTH_PX, 80))
-        pygame.draw.line(self.screen, TEXT_GRAY, (SIDEBAR_WIDTH, ctrl_y), (SIDEBAR_WIDTH + PITCH_WIDTH_PX, ctrl_y), 1)
-        
-        self.btn_play_pause.draw(self.screen)
-        self.btn_speed_1x.draw(self.screen)
-        self.btn_speed_2x.draw(self.screen)
-        self.btn_speed_4x.draw(self.screen)
-        
-        # Calculate progress
-        # Assume max 90 mins (5400s) + extra time, or based on last event?
-        # Use 125 mins (7500s) as safe max for seek bar scaling
-        progress = min(1.0, game_state.timestamp / 7500.0)
+        self.screen.set_clip(None)
+        self._sprite_rects = [rect.clip(PITCH_VIEW_RECT) for rect in self._sprite_rects]
+        if not full:
+            self.dirty_rects = self.dirty_rects + self._sprite_rects
+        
+        # Draw UI panels (skipped while what they show is unchanged)
+        second = int(game_state.timestamp)
+        score = (game_state.score_home, game_state.score_away)
+        if self._panel_changed('top_bar', (second, game_state.period, score)):
+            self._draw_top_bar(game_state)
+            self.dirty_rects.append(TOP_BAR_RECT)
+        if self._panel_changed('sidebar', (second // 60, game_state.period, score)):
+            self._draw_left_sidebar(game_state)
+            self.dirty_rects.append(self._match_info_rect)
+        stats_changed = self._panel_changed('stats_panel', (self.ml_result, self.selected_player_id))
+        if self.player_info is not self._stats_panel_info:
+            self._stats_panel_info = self.player_info
+            stats_changed = True
+        if stats_changed:
+            self._draw_stats_panel(game_state)
+            self.dirty_rects.append(STATS_PANEL_RECT)
+        # Control bar: the seek strip when the clock, the bar's fill or its
+        # hover state changes, and each button when its own state changes
+        progress = min(1.0, game_state.timestamp / SEEK_BAR_SECONDS)
+        seek_bar = self.seek_bar
+        if self._panel_changed('seek_strip', (second, seek_bar.fill_width(progress), seek_bar.visual_state())):
+            self._draw_seek_strip(game_state, progress)
+            self.dirty_rects.append(self._seek_strip_rect)
+        for name, button in self._control_buttons:
+            if self._panel_changed(name, button.visual_state()):
+                # Button face including its 2px drop shadow
+                area = pygame.Rect(button.rect.topleft, (button.rect.width + 2, button.rect.height + 2))
+                self.screen.blit(self._bg_simulation, area, area)
+                button.draw(self.screen)
+                self.dirty_rects.append(area)
+    
+    def _render_label(self, slot: str, font: pygame.font.Font, text: str, color) -> pygame.Surface:
+        """
+        Render a frequently changing label (clock, score) for a fixed slot.
+        
+        Only the slot's last string is kept, so ticking clock strings
+        don't push the static labels out of the shared text cache.
+        """
+        cached = self._label_surfs.get(slot)
+        if cached is None or cached[0] != text:
+            surface = font.render(text, True, color)
+            if pygame.display.get_surface() is not None:
+                surface = surface.convert_alpha()
+            cached = (text, surface)
+            self._label_surfs[slot] = cached
+        return cached[1]
+    
+    def _clock_text(self, game_state: GameState) -> str:
+        """The MM:SS match clock, formatted once per second for both labels showing it."""
+        second = int(game_state.timestamp)
+        if second != self._clock[0]:
+            self._clock = (second, "%02d:%02d" % divmod(second, 60))
+        return self._clock[1]
+    
+    def _draw_seek_strip(self, game_state: GameState, progress: float):
+        """Draw the seek bar and current time in the bottom control bar."""
+        # Background bar and total time label (pre-rendered)
+        self.screen.blit(self._bg_simulation, self._seek_strip_rect, self._seek_strip_rect)
+        
+        # Progress over 125 mins (SEEK_BAR_SECONDS), enough for extra time
         self.seek_bar.draw(self.screen, progress)
         
         # FIX: Draw time labels left and right of seek bar
         # Current time
-        cur_min = int(game_state.timestamp / 60)
-        cur_sec = int(game_state.timestamp % 60)
-        cur_text = self.font_small.render(f"{cur_min:02d}:{cur_sec:02d}", True, TEXT_WHITE)
+        cur_text = self._render_label('seek_time', self.font_small, self._clock_text(game_state), TEXT_WHITE)
         self.screen.blit(cur_text, (self.seek_bar.rect.left - 50, self.seek_bar.rect.y))
         
-        # Total time (Total is ~125 mins max for seeker)
-        # Or should we show "90:00" / "120:00"?
-        # Let's show the max scale of the seek bar which is 125m
-        total_text = self.font_small.render("125:00", True, TEXT_GRAY)
-        self.screen.blit(total_text, (self.seek_bar.rect.right + 10, self.seek_bar.rect.y))
-        
         # Time tooltip on hover? (optional)
     
+    def _build_player_tokens(self):
+        """
+        Pre-render every player token variant (team colour x has-ball x
+        selected) so drawing a player is a single blit.
+        """
+        size = 2 * PLAYER_SPRITE_HALF + 1
+        c = PLAYER_SPRITE_HALF
+        
+        for color, highlight in TEAM_HIGHLIGHTS.items():
+            for has_ball in (False, True):
+                for selected in (False, True):
+                    token = pygame.Surface((size, size), pygame.SRCALPHA)
+                    
+                    # Shadow
+                    pygame.gfxdraw.filled_circle(token, c + 2, c + 2, PLAYER_RADIUS, PLAYER_SHADOW_COLOR)
+                    
+                    # Possession glow / selection rings
+                    if has_ball:
+                        for r, glow in POSSESSION_GLOW_RINGS:
+                            pygame.draw.circle(token, glow, (c, c), r, 2)
+                    if selected:
+                        pygame.draw.circle(token, SELECTED_RING, (c, c), PLAYER_RADIUS + 6, 3)
+                        # Inner ring for emphasis
+                        pygame.draw.circle(token, (255, 255, 200), (c, c), PLAYER_RADIUS + 4, 1)
+                    
+                    # Body: fill, top-left highlight, white border
+                    pygame.gfxdraw.filled_circle(token, c, c, PLAYER_RADIUS, color)
+                    pygame.gfxdraw.filled_circle(token, c - 2, c - 2, PLAYER_RADIUS - 4, highlight)
+                    pygame.gfxdraw.aacircle(token, c, c, PLAYER_RADIUS, LINE_WHITE)
+                    pygame.gfxdraw.circle(token, c, c, PLAYER_RADIUS - 1, LINE_WHITE)
+                    
+                    if pygame.display.get_surface() is not None:
+                        token = token.convert_alpha()
+                    self._player_tokens[(color, has_ball, selected)] = token
+    
+    def _player_sprite(self, color, jersey: str) -> tuple:
+        """
+        Everything needed to draw one player, as
+        (tokens, shadow, shadow_dx, shadow_dy, number, number_dx, number_dy).
+        
+        tokens is indexed by has_ball * 2 + selected; the offsets centre the
+        jersey number (and its drop shadow) on the player's pixel position.
+        """
+        tokens = tuple(self._player_tokens[(color, has_ball, selected)]
+                       for has_ball in (False, True) for selected in (False, True))
+        shadow = render_cached(self.font_small, jersey, (0, 0, 0))
+        number = render_cached(self.font_small, jersey, TEXT_WHITE)
+        return (tokens,
+                shadow, 1 - shadow.get_width() // 2, 1 - shadow.get_height() // 2,
+                number, -(number.get_width() // 2), -(number.get_height() // 2))
+    
     def _draw_players(self, game_state: GameState):
         """Draw all players with enhanced visuals."""
         if not self.pitch:
             return
         
-        for player_id, player_state in game_state.players.items():
-            if not player_state.is_active:
-                continue
-            
-            px, py = self.pitch.statsbomb_to_pixels(player_state.x, player_state.y)
-            px += SIDEBAR_WIDTH
-            py += 100
-            
-            # Team color
-            player_data = self.player_info.get(player_id, {})
-            team_name = player_data.get('team', '')
-            color = TEAM_A_COLOR if team_name == self.team_a_name else TEAM_B_COLOR
-            
-            # Draw shadow first
-            shadow_offset = 2
-            shadow_color = (20, 20, 25)
-            pygame.draw.circle(self.screen, shadow_color, (px + shadow_offset, py + shadow_offset), PLAYER_RADIUS)
-            
-            # Ball possession glow (outer)
-            if player_state.has_ball:
-                glow_color = (255, 220, 100, 100)  # Golden glow
-                for r in range(PLAYER_RADIUS + 8, PLAYER_RADIUS + 2, -2):
-                    alpha = int(80 * (1 - (r - PLAYER_RADIUS - 2) / 6))
-                    glow = (255, min(255, 215 + alpha // 4), 50)
-                    pygame.draw.circle(self.screen, glow, (px, py), r, 2)
-            
-            # Selection ring (animated feel)
-            if player_id == self.selected_player_id:
-                pygame.draw.circle(self.screen, SELECTED_RING, (px, py), PLAYER_RADIUS + 6, 3)
-                # Inner ring for emphasis
-                pygame.draw.circle(self.screen, (255, 255, 200), (px, py), PLAYER_RADIUS + 4, 1)
-            
-            # Main player circle with gradient effect (simulated)
-            # Darker center for depth
-            pygame.draw.circle(self.screen, color, (px, py), PLAYER_RADIUS)
-            # Highlight on top left
-            highlight_color = tuple(min(255, c + 50) for c in color)
-            pygame.draw.circle(self.screen, highlight_color, (px - 2, py - 2), PLAYER_RADIUS - 4)
-            # Border
-            pygame.draw.circle(self.screen, LINE_WHITE, (px, py), PLAYER_RADIUS, 2)
+        screen = self.screen
+        sprites = self._player_sprites
+        unknown = self._unknown_player_sprite
+        selected_id = self.selected_player_id
+        half = PLAYER_SPRITE_HALF
+        
+        active = self._active_players(game_state)
+        if not active:
+            self._drawn_players = ([], None)
+            return
+        pixel_array = self._player_pixels(active, game_state.positions)
+        self._drawn_players = (active, pixel_array)
+        pixels = pixel_array.tolist()
+        
+        # One batched blits() call; token and number stay interleaved per
+        # player so overlapping players stack exactly as before. The token
+        # rects blits() hands back (already clipped to the pitch view) are
+        # the sprite regions to restore next frame.
+        blit_seq = []
+        extend = blit_seq.extend
+        for (player_id, player_state), (px, py) in zip(active, pixels):
+            tokens, shadow, sdx, sdy, number, ndx, ndy = sprites.get(player_id, unknown)
             
-            # Jersey number with better contrast
-            jersey = str(player_data.get('jersey_number', '?'))
-            # Draw text shadow
-            num_shadow = self.font_small.render(jersey, True, (0, 0, 0))
-            shadow_rect = num_shadow.get_rect(center=(px + 1, py + 1))
-            self.screen.blit(num_shadow, shadow_rect)
-            # Draw text
-            num_text = self.font_small.render(jersey, True, TEXT_WHITE)
-            num_rect = num_text.get_rect(center=(px, py))
-            self.screen.blit(num_text, num_rect)
+            # Pre-rendered token (shadow, rings and body), then the jersey
+            # number with a drop shadow for contrast
+            token = tokens[player_state.has_ball * 2 + (player_id == selected_id)]
+            extend(((token, (px - half, py - half)),
+                    (shadow, (px + sdx, py + sdy)),
+                    (number, (px + ndx, py + ndy))))
+        self._sprite_rects.extend(screen.blits(blit_seq)[::3])
     
-    def _draw_ball(self, game_state: GameState):
-        """Draw the ball with glow effect."""
-        if not self.pitch or not game_state.ball.in_play:
-            return
-        
-        px, py = self.pitch.statsbomb_to_pixels(game_state.ball.x, game_state.ball.y)
-        px += SIDEBAR_WIDTH
-        py += 100
+    def _build_ball_sprite(self) -> pygame.Surface:
+        """Glow rings, shadow, ball and highlight on one SRCALPHA surface."""
+        size = 2 * BALL_SPRITE_HALF + 1
+        c = BALL_SPRITE_HALF
+        sprite = pygame.Surface((size, size), pygame.SRCALPHA)
         
         # Outer glow effect
-        glow_colors = [(255, 255, 200), (255, 255, 240), (255, 255, 255)]
-        for i, glow_color in enumerate(reversed(glow_colors)):
-            pygame.draw.circle(self.screen, glow_color, (px, py), BALL_RADIUS + 3 - i, 1)
+        for r, glow_color in BALL_GLOW_RINGS:
+            pygame.draw.circle(sprite, glow_color, (c, c), r, 1)
         
         # Shadow
-        pygame.draw.circle(self.screen, (30, 30, 35), (px + 2, py + 2), BALL_RADIUS)
+        pygame.draw.circle(sprite, (30, 30, 35), (c + 2, c + 2), BALL_RADIUS)
         
         # Main ball with slight gradient (highlight)
-        pygame.draw.circle(self.screen, BALL_COLOR, (px, py), BALL_RADIUS)
-        pygame.draw.circle(self.screen, (200, 200, 200), (px, py), BALL_RADIUS, 1)
+        pygame.draw.circle(sprite, BALL_COLOR, (c, c), BALL_RADIUS)
+        pygame.draw.circle(sprite, (200, 200, 200), (c, c), BALL_RADIUS, 1)
         
         # Highlight dot for 3D effect
-        pygame.draw.circle(self.screen, (255, 255, 255), (px - 1, py - 1), 2)
+        pygame.draw.circle(sprite, (255, 255, 255), (c - 1, c - 1), 2)
+        
+        if pygame.display.get_surface() is not None:
+            sprite = sprite.convert_alpha()
+        return sprite
+    
+    def _build_timeline_markers(self) -> Dict[Tuple[str, str], pygame.Surface]:
+        """Goal and yellow card markers for the ML results timeline, per team."""
+        converted = pygame.display.get_surface() is not None
+        card = pygame.Surface((8, 12))
+        card.fill((255, 255, 0))
+        if converted:
+            card = card.convert()
+        
+        markers = {}
+        for team, color in (('home', TEAM_A_COLOR), ('away', TEAM_B_COLOR)):
+            # Goal: filled circle of radius 10 with a white ring
+            goal = pygame.Surface((20, 20), pygame.SRCALPHA)
+            pygame.draw.circle(goal, color, (10, 10), 10)
+            pygame.draw.circle(goal, TEXT_WHITE, (10, 10), 10, 2)
+            if converted:
+                goal = goal.convert_alpha()
+            markers['goal', team] = goal
+            markers['yellow_card', team] = card
+        return markers
+    
+    def _draw_ball(self, game_state: GameState):
+        """Draw the ball with glow effect."""
+        if not self.pitch or not game_state.ball.in_play:
+            return
+        
+        sx, ox, sy, oy = self.pitch.screen_transform()
+        px = int(game_state.ball.x * sx + ox)
+        py = int(game_state.ball.y * sy + oy)
+        self._sprite_rects.append(self.screen.blit(self._ball_sprite, (px - BALL_SPRITE_HALF, py - BALL_SPRITE_HALF)))
     
     def _draw_top_bar(self, game_state: GameState):
         """Draw top scoreboard."""
-        pygame.draw.rect(self.screen, PANEL_BG, (SIDEBAR_WIDTH, 0, PITCH_WIDTH_PX, 100))
+        self.screen.blit(self._bg_simulation, TOP_BAR_RECT, TOP_BAR_RECT)
         
         # Score
         score_text = f"{self.team_a_name} {game_state.score_home} - {game_state.score_away} {self.team_b_name}"
-        score_surface = self.font_large.render(score_text, True, TEXT_WHITE)
+        score_surface = self._render_label('top_score', self.font_large, score_text, TEXT_WHITE)
         score_rect = score_surface.get_rect(center=(SIDEBAR_WIDTH + PITCH_WIDTH_PX // 2, 35))
         self.screen.blit(score_surface, score_rect)
         
         # Time
-        minute = int(game_state.timestamp / 60)
-        second = int(game_state.timestamp % 60)
-        time_text = f"{minute:02d}:{second:02d}"
-        time_surface = self.font_medium.render(time_text, True, TEXT_GRAY)
+        time_surface = self._render_label('top_time', self.font_medium, self._clock_text(game_state), TEXT_GRAY)
         self.screen.blit(time_surface, (SIDEBAR_WIDTH + 20, 70))
         
         # Period
         period_text = f"{'1st' if game_state.period == 1 else '2nd'} Half"
-        period_surface = self.font_small.render(period_text, True, TEXT_GRAY)
+        period_surface = render_cached(self.font_small, period_text, TEXT_GRAY)
         self.screen.blit(period_surface, (SIDEBAR_WIDTH + PITCH_WIDTH_PX - 120, 75))
     
     def _draw_left_sidebar(self, game_state: GameState):
         """Draw left sidebar with controls."""
-        pygame.draw.rect(self.screen, SIDEBAR_BG, (0, 0, SIDEBAR_WIDTH, SCREEN_HEIGHT))
-        
-        # Title
-        title = self.font_medium.render("Controls", True, TEXT_WHITE)
-        self.screen.blit(title, (20, 20))
-        
-        # Controls list
-        controls = [
-            ("SPACE", "Play/Pause"),
-            ("left / right", "Seek ±5s"),
-            ("Click", "Select Player"),
-            ("ESC", "Back to Menu")
-        ]
-        
-        y = 70
-        for key, action in controls:
-            key_surface = self.font_small.render(key, True, HIGHLIGHT_YELLOW)
-            self.screen.blit(key_surface, (20, y))
-            
-            action_surface = self.font_small.render(action, True, TEXT_GRAY)
-            self.screen.blit(action_surface, (20, y + 25))
-            
-            y += 70
-        
-        # Match info
-        pygame.draw.line(self.screen, TEXT_GRAY, (20, y), (SIDEBAR_WIDTH - 20, y), 1)
-        y += 20
-        
-        info_title = self.font_small.render("Match Info", True, TEXT_WHITE)
-        self.screen.blit(info_title, (20, y))
-        y += 35
+        # Legend and headings are part of the pre-rendered background; only
+        # the match-info lines under them change
+        info_rect = self._match_info_rect
+        self.screen.blit(self._bg_simulation, info_rect, info_rect)
+        y = info_rect.y
         
-        minute = int(game_state.timestamp / 60)
+        minute = int(game_state.timestamp) // 60
         info_lines = [
             f"Minute: {minute}'",
             f"Period: {game_state.period}",
             f"Score: {game_state.score_home}-{game_state.score_away}"
         ]
         
-        for line in info_lines:
-            text = self.font_small.render(line, True, TEXT_GRAY)
+        for slot, line in zip(('info_minute', 'info_period', 'info_score'), info_lines):
+            text = self._render_label(slot, self.font_small, line, TEXT_GRAY)
             self.screen.blit(text, (20, y))
-            y += 30
+            y += MATCH_INFO_LINE_HEIGHT
     
     def _draw_stats_panel(self, game_state: GameState):
         """Draw right stats panel - shows ML predictions if available, else player stats."""
         panel_x = SIDEBAR_WIDTH + PITCH_WIDTH_PX
-        pygame.draw.rect(self.screen, PANEL_BG, (panel_x, 0, STATS_PANEL_WIDTH, SCREEN_HEIGHT))
         
         # If ML prediction is available, show it instead of player stats
         if self.ml_result:
-            self._draw_ml_predictions_panel(panel_x, game_state)
+            cached = self._ml_panel
+            if cached is None or cached[0] is not self.ml_result:
+                cached = self._ml_panel = (self.ml_result, self._build_ml_predictions_panel(self.ml_result))
+            self.screen.blit(cached[1], (panel_x, 0))
         else:
             self._draw_player_stats_panel(panel_x)
     
-    def _draw_ml_predictions_panel(self, panel_x: int, game_state: GameState):
-        """Draw ML predictions in the stats panel."""
-        result = self.ml_result
+    def _build_ml_predictions_panel(self, result) -> pygame.Surface:
+        """
+        Pre-render the whole ML predictions panel for one result; nothing on
+        it changes until the match is resimulated.
+        """
+        surface = pygame.Surface((STATS_PANEL_WIDTH, SCREEN_HEIGHT))
+        surface.fill(PANEL_BG)
         y = 20
         
         # Title
-        title = self.font_medium.render("ML Prediction", True, HIGHLIGHT_YELLOW)
-        self.screen.blit(title, (panel_x + 20, y))
+        title = render_cached(self.font_medium, "ML Prediction", HIGHLIGHT_YELLOW)
+        surface.blit(title, (20, y))
         y += 45
         
         # Predicted Score
-        pred_label = self.font_small.render("Predicted:", True, TEXT_GRAY)
-        self.screen.blit(pred_label, (panel_x + 20, y))
+        pred_label = render_cached(self.font_small, "Predicted:", TEXT_GRAY)
+        surface.blit(pred_label, (20, y))
         y += 25
         
         score_text = f"{result.home_goals} - {result.away_goals}"
-        score_surface = self.font_large.render(score_text, True, TEXT_WHITE)
-        self.screen.blit(score_surface, (panel_x + 20, y))
+        score_surface = render_cached(self.font_large, score_text, TEXT_WHITE)
+        surface.blit(score_surface, (20, y))
         y += 45
         
         # Outcome
-        outcome_colors = {'H': (100, 255, 100), 'D': (255, 255, 100), 'A': (255, 100, 100)}
-        outcome_labels = {'H': 'HOME WIN', 'D': 'DRAW', 'A': 'AWAY WIN'}
-        outcome_color = outcome_colors.get(result.predicted_outcome, TEXT_GRAY)
-        outcome_text = outcome_labels.get(result.predicted_outcome, 'UNKNOWN')
-        outcome_surface = self.font_small.render(outcome_text, True, outcome_color)
-        self.screen.blit(outcome_surface, (panel_x + 20, y))
+        outcome_color = OUTCOME_COLORS.get(result.predicted_outcome, TEXT_GRAY)
+        outcome_text = OUTCOME_LABELS.get(result.predicted_outcome, 'UNKNOWN')
+        outcome_surface = render_cached(self.font_small, outcome_text, outcome_color)
+        surface.blit(outcome_surface, (20, y))
         y += 40
         
-        pygame.draw.line(self.screen, TEXT_GRAY, (panel_x + 20, y), (panel_x + STATS_PANEL_WIDTH - 20, y), 1)
+        pygame.draw.line(surface, TEXT_GRAY, (20, y), (STATS_PANEL_WIDTH - 20, y), 1)
         y += 20
         
         # Win Probabilities
-        prob_title = self.font_small.render("Win Probability", True, TEXT_WHITE)
-        self.screen.blit(prob_title, (panel_x + 20, y))
+        prob_title = render_cached(self.font_small, "Win Probability", TEXT_WHITE)
+        surface.blit(prob_title, (20, y))
         y += 28
         
         bar_width = STATS_PANEL_WIDTH - 50
         bar_height = 18
-        probs = [
-            ("Home", result.home_win_prob, TEAM_A_COLOR),
-            ("Draw", result.draw_prob, (200, 200, 100)),
-            ("Away", result.away_win_prob, TEAM_B_COLOR)
-        ]
-        
-        for label, prob, color in probs:
+        for label, attr, color in PROB_SLOTS:
+            prob = getattr(result, attr)
             # Label
-            label_surf = self.font_small.render(f"{label}: {prob*100:.0f}%", True, TEXT_GRAY)
-            self.screen.blit(label_surf, (panel_x + 20, y))
+            label_surf = render_cached(self.font_small, f"{label}: {prob*100:.0f}%", TEXT_GRAY)
+            surface.blit(label_surf, (20, y))
             y += 20
             # Bar background
-            pygame.draw.rect(self.screen, (40, 40, 50), (panel_x + 20, y, bar_width, bar_height))
+            pygame.draw.rect(surface, (40, 40, 50), (20, y, bar_width, bar_height))
             # Bar fill
             fill_width = int(bar_width * prob)
-            pygame.draw.rect(self.screen, color, (panel_x + 20, y, fill_width, bar_height))
+            pygame.draw.rect(surface, color, (20, y, fill_width, bar_height))
             y += 25
         
         y += 10
-        pygame.draw.line(self.screen, TEXT_GRAY, (panel_x + 20, y), (panel_x + STATS_PANEL_WIDTH - 20, y), 1)
+        pygame.draw.line(surface, TEXT_GRAY, (20, y), (STATS_PANEL_WIDTH - 20, y), 1)
         y += 20
         
         # ELO Ratings
-        elo_title = self.font_small.render("ELO Ratings", True, TEXT_WHITE)
-        self.screen.blit(elo_title, (panel_x + 20, y))
+        elo_title = render_cached(self.font_small, "ELO Ratings", TEXT_WHITE)
+        surface.blit(elo_title, (20, y))
         y += 28
         
         home_elo = f"{result.home_team[:12]}: {result.home_elo:.0f}"
         away_elo = f"{result.away_team[:12]}: {result.away_elo:.0f}"
-        self.screen.blit(self.font_small.render(home_elo, True, TEAM_A_COLOR), (panel_x + 20, y))
+        surface.blit(render_cached(self.font_small, home_elo, TEAM_A_COLOR), (20, y))
         y += 22
-        self.screen.blit(self.font_small.render(away_elo, True, TEAM_B_COLOR), (panel_x + 20, y))
+        surface.blit(render_cached(self.font_small, away_elo, TEAM_B_COLOR), (20, y))
         y += 22
         
         diff_color = (100, 255, 100) if result.elo_diff > 0 else (255, 100, 100)
         diff_text = f"Diff: {result.elo_diff:+.0f}"
-        self.screen.blit(self.font_small.render(diff_text, True, diff_color), (panel_x + 20, y))
+        surface.blit(render_cached(self.font_small, diff_text, diff_color), (20, y))
         y += 35
         
-        pygame.draw.line(self.screen, TEXT_GRAY, (panel_x + 20, y), (panel_x + STATS_PANEL_WIDTH - 20, y), 1)
+        pygame.draw.line(surface, TEXT_GRAY, (20, y), (STATS_PANEL_WIDTH - 20, y), 1)
         y += 20
         
         # Predicted Goals
-        goals_title = self.font_small.render("Predicted Goals", True, TEXT_WHITE)
-        self.screen.blit(goals_title, (panel_x + 20, y))
+        goals_title = render_cached(self.font_small, "Predicted Goals", TEXT_WHITE)
+        surface.blit(goals_title, (20, y))
         y += 25
         
-        goal_events = [e for e in result.events if e.event_type == 'goal']
-        for event in goal_events[:8]:
+        # Only the first eight goals are listed: stop scanning there
+        goal_events = list(itertools.islice((e for e in result.events if e.event_type == 'goal'), 8))
+        for event in goal_events:
             color = TEAM_A_COLOR if event.team == 'home' else TEAM_B_COLOR
             event_text = f"{event.minute}'"
             team_name = result.home_team if event.team == 'home' else result.away_team
-            self.screen.blit(self.font_small.render(event_text, True, color), (panel_x + 20, y))
-            self.screen.blit(self.font_small.render(team_name[:15], True, TEXT_GRAY), (panel_x + 50, y))
+            surface.blit(render_cached(self.font_small, event_text, color), (20, y))
+            surface.blit(render_cached(self.font_small, team_name[:15], TEXT_GRAY), (50, y))
             y += 22
         
         if not goal_events:
-            self.screen.blit(self.font_small.render("0-0 Draw predicted", True, TEXT_DARK_GRAY), (panel_x + 20, y))
+            surface.blit(render_cached(self.font_small, "0-0 Draw predicted", TEXT_DARK_GRAY), (20, y))
+        
+        if pygame.display.get_surface() is not None:
+            surface = surface.convert()
+        return surface
+    
+    def _build_stats_panel_chrome(self, layout: str) -> pygame.Surface:
+        """
+        Pre-render the static parts of the player stats panel: background,
+        title and either the selection hint ('hint'), nothing more
+        ('player') or the separator and stat labels ('player_stats').
+        """
+        surface = pygame.Surface((STATS_PANEL_WIDTH, SCREEN_HEIGHT))
+        surface.fill(PANEL_BG)
+        surface.blit(render_cached(self.font_medium, "Player Stats", TEXT_WHITE), (20, 20))
+        
+        if layout == 'hint':
+            surface.blit(render_cached(self.font_small, "Click a player to", TEXT_DARK_GRAY), (20, 100))
+            surface.blit(render_cached(self.font_small, "view their stats", TEXT_DARK_GRAY), (20, 130))
+        elif layout == 'player_stats':
+            pygame.draw.line(surface, TEXT_GRAY, (20, STATS_SEPARATOR_Y), (STATS_PANEL_WIDTH - 20, STATS_SEPARATOR_Y), 1)
+            for label, row_y in zip(PLAYER_STAT_LABELS, STAT_ROW_YS):
+                surface.blit(render_cached(self.font_small, label, TEXT_GRAY), (20, row_y))
+        
+        if pygame.display.get_surface() is not None:
+            surface = surface.convert()
+        return surface
     
     def _draw_player_stats_panel(self, panel_x: int):
         """Draw player stats in the stats panel (original behavior)."""
-        # Title
-        title = self.font_medium.render("Player Stats", True, TEXT_WHITE)
-        self.screen.blit(title, (panel_x + 20, 20))
-        
-        if self.selected_player_id and self.selected_player_id in self.player_info:
-            player = self.player_info[self.selected_player_id]
-            y = 70
-            
-            # Player name
-            name = player.get('name', 'Unknown')
-            name_surface = self.font_medium.render(name, True, TEXT_WHITE)
-            self.screen.blit(name_surface, (panel_x + 20, y))
-            y += 40
-            
-            # Jersey and position
-            jersey = player.get('jersey_number', '?')
-            position = player.get('position', 'Unknown')
-            info_text = f"#{jersey} | {position}"
-            info_surface = self.font_small.render(info_text, True, TEXT_GRAY)
-            self.screen.blit(info_surface, (panel_x + 20, y))
-            y += 40
-            
-            # Team
-            team = player.get('team', 'Unknown')
-            team_surface = self.font_small.render(f"Team: {team}", True, TEXT_GRAY)
-            self.screen.blit(team_surface, (panel_x + 20, y))
-            y += 50
-            
-            # Stats
+        player = self.player_info.get(self.selected_player_id) if self.selected_player_id else None
+        if player is not None:
             stats = player.get('stats', {})
-            if stats:
-                pygame.draw.line(self.screen, TEXT_GRAY, (panel_x + 20, y), (panel_x + STATS_PANEL_WIDTH - 20, y), 1)
-                y += 30
-                
-                stat_lines = [
-                    ("Touches", stats.get('touches', 0)),
-                    ("Passes", f"{stats.get('passes_completed', 0)}/{stats.get('passes_attempted', 0)}"),
-                    ("Pass Acc.", stats.get('pass_completion', 'N/A')),
-                    ("Shots", stats.get('shots', 0)),
-                    ("Goals", stats.get('goals', 0)),
-                    ("Shot Acc.", stats.get('shot_accuracy', 'N/A')),
-                    ("Dribbles", stats.get('dribbles', 0)),
-                    ("Tackles", stats.get('tackles', 0)),
-                    ("Interceptions", stats.get('interceptions', 0))
-                ]
-                
-                for label, value in stat_lines:
-                    label_surface = self.font_small.render(label, True, TEXT_GRAY)
-                    self.screen.blit(label_surface, (panel_x + 20, y))
-                    
-                    value_surface = self.font_small.render(str(value), True, TEXT_WHITE)
-                    value_rect = value_surface.get_rect(right=panel_x + STATS_PANEL_WIDTH - 20)
-                    value_rect.y = y
-                    self.screen.blit(value_surface, value_rect)
-                    
-                    y += 35
+            layout = 'player_stats' if stats else 'player'
         else:
-            hint = self.font_small.render("Click a player to", True, TEXT_DARK_GRAY)
-            self.screen.blit(hint, (panel_x + 20, 100))
+            layout = 'hint'
+        
+        # Background, title, hint and stat labels (pre-rendered)
+        chrome = self._stats_panel_chrome.get(layout)
+        if chrome is None:
+            chrome = self._stats_panel_chrome[layout] = self._build_stats_panel_chrome(layout)
+        self.screen.blit(chrome, (panel_x, 0))
+        
+        if player is None:
+            return
+        
+        # Player details (all collected and blitted in one call)
+        y = 70
+        
+        # Player name
+        name = player.get('name', 'Unknown')
+        name_surface = render_cached(self.font_medium, name, TEXT_WHITE)
+        blit_seq = [(name_surface, (panel_x + 20, y))]
+        y += 40
+        
+        # Jersey and position
+        jersey = player.get('jersey_number', '?')
+        position = player.get('position', 'Unknown')
+        info_text = f"#{jersey} | {position}"
+        info_surface = render_cached(self.font_small, info_text, TEXT_GRAY)
+        blit_seq.append((info_surface, (panel_x + 20, y)))
+        y += 40
+        
+        # Team
+        team = player.get('team', 'Unknown')
+        team_surface = render_cached(self.font_small, f"Team: {team}", TEXT_GRAY)
+        blit_seq.append((team_surface, (panel_x + 20, y)))
+        
+        # Stat values, right-aligned next to their labels
+        if stats:
+            stat_values = (
+                stats.get('touches', 0),
+                f"{stats.get('passes_completed', 0)}/{stats.get('passes_attempted', 0)}",
+                stats.get('pass_completion', 'N/A'),
+                stats.get('shots', 0),
+                stats.get('goals', 0),
+                stats.get('shot_accuracy', 'N/A'),
+                stats.get('dribbles', 0),
+                stats.get('tackles', 0),
+                stats.get('interceptions', 0),
+            )
             
-            hint2 = self.font_small.render("view their stats", True, TEXT_DARK_GRAY)
-            self.screen.blit(hint2, (panel_x + 20, 130))
+            value_right = panel_x + STATS_PANEL_WIDTH - 20
+            for value, row_y in zip(stat_values, STAT_ROW_YS):
+                value_surface = render_cached(self.font_small, str(value), TEXT_WHITE)
+                blit_seq.append((value_surface, (value_right - value_surface.get_width(), row_y)))
+        
+        self.screen.blits(blit_seq, doreturn=False)
     
     def handle_menu_event(self, event) -> str:
         """
@@ -1205,44 +1891,64 @@ class Renderer:
         
         Returns action type: 'start', 'ml', or ''.
         """
+        # Only buttons and dropdowns live here; wheel events go to dropdowns only
+        if event.type not in DROPDOWN_EVENT_TYPES:
+            return ''
+        buttons = event.type in BUTTON_EVENT_TYPES
+        
+        # Skip motion outside every widget, unless the widgets still have to
+        # see the pointer leave (or a click/scroll may have changed them)
+        if event.type == pygame.MOUSEMOTION:
+            inside = self._menu_hit_area.collidepoint(event.pos)
+            was_inside, self._pointer_in_menu_widgets = self._pointer_in_menu_widgets, inside
+            if not (inside or was_inside):
+                return ''
+        else:
+            self._pointer_in_menu_widgets = True
+        
+        action = self._dispatch_menu_event(event, buttons)
+        if event.type == pygame.MOUSEBUTTONDOWN:
+            # Lists only open or close on clicks (mode switches included)
+            self._open_dropdowns = tuple(dropdown for dropdown in self._mode_dropdowns() if dropdown.is_open)
+        return action
+    
+    def _dispatch_menu_event(self, event, buttons: bool) -> str:
+        """Pass an event to the current mode's widgets; returns the menu action."""
         # ================================================================
         # MODE SELECTION BUTTONS (Always visible, handle first)
         # ================================================================
-        if self.mode_replay_button.handle_event(event):
-            if self.menu_mode != MODE_REPLAY:
-                self.menu_mode = MODE_REPLAY
-                self._reset_selections()
-            return ''
-        
-        if self.mode_ml_button.handle_event(event):
-            if self.menu_mode != MODE_ML:
-                self.menu_mode = MODE_ML
-                self._reset_selections()
-            return ''
+        if buttons:
+            if self.mode_replay_button.handle_event(event):
+                if self.menu_mode != MODE_REPLAY:
+                    self.menu_mode = MODE_REPLAY
+                    self._reset_selections()
+                return ''
+            
+            if self.mode_ml_button.handle_event(event):
+                if self.menu_mode != MODE_ML:
+                    self.menu_mode = MODE_ML
+                    self._reset_selections()
+                return ''
         
         # ================================================================
         # MODE-SPECIFIC CONTROLS
         # ================================================================
         if self.menu_mode == MODE_REPLAY:
             # Handle Replay mode dropdowns
-            self.competition_dropdown.handle_event(event)
-            self.season_dropdown.handle_event(event)
-            self.team_a_dropdown.handle_event(event)
-            self.team_b_dropdown.handle_event(event)
+            for dropdown in self._mode_dropdowns():
+                dropdown.handle_event(event)
             
             # Handle start button
-            if self.start_button.handle_event(event):
+            if buttons and self.start_button.handle_event(event):
                 return 'start'
                 
         elif self.menu_mode == MODE_ML:
             # Handle ML mode dropdowns
-            self.ml_competition_dropdown.handle_event(event)
-            self.ml_season_dropdown.handle_event(event)
-            self.ml_home_dropdown.handle_event(event)
-            self.ml_away_dropdown.handle_event(event)
+            for dropdown in self._mode_dropdowns():
+                dropdown.handle_event(event)
             
             # Handle ML button
-            if self.ml_button.handle_event(event):
+            if buttons and self.ml_button.handle_event(event):
                 return 'ml'
         
         return ''
@@ -1266,74 +1972,143 @@ class Renderer:
         # Clear ML result when switching modes
         self.ml_result = None
     
+    def _active_players(self, game_state: GameState) -> List[Tuple[str, PlayerState]]:
+        """
+        The (player_id, PlayerState) pairs currently on the pitch, in roster order.
+        
+        The list is only rebuilt when the players dict is replaced (seek),
+        or the engine reports a roster change (substitutes joining or
+        leaving) through game_state.roster_version, which only counts
+        within one players dict; positions are read through the live
+        PlayerState objects, so the snapshot never goes stale.
+        """
+        players = game_state.players
+        snapshot_of, size, version = self._players_snapshot_key
+        if players is not snapshot_of or len(players) != size or game_state.roster_version != version:
+            self._players_snapshot = [(player_id, player_state) for player_id, player_state in players.items()
+                                      if player_state.is_active]
+            self._players_snapshot_key = (players, len(players), game_state.roster_version)
+        return self._players_snapshot
+    
+    def _player_pixels(self, players: List[Tuple[str, PlayerState]],
+                       positions: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Screen pixel positions of (player_id, PlayerState) pairs as an (N, 2) int array.
+        
+        positions is the engine's own position array (GameState.positions);
+        when every player is active it lines up with players and is used as is.
+        """
+        if positions is not None and len(positions) == len(players):
+            return self.pitch.statsbomb_to_screen(positions)
+        
+        # Filling the columns from two flat lists is about twice as fast as
+        # np.array() over a list of (x, y) tuples
+        coords = np.empty((len(players), 2))
+        coords[:, 0] = [player_state.x for _, player_state in players]
+        coords[:, 1] = [player_state.y for _, player_state in players]
+        return self.pitch.statsbomb_to_screen(coords)
+    
     def handle_simulation_click(self, pos: Tuple[int, int], game_state: GameState) -> Optional[str]:
         """Handle click in simulation. Returns selected player_id."""
         if not self.pitch:
             return None
         
-        mx, my = pos
-        mx -= SIDEBAR_WIDTH
-        my -= 100
-        
-        for player_id, player_state in game_state.players.items():
-            px, py = self.pitch.statsbomb_to_pixels(player_state.x, player_state.y)
-            
-            distance = ((mx - px) ** 2 + (my - py) ** 2) ** 0.5
-            if distance <= PLAYER_RADIUS + 5:
-                self.selected_player_id = player_id
-                return player_id
+        # Hit-test what is on screen: the players and positions of the last
+        # drawn frame, falling back to game_state before the first frame
+        players, pixels = self._drawn_players
+        if not players:
+            players = self._active_players(game_state)
+            if not players:
+                return None
+            pixels = self._player_pixels(players, game_state.positions)
+        
+        # Screen-space offset from the click to every player at once
+        offsets = pixels - pos
+        
+        # Bounding-box reject first; only the few players inside it get the
+        # squared-distance test
+        near = np.flatnonzero((np.abs(offsets) <= PLAYER_HIT_RADIUS).all(axis=1))
+        if not near.size:
+            return None
+        near_offsets = offsets[near]
+        hits = near[(near_offsets * near_offsets).sum(axis=1) <= PLAYER_HIT_RADIUS * PLAYER_HIT_RADIUS]
+        if not hits.size:
+            return None
         
-        return None
+        # First match in roster order, as before
+        player_id = players[hits[0]][0]
+        self.selected_player_id = player_id
+        return player_id
         
     def handle_control_event(self, event, game_engine) -> bool:
         """
         Handle events for simulation controls. 
         Returns True if an action was taken.
         """
-        if not self.btn_play_pause:
+        play_pause = self.btn_play_pause
+        if not play_pause or event.type not in SEEK_BAR_EVENT_TYPES:
             return False
+        # Button-up only matters to the seek bar
+        buttons = event.type in BUTTON_EVENT_TYPES
+        
+        if event.type == pygame.MOUSEMOTION:
+            inside = self._controls_hit_area.collidepoint(event.pos)
+            was_inside, self._pointer_in_controls = self._pointer_in_controls, inside
+            if not (inside or was_inside or self.seek_bar.dragging):
+                return False
+        else:
+            self._pointer_in_controls = True
             
-        # Play/Pause
-        if self.btn_play_pause.handle_event(event):
-            # Toggle handled by caller looking at game engine state usually, 
-            # but we can return 'toggle' action or just modify here?
-            # Ideally main loop handles logic. We just report click.
-            return "toggle_pause"
+        if buttons:
+            # Play/Pause
+            if play_pause.handle_event(event):
+                # Toggle handled by caller looking at game engine state usually, 
+                # but we can return 'toggle' action or just modify here?
+                # Ideally main loop handles logic. We just report click.
+                return "toggle_pause"
             
-        # Speed
-        if self.btn_speed_1x.handle_event(event):
-            game_engine.set_playback_speed(1.0)
-            return True
-        if self.btn_speed_2x.handle_event(event):
-            game_engine.set_playback_speed(2.0)
-            return True
-        if self.btn_speed_4x.handle_event(event):
-            game_engine.set_playback_speed(4.0)
-            return True
+            # Speed
+            for button, speed in self._speed_buttons:
+                if button.handle_event(event):
+                    game_engine.set_playback_speed(speed)
+                    return True
             
         # Seek Bar
         seek_progress = self.seek_bar.handle_event(event)
         if seek_progress is not None:
-            # Seek to time (0-7500s covers 125 mins)
-            target_time = seek_progress * 7500.0
+            # Seek to time (the bar covers 125 mins)
+            target_time = seek_progress * SEEK_BAR_SECONDS
             game_engine.seek_to_time(target_time)
             return "seeking"
             
         return False
     
     def render(self, game_state: Optional[GameState] = None):
-        """Main render function."""
-        if self.state == UIState.MENU:
-            self.render_menu()
-        elif self.state == UIState.SIMULATION and game_state:
-            self.render_simulation(game_state)
-        elif self.state == UIState.ML_SIMULATION:
-            self.render_ml_simulation()
+        """Main render function. Fills self.dirty_rects for display.update()."""
+        # Periodically forget text nobody has drawn lately (old team names,
+        # stat values of previously selected players, ...)
+        self._frames_since_sweep += 1
+        if self._frames_since_sweep >= TEXT_CACHE_SWEEP_FRAMES:
+            sweep_text_cache()
+            self._frames_since_sweep = 0
+        
+        if self._state != self._rendered_state:
+            self._full_redraw = True
+        if self._full_redraw:
+            self._panel_sigs.clear()
+        
+        self.dirty_rects = []
+        if self._render_impl(game_state) is False:
+            return
+        
+        self._rendered_state = self._state
+        self._full_redraw = False
     
     def init_ml_simulation(self, ml_result):
         """Initialize ML simulation view."""
         self.state = UIState.ML_SIMULATION
         self.ml_result = ml_result
+        self._full_redraw = True
         
         # Create back and resimulate buttons
         self.ml_back_button = Button(
@@ -1351,43 +2126,66 @@ class Renderer:
             return 'resim'
         return ''
     
-    def render_ml_simulation(self):
-        """Render the ML simulation results screen."""
+    def render_ml_simulation(self, game_state: Optional[GameState] = None):
+        """Render the ML simulation results screen. game_state is ignored."""
         if not self.ml_result:
+            self.dirty_rects = [self.screen.get_rect()]
             return
         
-        result = self.ml_result
-        self.screen.fill(BACKGROUND_DARK)
+        # Everything but the two buttons is fixed for a given result: put it
+        # up once, then only repaint a button when its hover state changes
+        redraw_all = self._panel_changed('ml_screen', (self.ml_result,))
+        if redraw_all:
+            cached = self._bg_ml_simulation
+            if cached is None or cached[0] is not self.ml_result:
+                cached = (self.ml_result, self._build_ml_simulation_background(self.ml_result))
+                self._bg_ml_simulation = cached
+            self.screen.blit(cached[1], (0, 0))
+            self.dirty_rects = [self.screen.get_rect()]
+        
+        for name, button in (('ml_back', self.ml_back_button), ('ml_resim', self.ml_resim_button)):
+            if button and (self._panel_changed(name, button.visual_state()) or redraw_all):
+                # Button face including its 2px drop shadow
+                area = pygame.Rect(button.rect.topleft, (button.rect.width + 2, button.rect.height + 2))
+                if not redraw_all:
+                    self.screen.blit(self._bg_ml_simulation[1], area, area)
+                    self.dirty_rects.append(area)
+                button.draw(self.screen)
+    
+    def _build_ml_simulation_background(self, result) -> pygame.Surface:
+        """Pre-render the ML results screen for one result, minus its buttons."""
+        surface = pygame.Surface(self.screen.get_size())
+        surface.fill(BACKGROUND_DARK)
         
         # Left sidebar
-        pygame.draw.rect(self.screen, SIDEBAR_BG, (0, 0, SIDEBAR_WIDTH, SCREEN_HEIGHT))
+        pygame.draw.rect(surface, SIDEBAR_BG, (0, 0, SIDEBAR_WIDTH, SCREEN_HEIGHT))
         
         # Title
-        title = self.font_title.render("ML Match Prediction", True, TEXT_WHITE)
-        self.screen.blit(title, (20, 20))
+        title = render_cached(self.font_title, "ML Match Prediction", TEXT_WHITE)
+        surface.blit(title, (20, 20))
         
         # ELO Ratings section
         y = 90
-        elo_title = self.font_medium.render("ELO Ratings", True, HIGHLIGHT_YELLOW)
-        self.screen.blit(elo_title, (20, y))
+        elo_title = render_cached(self.font_medium, "ELO Ratings", HIGHLIGHT_YELLOW)
+        surface.blit(elo_title, (20, y))
         y += 35
         
-        home_elo_text = self.font_small.render(f"{result.home_team}: {result.home_elo:.0f}", True, TEXT_WHITE)
-        self.screen.blit(home_elo_text, (20, y))
+        home_elo_text = render_cached(self.font_small, f"{result.home_team}: {result.home_elo:.0f}", TEXT_WHITE)
+        surface.blit(home_elo_text, (20, y))
         y += 25
         
-        away_elo_text = self.font_small.render(f"{result.away_team}: {result.away_elo:.0f}", True, TEXT_WHITE)
-        self.screen.blit(away_elo_text, (20, y))
+        away_elo_text = render_cached(self.font_small, f"{result.away_team}: {result.away_elo:.0f}", TEXT_WHITE)
+        surface.blit(away_elo_text, (20, y))
         y += 25
         
         diff_color = (100, 255, 100) if result.elo_diff > 0 else (255, 100, 100) if result.elo_diff < 0 else TEXT_GRAY
-        diff_text = self.font_small.render(f"Difference: {result.elo_diff:+.0f}", True, diff_color)
-        self.screen.blit(diff_text, (20, y))
+        diff_text = render_cached(self.font_small, f"Difference: {result.elo_diff:+.0f}", diff_color)
+        surface.blit(diff_text, (20, y))
         y += 45
         
         # Probabilities section
-        prob_title = self.font_medium.render("Win Probability", True, HIGHLIGHT_YELLOW)
-        self.screen.blit(prob_title, (20, y))
+        prob_title = render_cached(self.font_medium, "Win Probability", HIGHLIGHT_YELLOW)
+        surface.blit(prob_title, (20, y))
         y += 35
         
         prob_data = [
@@ -1399,78 +2197,78 @@ class Renderer:
         for text, prob in prob_data:
             # Draw probability bar
             bar_width = int(220 * prob)
-            pygame.draw.rect(self.screen, (60, 60, 70), (20, y, 220, 20))
-            pygame.draw.rect(self.screen, HIGHLIGHT_YELLOW, (20, y, bar_width, 20))
+            pygame.draw.rect(surface, (60, 60, 70), (20, y, 220, 20))
+            pygame.draw.rect(surface, HIGHLIGHT_YELLOW, (20, y, bar_width, 20))
             
-            prob_text = self.font_small.render(text, True, TEXT_WHITE)
-            self.screen.blit(prob_text, (25, y + 2))
+            prob_text = render_cached(self.font_small, text, TEXT_WHITE)
+            surface.blit(prob_text, (25, y + 2))
             y += 30
         
         y += 20
         
         # Form statistics
-        form_title = self.font_medium.render("Recent Form", True, HIGHLIGHT_YELLOW)
-        self.screen.blit(form_title, (20, y))
+        form_title = render_cached(self.font_medium, "Recent Form", HIGHLIGHT_YELLOW)
+        surface.blit(form_title, (20, y))
         y += 30
         
         # Home team form
-        home_form_text = self.font_small.render(f"{result.home_team}:", True, TEXT_WHITE)
-        self.screen.blit(home_form_text, (20, y))
+        home_form_text = render_cached(self.font_small, f"{result.home_team}:", TEXT_WHITE)
+        surface.blit(home_form_text, (20, y))
         y += 22
         
+        form_lines = []
         for key, val in result.home_form.items():
-            stat_text = self.font_small.render(f"  {key}: {val}", True, TEXT_GRAY)
-            self.screen.blit(stat_text, (20, y))
+            form_lines.append((render_cached(self.font_small, f"  {key}: {val}", TEXT_GRAY), (20, y)))
             y += 20
+        surface.blits(form_lines, doreturn=False)
         y += 10
         
         # Away team form
-        away_form_text = self.font_small.render(f"{result.away_team}:", True, TEXT_WHITE)
-        self.screen.blit(away_form_text, (20, y))
+        away_form_text = render_cached(self.font_small, f"{result.away_team}:", TEXT_WHITE)
+        surface.blit(away_form_text, (20, y))
         y += 22
         
+        form_lines = []
         for key, val in result.away_form.items():
-            stat_text = self.font_small.render(f"  {key}: {val}", True, TEXT_GRAY)
-            self.screen.blit(stat_text, (20, y))
+            form_lines.append((render_cached(self.font_small, f"  {key}: {val}", TEXT_GRAY), (20, y)))
             y += 20
+        surface.blits(form_lines, doreturn=False)
         
         # Main content area - Score and Events
         content_x = SIDEBAR_WIDTH + 40
         
         # Match header
-        pygame.draw.rect(self.screen, PANEL_BG, (SIDEBAR_WIDTH, 0, SCREEN_WIDTH - SIDEBAR_WIDTH, 140))
+        pygame.draw.rect(surface, PANEL_BG, (SIDEBAR_WIDTH, 0, SCREEN_WIDTH - SIDEBAR_WIDTH, 140))
         
         # Team names and score
-        home_name = self.font_large.render(result.home_team, True, TEAM_A_COLOR)
-        away_name = self.font_large.render(result.away_team, True, TEAM_B_COLOR)
+        home_name = render_cached(self.font_large, result.home_team, TEAM_A_COLOR)
+        away_name = render_cached(self.font_large, result.away_team, TEAM_B_COLOR)
         
         center_x = SIDEBAR_WIDTH + (SCREEN_WIDTH - SIDEBAR_WIDTH) // 2
         
         # Home team name (left)
-        self.screen.blit(home_name, (center_x - 200 - home_name.get_width(), 40))
+        surface.blit(home_name, (center_x - 200 - home_name.get_width(), 40))
         
         # Score
         score_text = f"{result.home_goals} - {result.away_goals}"
-        score_surface = self.font_title.render(score_text, True, TEXT_WHITE)
+        score_surface = render_cached(self.font_title, score_text, TEXT_WHITE)
         score_rect = score_surface.get_rect(center=(center_x, 55))
-        self.screen.blit(score_surface, score_rect)
+        surface.blit(score_surface, score_rect)
         
         # Away team name (right)
-        self.screen.blit(away_name, (center_x + 200, 40))
+        surface.blit(away_name, (center_x + 200, 40))
         
         # Outcome badge
-        outcome_colors = {'H': (100, 200, 100), 'D': (200, 200, 100), 'A': (200, 100, 100)}
-        outcome_labels = {'H': 'HOME WIN', 'D': 'DRAW', 'A': 'AWAY WIN'}
-        outcome_color = outcome_colors.get(result.predicted_outcome, TEXT_GRAY)
-        outcome_text = outcome_labels.get(result.predicted_outcome, 'UNKNOWN')
+        outcome_color = OUTCOME_BADGE_COLORS.get(result.predicted_outcome, TEXT_GRAY)
+        outcome_text = OUTCOME_LABELS.get(result.predicted_outcome, 'UNKNOWN')
         
-        outcome_surface = self.font_medium.render(outcome_text, True, outcome_color)
+        outcome_surface = render_cached(self.font_medium, outcome_text, outcome_color)
         outcome_rect = outcome_surface.get_rect(center=(center_x, 100))
-        self.screen.blit(outcome_surface, outcome_rect)
+        surface.blit(outcome_surface, outcome_rect)
         
         # Match events timeline
-        events_title = self.font_medium.render("Match Events", True, TEXT_WHITE)
-        self.screen.blit(events_title, (content_x, 160))
+        events_title = render_cached(self.font_medium, "Match Events", TEXT_WHITE)
+        surface.blit(events_title, (content_x, 160))
         
         # Draw timeline
         timeline_y = 210
@@ -1478,42 +2276,49 @@ class Renderer:
         timeline_end = SCREEN_WIDTH - 100
         timeline_width = timeline_end - timeline_start
         
-        pygame.draw.line(self.screen, TEXT_GRAY, (timeline_start, timeline_y), (timeline_end, timeline_y), 2)
+        pygame.draw.line(surface, TEXT_GRAY, (timeline_start, timeline_y), (timeline_end, timeline_y), 2)
         
-        # Draw minute markers
+        # Draw minute markers (labels sit below the ticks, so they can go in one batch)
+        marker_labels = []
         for minute in [0, 15, 30, 45, 60, 75, 90]:
             x = timeline_start + int(timeline_width * minute / 90)
-            pygame.draw.line(self.screen, TEXT_GRAY, (x, timeline_y - 5), (x, timeline_y + 5), 1)
-            minute_text = self.font_small.render(str(minute), True, TEXT_DARK_GRAY)
-            self.screen.blit(minute_text, (x - 8, timeline_y + 10))
-        
-        # Draw events on timeline
-        for event in result.events:
-            x = timeline_start + int(timeline_width * min(event.minute, 90) / 90)
-            color = TEAM_A_COLOR if event.team == 'home' else TEAM_B_COLOR
+            pygame.draw.line(surface, TEXT_GRAY, (x, timeline_y - 5), (x, timeline_y + 5), 1)
+            minute_text = render_cached(self.font_small, str(minute), TEXT_DARK_GRAY)
+            marker_labels.append((minute_text, (x - 8, timeline_y + 10)))
+        surface.blits(marker_labels, doreturn=False)
+        
+        # Draw events on timeline (positions for all events in one go;
+        # minutes are whole numbers, so integer division matches int())
+        minutes = np.minimum(np.array([event.minute for event in result.events], dtype=np.int64), 90)
+        event_xs = (timeline_start + timeline_width * minutes // 90).tolist()
+        # Markers are pre-rendered; blit them all in event order
+        markers = self._timeline_markers
+        marker_seq = []
+        for event, x in zip(result.events, event_xs):
+            team = 'home' if event.team == 'home' else 'away'
             
             if event.event_type == 'goal':
-                pygame.draw.circle(self.screen, color, (x, timeline_y), 10)
-                pygame.draw.circle(self.screen, TEXT_WHITE, (x, timeline_y), 10, 2)
+                marker_seq.append((markers['goal', team], (x - 10, timeline_y - 10)))
             elif event.event_type == 'yellow_card':
-                pygame.draw.rect(self.screen, (255, 255, 0), (x - 4, timeline_y - 8, 8, 12))
+                marker_seq.append((markers['yellow_card', team], (x - 4, timeline_y - 8)))
+        surface.blits(marker_seq, doreturn=False)
         
         # Events list
         events_y = 260
+        event_rows = []
         for i, event in enumerate(result.events[:12]):  # Limit to 12 events
             event_color = TEAM_A_COLOR if event.team == 'home' else TEAM_B_COLOR
             minute_str = f"{event.minute}'"
             
-            minute_surface = self.font_small.render(minute_str, True, event_color)
-            self.screen.blit(minute_surface, (content_x, events_y))
+            minute_surface = render_cached(self.font_small, minute_str, event_color)
+            event_rows.append((minute_surface, (content_x, events_y)))
             
-            desc_surface = self.font_small.render(event.description, True, TEXT_WHITE)
-            self.screen.blit(desc_surface, (content_x + 50, events_y))
+            desc_surface = render_cached(self.font_small, event.description, TEXT_WHITE)
+            event_rows.append((desc_surface, (content_x + 50, events_y)))
             
             events_y += 28
+        surface.blits(event_rows, doreturn=False)
         
-        # Buttons
-        if self.ml_back_button:
-            self.ml_back_button.draw(self.screen)
-        if self.ml_resim_button:
-            self.ml_resim_button.draw(self.screen)
\ No newline at end of file
+        if pygame.display.get_surface() is not None:
+            surface = surface.convert()
+        return surface
\ No newline at end of file
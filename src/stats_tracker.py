@@ -3,9 +3,53 @@ Stats Tracker Module - Enhanced version
 Tracks comprehensive player statistics
 """
 
-from typing import Dict, List
-from collections import defaultdict
-from kloppy.domain import Event, EventType
+from typing import Dict, List, Tuple
+import numpy as np
+from kloppy.domain import Event, EventType, PassResult, ShotResult
+
+
+# Per-player counters, in the column order of EVENT_KIND_COUNTS and
+# StatsTracker.counts
+COUNTER_NAMES = ('passes_attempted', 'passes_completed', 'shots', 'shots_on_target',
+                 'goals', 'dribbles', 'tackles', 'interceptions', 'events', 'touches')
+
+# Event kinds, and what one event of each kind adds to every counter
+# (every event with a player is also a touch)
+KIND_OTHER, KIND_PASS, KIND_PASS_COMPLETE, KIND_SHOT, KIND_SHOT_ON_TARGET, KIND_GOAL, \
+    KIND_TAKE_ON, KIND_DUEL, KIND_INTERCEPTION = range(9)
+EVENT_KIND_COUNTS = np.array([
+    # pass, completed, shot, on target, goal, dribble, tackle, interception, event, touch
+    (0, 0, 0, 0, 0, 0, 0, 0, 1, 1),  # other
+    (1, 0, 0, 0, 0, 0, 0, 0, 1, 1),  # pass
+    (1, 1, 0, 0, 0, 0, 0, 0, 1, 1),  # completed pass
+    (0, 0, 1, 0, 0, 0, 0, 0, 1, 1),  # shot
+    (0, 0, 1, 1, 0, 0, 0, 0, 1, 1),  # shot on target
+    (0, 0, 1, 1, 1, 0, 0, 0, 1, 1),  # goal
+    (0, 0, 0, 0, 0, 1, 0, 0, 1, 1),  # take-on
+    (0, 0, 0, 0, 0, 0, 1, 0, 1, 1),  # duel
+    (0, 0, 0, 0, 0, 0, 0, 1, 1, 1),  # interception
+], dtype=np.int64)
+NUM_KINDS = len(EVENT_KIND_COUNTS)
+
+EVENT_TYPE_KINDS = {
+    EventType.PASS: KIND_PASS,
+    EventType.SHOT: KIND_SHOT,
+    EventType.TAKE_ON: KIND_TAKE_ON,
+    EventType.DUEL: KIND_DUEL,
+    EventType.INTERCEPTION: KIND_INTERCEPTION,
+}
+
+# Outcomes that refine a pass or shot's kind. Keyed by the result enum
+# members themselves, so a lookup needs no name string.
+RESULT_KINDS = {
+    PassResult.COMPLETE: KIND_PASS_COMPLETE,
+    ShotResult.GOAL: KIND_GOAL,
+    ShotResult.OWN_GOAL: KIND_GOAL,
+    ShotResult.SAVED: KIND_SHOT_ON_TARGET,
+    ShotResult.POST: KIND_SHOT_ON_TARGET,
+}
+# Only these kinds have outcomes worth looking up
+REFINED_KINDS = frozenset({KIND_PASS, KIND_SHOT})
 
 
 class StatsTracker:
@@ -13,86 +57,145 @@ class StatsTracker:
     
     def __init__(self):
         """Initialize the stats tracker."""
-        self.player_stats: Dict[str, Dict] = defaultdict(lambda: {
-            'name': '',
-            'team': '',
-            'jersey_number': '?',
-            'position': 'Unknown',
-            'passes_attempted': 0,
-            'passes_completed': 0,
-            'shots': 0,
-            'shots_on_target': 0,
-            'goals': 0,
-            'dribbles': 0,
-            'tackles': 0,
-            'interceptions': 0,
-            'events': 0,
-            'touches': 0
-        })
+        # Name, team, jersey number and position per player, and the players
+        # still without a name (filled in once a batch's player_info has them)
+        self.player_details: Dict[str, Dict] = {}
+        self._unnamed = set()
+        # Counters as a NumPy table, one row per player and one column per
+        # COUNTER_NAMES entry, so a whole batch is added in one operation
+        self.player_rows: Dict[str, int] = {}
+        self.counts = np.zeros((0, len(COUNTER_NAMES)), dtype=np.int64)
         
         self.events_processed = 0
+        # (event count, first event id, last event id) of the last batch counted
+        self._last_batch_key = None
+        
+        # get_player_stats() / player_stats results, rebuilt once
+        # process_events() has run again
+        self._version = 0
+        self._derived_cache: Dict[str, Tuple[int, Dict]] = {}
+        self._player_stats_view: Tuple[int, Dict[str, Dict]] = (-1, {})
     
     def process_events(self, events: List[Event], player_info: Dict[str, Dict]):
-        """Process all events and aggregate statistics."""
+        """
+        Process all events and aggregate statistics.
+        
+        Passing the batch just counted again (same length, same first and
+        last event id) is a no-op rather than counting everything twice.
+        Batches whose events carry no event_id are always counted.
+        """
+        batch_key = None
+        if events:
+            first_id = getattr(events[0], 'event_id', None)
+            last_id = getattr(events[-1], 'event_id', None)
+            if first_id is not None and last_id is not None:
+                batch_key = (len(events), first_id, last_id)
+                if batch_key == self._last_batch_key:
+                    return
+        self._last_batch_key = batch_key
+        
         print("Processing match events for statistics...")
         
+        # One pass to classify every event, then all the counting at once:
+        # bincount the (player row, kind) slots and expand kinds into counters
+        player_rows = self.player_rows
+        unnamed = self._unnamed
+        slots = []
+        add_slot = slots.append
         for event in events:
-            if not event.player:
+            player = event.player
+            if not player:
                 continue
             
-            player_id = event.player.player_id
-            
-            # Initialize player info if first time seeing them
-            if not self.player_stats[player_id]['name'] and player_id in player_info:
-                info = player_info[player_id]
-                self.player_stats[player_id]['name'] = info.get('name', 'Unknown')
-                self.player_stats[player_id]['team'] = info.get('team', 'Unknown')
-                self.player_stats[player_id]['jersey_number'] = info.get('jersey_number', '?')
-                self.player_stats[player_id]['position'] = info.get('position', 'Unknown')
-            
-            # Count touch
-            self.player_stats[player_id]['touches'] += 1
-            self.player_stats[player_id]['events'] += 1
-            
-            # Process by event type
-            if event.event_type == EventType.PASS:
-                self.player_stats[player_id]['passes_attempted'] += 1
-                
-                if hasattr(event, 'result') and event.result:
-                    result_str = str(event.result.name).upper()
-                    if 'COMPLETE' in result_str or 'SUCCESS' in result_str:
-                        self.player_stats[player_id]['passes_completed'] += 1
-            
-            elif event.event_type == EventType.SHOT:
-                self.player_stats[player_id]['shots'] += 1
-                
-                if hasattr(event, 'result') and event.result:
-                    result_str = str(event.result.name).upper()
-                    if 'GOAL' in result_str:
-                        self.player_stats[player_id]['goals'] += 1
-                        self.player_stats[player_id]['shots_on_target'] += 1
-                    elif 'SAVED' in result_str or 'POST' in result_str:
-                        self.player_stats[player_id]['shots_on_target'] += 1
+            player_id = player.player_id
+            row = player_rows.get(player_id)
+            if row is None:
+                row = player_rows[player_id] = len(player_rows)
+                self.player_details[player_id] = {'name': '', 'team': '', 'jersey_number': '?', 'position': 'Unknown'}
+                unnamed.add(player_id)
             
-            elif event.event_type == EventType.TAKE_ON:
-                self.player_stats[player_id]['dribbles'] += 1
+            # Player info as soon as a batch has it
+            if player_id in unnamed:
+                info = player_info.get(player_id)
+                if info is not None:
+                    details = self.player_details[player_id]
+                    details['name'] = info.get('name', 'Unknown')
+                    details['team'] = info.get('team', 'Unknown')
+                    details['jersey_number'] = info.get('jersey_number', '?')
+                    details['position'] = info.get('position', 'Unknown')
+                    if details['name']:
+                        unnamed.discard(player_id)
             
-            elif event.event_type == EventType.DUEL:
-                self.player_stats[player_id]['tackles'] += 1
-            
-            elif event.event_type == EventType.INTERCEPTION:
-                self.player_stats[player_id]['interceptions'] += 1
-            
-            self.events_processed += 1
+            kind = EVENT_TYPE_KINDS.get(event.event_type, KIND_OTHER)
+            if kind in REFINED_KINDS:
+                result = getattr(event, 'result', None)
+                if result:
+                    kind = RESULT_KINDS.get(result, kind)
+            add_slot(row * NUM_KINDS + kind)
+        
+        num_players = len(player_rows)
+        kind_counts = np.bincount(np.array(slots, dtype=np.int64),
+                                  minlength=num_players * NUM_KINDS).reshape(-1, NUM_KINDS)
+        if num_players > len(self.counts):
+            new_rows = np.zeros((num_players - len(self.counts), len(COUNTER_NAMES)), dtype=np.int64)
+            self.counts = np.vstack((self.counts, new_rows))
+        self.counts += kind_counts @ EVENT_KIND_COUNTS
+        
+        self.events_processed += len(slots)
+        self._version += 1
+        
+        print(f"✓ Processed {self.events_processed} events for {len(self.player_rows)} players")
+    
+    @property
+    def player_stats(self) -> Dict[str, Dict]:
+        """
+        Details and raw counters per player, as a dict of dicts.
         
-        print(f"✓ Processed {self.events_processed} events for {len(self.player_stats)} players")
+        Read-only view built from player_details and counts; it is shared
+        until the next process_events().
+        """
+        version, view = self._player_stats_view
+        if version != self._version:
+            counts = self.counts.tolist()
+            view = {player_id: {**self.player_details[player_id], **dict(zip(COUNTER_NAMES, counts[row]))}
+                    for player_id, row in self.player_rows.items()}
+            self._player_stats_view = (self._version, view)
+        return view
+    
+    def get_top_players(self, stat_name: str, limit: int = 5) -> List[Tuple[str, str, int]]:
+        """(player id, name, value) of the players highest in one counter, best first."""
+        column = self.counts[:, COUNTER_NAMES.index(stat_name)]
+        if limit <= 0 or not len(column):
+            return []
+        
+        # Partial selection of the top rows, then sort just those
+        if limit < len(column):
+            top_rows = np.argpartition(-column, limit - 1)[:limit]
+        else:
+            top_rows = np.arange(len(column))
+        top_rows = top_rows[np.argsort(-column[top_rows], kind='stable')]
+        
+        player_ids = list(self.player_rows)  # in row order
+        return [(player_ids[row], self.player_details[player_ids[row]]['name'], int(column[row]))
+                for row in top_rows.tolist()]
     
     def get_player_stats(self, player_id: str) -> Dict:
-        """Get formatted statistics for a player."""
-        if player_id not in self.player_stats:
+        """
+        Get formatted statistics for a player.
+        
+        The dict is shared between calls until the next process_events(),
+        so treat it as read-only.
+        """
+        row = self.player_rows.get(player_id)
+        if row is None:
             return {}
         
-        stats = dict(self.player_stats[player_id])
+        cached = self._derived_cache.get(player_id)
+        if cached is not None and cached[0] == self._version:
+            return cached[1]
+        
+        stats = dict(self.player_details[player_id])
+        stats.update(zip(COUNTER_NAMES, self.counts[row].tolist()))
         
         # Calculate percentages
         if stats['passes_attempted'] > 0:
@@ -107,4 +210,5 @@ class StatsTracker:
         else:
             stats['shot_accuracy'] = "N/A"
         
+        self._derived_cache[player_id] = (self._version, stats)
         return stats
\ No newline at end of file
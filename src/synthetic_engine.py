@@ -3,14 +3,22 @@ Synthetic Game Engine - Simplified engine for ML-driven simulations
 Uses synthetic match data instead of real StatsBomb events.
 """
 
-import random
-import math
+from bisect import bisect_right
 from dataclasses import dataclass
 from typing import Dict, Optional
 
+import numpy as np
+
 from src.game_engine import PlayerState, BallState, GameState
 from src.synthetic_match import SyntheticDataset, SyntheticEvent
 
+# Random target offsets (x, y) drawn on each event, indexed by whether the
+# player's team has the ball: defenders drift around their base position,
+# attackers push on from the ball
+TARGET_OFFSET_LOW = np.array([[-10.0, -10.0], [-15.0, -10.0]])
+TARGET_OFFSET_HIGH = np.array([[10.0, 10.0], [25.0, 10.0]])
+TARGET_MIN = (5.0, 5.0)
+TARGET_MAX = (115.0, 75.0)
 
 class SyntheticGameEngine:
     """
@@ -23,21 +31,26 @@ class SyntheticGameEngine:
         self.dataset = dataset
         self.ml_result = ml_result
         self.events = dataset.events
+        self._event_times = [event.timestamp for event in self.events]  # sorted, for bisection
         
         # Teams
         self.home_team = dataset.home_team
         self.away_team = dataset.away_team
+        self._home_team_id = self.home_team.team_id
+        # player_id -> base formation position, and player_id -> team_id
+        roster = self.home_team.players + self.away_team.players
+        self._base_positions = {player.player_id: (player.base_x, player.base_y) for player in roster}
+        self._team_of = {player.player_id: player.team_id for player in roster}
         
         # Playback state
         self.current_timestamp = 0.0
-        self.current_event_index = 0
+        self._set_event_index(0)
         self.playback_speed = 1.0
+        self._rng = np.random.default_rng()
         
         # Initialize game state
         self.current_state = self._initialize_game_state()
-        
-        # Cache player positions for interpolation
-        self._player_targets = {}  # player_id -> (target_x, target_y, start_time)
+        self._init_positions()
         
         print(f"[+] Synthetic Engine initialized")
         print(f"  * {len(self.events)} events to process")
@@ -75,24 +88,45 @@ class SyntheticGameEngine:
             period=1,
             score_home=0,
             score_away=0,
-            possession_team=self.home_team.team_id,
+            possession_team=self._home_team_id,
             players=players,
             ball=ball,
             last_event=None
         )
     
+    def _init_positions(self):
+        """
+        Mirror the players' positions into NumPy arrays for movement.
+        
+        Positions and movement targets are (N, 2) arrays with one row per
+        player, in current_state.players order, so a whole frame's movement
+        is a few array operations. Moved players get their new x/y written
+        back to their PlayerState; the position array itself is shared as
+        current_state.positions.
+        """
+        players = self.current_state.players
+        self._player_index = {player_id: i for i, player_id in enumerate(players)}
+        self._player_states = list(players.values())
+        self._pos = np.array([(state.x, state.y) for state in self._player_states], dtype=float).reshape(-1, 2)
+        self._tgt = self._pos.copy()  # nobody moves until an event sets a target
+        self._base = np.array([self._get_player_base(player_id) for player_id in players], dtype=float).reshape(-1, 2)
+        # Row masks per team: an event's possession mask is one of the two
+        self._home_rows = np.array([self._team_of[player_id] == self._home_team_id for player_id in players], dtype=bool)
+        self._away_rows = ~self._home_rows
+        self._moving = False  # any player still short of their target
+        # Hand the renderer the live array; it is only ever updated in place
+        self.current_state.positions = self._pos
+    
     def update(self, dt: float) -> GameState:
         """Update the game state by time delta."""
         self.current_timestamp += dt * self.playback_speed
         
-        # Process events
-        while self.current_event_index < len(self.events):
-            event = self.events[self.current_event_index]
-            if event.timestamp <= self.current_timestamp:
+        # Process events that have come due
+        if self.current_timestamp >= self._next_event_time:
+            end = bisect_right(self._event_times, self.current_timestamp, self.current_event_index)
+            for event in self.events[self.current_event_index:end]:
                 self._process_event(event)
-                self.current_event_index += 1
-            else:
-                break
+            self._set_event_index(end)
         
         # Update player and ball positions (smooth interpolation)
         self._update_positions(dt)
@@ -102,14 +136,26 @@ class SyntheticGameEngine:
         
         return self.current_state
     
+    def _set_event_index(self, index: int):
+        """Make events[index] the next event, noting when it comes due."""
+        self.current_event_index = index
+        self._next_event_time = self._event_times[index] if index < len(self._event_times) else float('inf')
+    
     def _process_event(self, event: SyntheticEvent):
         """Process a synthetic event."""
+        self._apply_event(event)
+        
+        # Move nearby players toward the event
+        self._update_player_targets(event)
+    
+    def _apply_event(self, event: SyntheticEvent):
+        """Apply an event's period, possession, score and ball position."""
         self.current_state.period = event.period
         self.current_state.possession_team = event.team_id
         
         # Update score on goals
         if event.event_type == 'goal':
-            if event.team_id == self.home_team.team_id:
+            if event.team_id == self._home_team_id:
                 self.current_state.score_home += 1
             else:
                 self.current_state.score_away += 1
@@ -118,70 +164,96 @@ class SyntheticGameEngine:
         # Set ball position to event location
         self.current_state.ball.x = event.x
         self.current_state.ball.y = event.y
-        
-        # Move nearby players toward the event
-        self._update_player_targets(event)
     
     def _update_player_targets(self, event: SyntheticEvent):
         """Set player movement targets based on event."""
-        for player_id, player_state in self.current_state.players.items():
-            # Find the player's base position
-            base_x, base_y = self._get_player_base(player_id)
-            
-            # Determine target based on event and team
-            is_possession_team = event.team_id in player_id
-            
-            if is_possession_team:
-                # Move toward ball / attack
-                offset_x = random.uniform(-15, 25)
-                offset_y = random.uniform(-10, 10)
-                target_x = min(115, max(5, event.x + offset_x))
-                target_y = min(75, max(5, event.y + offset_y))
-            else:
-                # Move back toward defensive position
-                offset_x = random.uniform(-10, 10)
-                offset_y = random.uniform(-10, 10)
-                target_x = min(115, max(5, base_x + offset_x))
-                target_y = min(75, max(5, base_y + offset_y))
-            
-            self._player_targets[player_id] = (target_x, target_y, self.current_timestamp)
+        # Possession team moves toward the ball / attacks, the other team
+        # moves back toward its defensive positions
+        is_possession_team = self._home_rows if event.team_id == self._home_team_id else self._away_rows
+        anchor = np.where(is_possession_team[:, None], (event.x, event.y), self._base)
+        side = is_possession_team.astype(np.intp)
+        offsets = self._rng.uniform(TARGET_OFFSET_LOW[side], TARGET_OFFSET_HIGH[side])
+        np.clip(anchor + offsets, TARGET_MIN, TARGET_MAX, out=self._tgt)
+        self._moving = True
     
     def _get_player_base(self, player_id: str) -> tuple:
         """Get player's base formation position."""
-        for player in self.home_team.players + self.away_team.players:
-            if player.player_id == player_id:
-                return player.base_x, player.base_y
-        return 60, 40  # Default to center
+        return self._base_positions.get(player_id, (60, 40))  # Default to center
     
     def _update_positions(self, dt: float):
         """Smoothly interpolate player positions toward targets."""
+        # Between events everyone settles at their target; nothing to do
+        # until the next event hands out new ones
+        if not self._moving:
+            return
+        
         speed = 30.0 * dt  # Movement speed
         
-        for player_id, player_state in self.current_state.players.items():
-            if player_id in self._player_targets:
-                target_x, target_y, _ = self._player_targets[player_id]
-                
-                # Move toward target
-                dx = target_x - player_state.x
-                dy = target_y - player_state.y
-                dist = math.sqrt(dx*dx + dy*dy)
-                
-                if dist > 1:
-                    move = min(speed, dist)
-                    player_state.x += (dx / dist) * move
-                    player_state.y += (dy / dist) * move
+        # Move every player toward their target at once; players within
+        # 1 unit of it get a zero step rather than a branch of their own
+        pos = self._pos
+        delta = self._tgt - pos
+        dist = np.hypot(delta[:, 0], delta[:, 1])
+        moving = dist > 1
+        if not moving.any():
+            self._moving = False
+            return
+        
+        step = np.where(moving, np.minimum(speed, dist) / np.maximum(dist, 1e-9), 0.0)
+        pos += delta * step[:, None]
+        
+        for state, (x, y) in zip(self._player_states, pos.tolist()):
+            state.x = x
+            state.y = y
+    
+    def _reset_state(self):
+        """Put the current state back to kick-off, reusing its objects."""
+        state = self.current_state
+        state.timestamp = 0.0
+        state.period = 1
+        state.score_home = 0
+        state.score_away = 0
+        state.possession_team = self._home_team_id
+        state.last_event = None
+        
+        ball = state.ball
+        ball.x, ball.y, ball.z, ball.in_play = 60, 40, 0, True
+        
+        # Everyone back on their base position, standing still
+        self._pos[:] = self._base
+        self._tgt[:] = self._base
+        self._moving = False
+        for player_state, (x, y) in zip(self._player_states, self._base.tolist()):
+            player_state.x = x
+            player_state.y = y
+            player_state.has_ball = False
+            player_state.is_active = True
     
     def seek_to_time(self, target_time: float):
         """Seek to a specific time in the simulation."""
         # Reset if seeking backwards
         if target_time < self.current_timestamp:
-            self.current_event_index = 0
+            self._set_event_index(0)
             self.current_timestamp = 0.0
-            self.current_state = self._initialize_game_state()
+            self._reset_state()
         
-        # Fast-forward to target time
-        while self.current_timestamp < target_time:
-            self.update(0.1)
+        # Jump straight to the target time: replay the skipped events'
+        # score/possession/ball changes, then put players at the targets
+        # handed out by the last of them
+        end = bisect_right(self._event_times, target_time)
+        if end > self.current_event_index:
+            for event in self.events[self.current_event_index:end]:
+                self._apply_event(event)
+            self._set_event_index(end)
+            self._update_player_targets(self.events[end - 1])
+            self._pos[:] = self._tgt
+            self._moving = False
+            for state, (x, y) in zip(self._player_states, self._pos.tolist()):
+                state.x = x
+                state.y = y
+        
+        self.current_timestamp = max(self.current_timestamp, target_time)
+        self.current_state.timestamp = self.current_timestamp
     
     def is_finished(self) -> bool:
         """Check if the simulation is finished."""
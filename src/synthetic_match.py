@@ -3,17 +3,24 @@ Synthetic Match Generator - Creates GameEngine-compatible data from ML predictio
 Enables visual simulation (pitch, players, ball) driven by ML prediction results.
 """
 
-import random
 import math
+from bisect import bisect_right
+from collections import namedtuple
+from operator import attrgetter
 from dataclasses import dataclass, field
 from typing import List, Dict, Tuple, Optional
 from enum import Enum
 
+import numpy as np
+
 # Import ML result type
 from src.ml_simulator import MLMatchResult, MatchEvent
 
+# Lightweight stand-in for kloppy's Period (only .id is read)
+Period = namedtuple('Period', 'id')
 
-@dataclass
+
+@dataclass(slots=True)
 class SyntheticPlayer:
     """A synthetic player for the simulation."""
     player_id: str
@@ -25,7 +32,7 @@ class SyntheticPlayer:
     base_y: float
 
 
-@dataclass
+@dataclass(slots=True)
 class SyntheticTeam:
     """A synthetic team."""
     team_id: str
@@ -33,7 +40,7 @@ class SyntheticTeam:
     players: List[SyntheticPlayer] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class SyntheticEvent:
     """A synthetic match event compatible with GameEngine."""
     timestamp: float  # Seconds from start
@@ -45,8 +52,9 @@ class SyntheticEvent:
     y: float
     
     # For compatibility with kloppy Event
-    def __post_init__(self):
-        self.period_obj = type('Period', (), {'id': self.period})()
+    @property
+    def period_obj(self) -> Period:
+        return Period(self.period)
 
 
 @dataclass
@@ -82,8 +90,10 @@ class SyntheticMatchGenerator:
     - Ball movement based on events
     """
     
-    def __init__(self):
+    def __init__(self, seed: Optional[int] = None):
         self.match_duration = 90 * 60  # 90 minutes in seconds
+        # Single generator for all event sampling (seedable for tests)
+        self._rng = np.random.default_rng(seed)
     
     def generate(self, ml_result: MLMatchResult) -> SyntheticDataset:
         """
@@ -175,49 +185,66 @@ class SyntheticMatchGenerator:
         
         # Generate passes and build-up play throughout the match
         current_time = 10.0  # Start 10 seconds in
+        current_period = 1
         possession = 'home'
         
+        # Attackers per side and goal times (seconds), sorted for bisection
+        attackers_by_side = {
+            side: [p for p in team.players if p.position in ('Forward', 'Midfielder')]
+            for side, team in (('home', home_team), ('away', away_team))
+        }
+        goal_times = sorted(e.minute * 60 for e in ml_result.events if e.event_type == 'goal')
+        
+        # All the randomness up front, one row per step of play: at least 5s
+        # passes between steps, which bounds how many there can be
+        draws = self._rng.random((int(self.match_duration / 5) + 1, 5))
+        picks = draws[:, 0].tolist()                                 # which attacker
+        shifts_x = ((draws[:, 1] * 41).astype(int) - 20).tolist()    # pass x offset, -20..20
+        shifts_y = ((draws[:, 2] * 31).astype(int) - 15).tolist()    # pass y offset, -15..15
+        goal_shifts_y = ((draws[:, 2] * 21).astype(int) - 10).tolist()  # goal y offset, -10..10
+        turnovers = (draws[:, 3] < 0.15).tolist()                   # possession changes
+        gaps = (5 + 10 * draws[:, 4]).tolist()                       # 5-15 seconds between events
+        step = 0
+        
         while current_time < self.match_duration:
+            if current_period == 1 and current_time >= 45*60:
+                current_period = 2
+            
             # Generate a passage of play
             team = home_team if possession == 'home' else away_team
-            opp_team = away_team if possession == 'home' else home_team
             
             # Pick a random attacker
-            attackers = [p for p in team.players if 'Forward' in p.position or 'Midfielder' in p.position]
-            player = random.choice(attackers)
+            attackers = attackers_by_side[possession]
+            player = attackers[int(picks[step] * len(attackers))]
             
-            # Is this a goal moment?
-            is_goal_moment = False
-            for ml_event in ml_result.events:
-                if ml_event.event_type == 'goal':
-                    goal_time = ml_event.minute * 60  # Convert to seconds
-                    if abs(current_time - goal_time) < 30:
-                        is_goal_moment = True
-                        # Generate a shot/goal
-                        goal_x = 115 if possession == 'home' else 5
-                        events.append(SyntheticEvent(
-                            timestamp=goal_time,
-                            period=1 if goal_time < 45*60 else 2,
-                            event_type='goal',
-                            team_id=team.team_id,
-                            player_id=player.player_id,
-                            x=goal_x,
-                            y=40 + random.randint(-10, 10)
-                        ))
-                        current_time = goal_time + 60  # Skip ahead
-                        break
-            
-            if not is_goal_moment:
+            # Is this a goal moment? (a goal less than 30s either side)
+            i = bisect_right(goal_times, current_time - 30)
+            is_goal_moment = i < len(goal_times) and goal_times[i] < current_time + 30
+            if is_goal_moment:
+                goal_time = goal_times[i]
+                # Generate a shot/goal
+                goal_x = 115 if possession == 'home' else 5
+                events.append(SyntheticEvent(
+                    timestamp=goal_time,
+                    period=1 if goal_time < 45*60 else 2,
+                    event_type='goal',
+                    team_id=team.team_id,
+                    player_id=player.player_id,
+                    x=goal_x,
+                    y=40 + goal_shifts_y[step]
+                ))
+                current_time = goal_time + 60  # Skip ahead
+            else:
                 # Generate a pass
                 direction = 1 if possession == 'home' else -1
-                x = player.base_x + random.randint(-20, 20) * direction
+                x = player.base_x + shifts_x[step] * direction
                 x = max(5, min(115, x))
-                y = player.base_y + random.randint(-15, 15)
+                y = player.base_y + shifts_y[step]
                 y = max(5, min(75, y))
                 
                 events.append(SyntheticEvent(
                     timestamp=current_time,
-                    period=1 if current_time < 45*60 else 2,
+                    period=current_period,
                     event_type='pass',
                     team_id=team.team_id,
                     player_id=player.player_id,
@@ -225,10 +252,11 @@ class SyntheticMatchGenerator:
                 ))
                 
                 # Occasionally change possession
-                if random.random() < 0.15:
+                if turnovers[step]:
                     possession = 'away' if possession == 'home' else 'home'
             
-            current_time += random.uniform(5, 15)  # 5-15 seconds between events
+            current_time += gaps[step]
+            step += 1
         
         # Half-time marker
         events.append(SyntheticEvent(
@@ -240,8 +268,9 @@ class SyntheticMatchGenerator:
             x=60, y=40
         ))
         
-        # Sort by time
-        events.sort(key=lambda e: e.timestamp)
+        # Sort by time (goals are backdated to their minute, so the loop's
+        # output is only nearly sorted)
+        events.sort(key=attrgetter('timestamp'))
         
         return events
 
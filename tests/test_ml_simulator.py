@@ -0,0 +1,89 @@
+"""
+Test suite for the ML match simulator.
+"""
+
+import os
+import sys
+import numpy as np
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+
+def test_compiled_forest_matches_sklearn():
+    """Test CompiledForest reproduces RandomForestClassifier.predict_proba."""
+    from src.ml_simulator import get_ml_simulator
+
+    sim = get_ml_simulator()
+
+    rng = np.random.default_rng(0)
+    X = np.column_stack([
+        rng.uniform(-400, 400, 256),
+        rng.integers(0, 30, (256, 6)),
+    ])
+
+    expected = sim.model.predict_proba(X)
+    actual = sim.predictor.predict_proba(X)
+
+    assert actual.shape == expected.shape
+    assert np.allclose(actual, expected), np.abs(actual - expected).max()
+
+    print("[PASS] CompiledForest parity test passed")
+
+
+def test_simulate_match_probabilities():
+    """Test simulate_match returns normalized outcome probabilities."""
+    from src.ml_simulator import get_ml_simulator
+
+    sim = get_ml_simulator()
+    home, away = sim.get_teams()[:2]
+
+    result = sim.simulate_match(home, away)
+
+    total = result.home_win_prob + result.draw_prob + result.away_win_prob
+    assert abs(total - 1.0) < 0.01
+    assert result.predicted_outcome in ('H', 'D', 'A')
+    assert len([e for e in result.events if e.event_type == 'goal']) == \
+        result.home_goals + result.away_goals
+
+    print("[PASS] simulate_match probability test passed")
+
+
+def test_simulate_matches_batch():
+    """Test simulate_matches returns one consistent result per fixture."""
+    from src.ml_simulator import MLSimulator
+
+    sim = MLSimulator(seed=7)
+    teams = sim.get_teams()
+    pairs = [(h, a) for h in teams[:5] for a in teams[:5] if h != a]
+
+    results = sim.simulate_matches(pairs)
+
+    assert len(results) == len(pairs)
+    for (home, away), result in zip(pairs, results):
+        assert (result.home_team, result.away_team) == (home, away)
+        if result.predicted_outcome == 'H':
+            assert result.home_goals > result.away_goals
+        elif result.predicted_outcome == 'A':
+            assert result.away_goals > result.home_goals
+        else:
+            assert result.home_goals == result.away_goals
+
+    print("[PASS] simulate_matches batch test passed")
+
+
+def test_team_stats_dict_view():
+    """team_stats mirrors the per-team record array as a dict of dicts."""
+    from src.ml_simulator import get_ml_simulator
+
+    sim = get_ml_simulator()
+    stats = sim.team_stats
+
+    assert sorted(stats) == sorted(sim.get_teams())
+    for team, i in sim._team_index.items():
+        record = sim._team_stats_np[i]
+        assert stats[team] == {name: float(record[name]) for name in record.dtype.names}
+    # Built once, not on every access
+    assert sim.team_stats is stats
+
+    print("[PASS] team_stats view test passed")
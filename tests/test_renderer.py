@@ -0,0 +1,143 @@
+"""
+Test suite for the simulation renderer.
+"""
+
+import os
+import sys
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+
+def _make_renderer():
+    """Renderer on a headless display, with a two-player simulation set up."""
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    import pygame
+    from src.config import SCREEN_WIDTH, SCREEN_HEIGHT
+    from src.renderer import Renderer
+
+    pygame.init()
+    screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    renderer = Renderer(screen)
+    player_info = {
+        'p1': {'name': 'Home Player', 'jersey_number': 9, 'position': 'Forward', 'team': 'Home'},
+        'p2': {'name': 'Away Player', 'jersey_number': 1, 'position': 'Goalkeeper', 'team': 'Away'},
+    }
+    renderer.init_simulation('Home', 'Away', player_info)
+    return renderer
+
+
+def _make_game_state(timestamp=0.0):
+    from src.game_engine import GameState, PlayerState, BallState
+
+    players = {
+        'p1': PlayerState('p1', 60.0, 40.0, has_ball=True),
+        'p2': PlayerState('p2', 110.0, 40.0),
+    }
+    return GameState(timestamp=timestamp, period=1, score_home=0, score_away=0,
+                     possession_team=None, players=players, ball=BallState(60.0, 40.0))
+
+
+def test_simulation_frame_draws_panels_once():
+    """Each panel is drawn once on a fresh frame and not again while unchanged."""
+    renderer = _make_renderer()
+    game_state = _make_game_state()
+
+    calls = {'top_bar': 0, 'sidebar': 0}
+    draw_top_bar, draw_left_sidebar = renderer._draw_top_bar, renderer._draw_left_sidebar
+
+    def count_top_bar(state):
+        calls['top_bar'] += 1
+        draw_top_bar(state)
+
+    def count_sidebar(state):
+        calls['sidebar'] += 1
+        draw_left_sidebar(state)
+
+    renderer._draw_top_bar = count_top_bar
+    renderer._draw_left_sidebar = count_sidebar
+
+    renderer.render(game_state)
+    assert calls == {'top_bar': 1, 'sidebar': 1}, f"First frame drew {calls}"
+
+    # Same state again: nothing to redraw or present
+    renderer.render(game_state)
+    assert calls == {'top_bar': 1, 'sidebar': 1}, f"Unchanged frame drew {calls}"
+    assert renderer.dirty_rects == []
+
+    # Clock moves on: the stats panel still shows the same thing
+    from src.renderer import STATS_PANEL_RECT
+    renderer.render(_make_game_state(timestamp=1.0))
+    assert renderer.dirty_rects
+    assert STATS_PANEL_RECT not in renderer.dirty_rects
+
+    print("[PASS] Simulation panel draw count test passed")
+
+
+def test_simulation_click_selects_player():
+    """Clicking on a player's token selects that player."""
+    import numpy as np
+    from src.config import SIDEBAR_WIDTH
+
+    renderer = _make_renderer()
+    game_state = _make_game_state()
+    renderer.render(game_state)
+
+    px, py = renderer.pitch.statsbomb_to_screen(np.array([[110.0, 40.0]]))[0].tolist()
+    assert renderer.handle_simulation_click((px, py), game_state) == 'p2'
+    assert renderer.selected_player_id == 'p2'
+
+    # Far from everyone
+    assert renderer.handle_simulation_click((SIDEBAR_WIDTH + 5, 5), game_state) is None
+
+    print("[PASS] Simulation click test passed")
+
+
+def test_new_game_state_replaces_drawn_players():
+    """A fresh GameState (as after a seek) or a roster change redraws the right players."""
+    renderer = _make_renderer()
+    # The first state is dropped as soon as it is drawn, so the next
+    # players dict can land on the same address
+    renderer.render(_make_game_state(timestamp=1.0))
+    game_state = _make_game_state(timestamp=2.0)
+    renderer.render(game_state)
+
+    # A new state at the same time (a seek) is still a new frame, even
+    # if it lands where the dropped one was
+    renderer.render(_make_game_state(timestamp=5.0))
+    renderer.render(_make_game_state(timestamp=5.0))
+    assert renderer.dirty_rects
+
+    renderer.render(game_state)
+    drawn, _ = renderer._drawn_players
+    assert all(player_state is game_state.players[player_id] for player_id, player_state in drawn)
+
+    # Same dict, roster change reported by the engine
+    game_state.players['p2'].is_active = False
+    game_state.roster_version += 1
+    game_state.timestamp = 3.0
+    renderer.render(game_state)
+    assert [player_id for player_id, _ in renderer._drawn_players[0]] == ['p1']
+
+    print("[PASS] Simulation seek redraw test passed")
+
+
+if __name__ == "__main__":
+    print("\n" + "="*50)
+    print("Running Renderer Tests")
+    print("="*50 + "\n")
+
+    try:
+        test_simulation_frame_draws_panels_once()
+        test_simulation_click_selects_player()
+        test_new_game_state_replaces_drawn_players()
+
+        print("\n" + "="*50)
+        print("All Renderer tests PASSED!")
+        print("="*50 + "\n")
+
+    except Exception as e:
+        print(f"\nTest FAILED: {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
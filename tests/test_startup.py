@@ -1,5 +1,5 @@
+import importlib
 import os
-import pygame
 import sys
 
 # Use dummy video driver for headless testing
@@ -9,24 +9,31 @@ os.environ["SDL_VIDEODRIVER"] = "dummy"
 sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
 
 try:
-    from src.game_engine import GameEngine
+    # Import-only smoke test: cheap enough to run everywhere
+    for module in ("src.game_engine", "src.synthetic_engine", "src.renderer"):
+        importlib.import_module(module)
     print("Import successful.")
-    
-    # Initialize engine
-    game = GameEngine()
-    print("GameEngine initialized.")
-    
-    # Load content
-    game.load_content()
-    print("Content loaded.")
-    
-    # Run one loop iteration manually
-    game.handle_input()
-    game.update()
-    game.draw()
-    print("One loop iteration successful.")
-    
-    pygame.quit()
+
+    # Full startup (display, renderer, one frame) only on request, as it
+    # opens a window surface and loads fonts
+    if os.environ.get("OFFSIDE_FULL_SMOKE"):
+        import pygame
+        from src.config import SCREEN_WIDTH, SCREEN_HEIGHT
+        from src.renderer import Renderer
+
+        pygame.init()
+        screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+        renderer = Renderer(screen)
+        print("Renderer initialized.")
+
+        # Run one loop iteration manually
+        pygame.event.pump()
+        renderer.render()
+        pygame.display.update(renderer.dirty_rects)
+        print("One loop iteration successful.")
+
+        pygame.quit()
+
     print("Test Passed.")
 except Exception as e:
     print(f"Test Failed: {e}")
@@ -0,0 +1,124 @@
+"""
+Test suite for the player stats tracker.
+"""
+
+import os
+import sys
+from types import SimpleNamespace
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+
+def _event(player_id, event_type, result=None, event_id=None):
+    """Just the parts of a kloppy event the tracker reads."""
+    return SimpleNamespace(player=SimpleNamespace(player_id=player_id), event_type=event_type,
+                           result=result, event_id=event_id)
+
+
+def test_pass_and_shot_counts():
+    """Passes count as completed only on a COMPLETE result; shots by outcome."""
+    from kloppy.domain import EventType, PassResult, ShotResult
+    from src.stats_tracker import StatsTracker
+
+    events = [
+        _event('p1', EventType.PASS, PassResult.COMPLETE),
+        _event('p1', EventType.PASS, PassResult.INCOMPLETE),
+        _event('p1', EventType.PASS, PassResult.OUT),
+        _event('p1', EventType.SHOT, ShotResult.GOAL),
+        _event('p1', EventType.SHOT, ShotResult.SAVED),
+        _event('p1', EventType.SHOT, ShotResult.OFF_TARGET),
+        _event('p1', EventType.TAKE_ON),
+        _event('p2', EventType.DUEL),
+        _event('p2', EventType.INTERCEPTION),
+        SimpleNamespace(player=None, event_type=EventType.GENERIC, result=None),
+    ]
+    tracker = StatsTracker()
+    tracker.process_events(events, {'p1': {'name': 'One', 'team': 'Home'}})
+
+    stats = tracker.get_player_stats('p1')
+    assert stats['name'] == 'One'
+    assert (stats['passes_attempted'], stats['passes_completed']) == (3, 1)
+    assert (stats['shots'], stats['shots_on_target'], stats['goals']) == (3, 2, 1)
+    assert stats['dribbles'] == 1 and stats['touches'] == 7
+    assert stats['pass_completion'] == "33.3%"
+
+    stats = tracker.get_player_stats('p2')
+    assert (stats['tackles'], stats['interceptions'], stats['touches']) == (1, 1, 2)
+    assert stats['pass_completion'] == "N/A"
+
+    assert tracker.get_player_stats('nobody') == {}
+
+    assert tracker.get_top_players('touches', 1) == [('p1', 'One', 7)]
+    assert [row[0] for row in tracker.get_top_players('tackles')] == ['p2', 'p1']
+
+    # Derived stats are reused until more events come in
+    assert tracker.get_player_stats('p2') is stats
+    tracker.process_events([_event('p2', EventType.PASS, PassResult.COMPLETE)], {})
+    stats = tracker.get_player_stats('p2')
+    assert (stats['passes_attempted'], stats['pass_completion'], stats['touches']) == (1, "100.0%", 3)
+
+    print("[PASS] Stats counting test passed")
+
+
+def test_repeated_batches():
+    """Only a repeat of the last batch with event ids is skipped."""
+    from kloppy.domain import EventType
+    from src.stats_tracker import StatsTracker
+
+    tracker = StatsTracker()
+    batch = [_event('p1', EventType.PASS, event_id='e1'), _event('p1', EventType.SHOT, event_id='e2')]
+    tracker.process_events(batch, {})
+    tracker.process_events(batch, {})
+    assert tracker.get_player_stats('p1')['touches'] == 2
+    assert tracker.events_processed == 2
+
+    # Different batches of the same length without ids both count
+    tracker.process_events([_event('p1', EventType.PASS), _event('p2', EventType.PASS)], {})
+    tracker.process_events([_event('p2', EventType.DUEL), _event('p2', EventType.PASS)], {})
+    assert tracker.get_player_stats('p1')['touches'] == 3
+    assert tracker.get_player_stats('p2')['touches'] == 3
+    assert tracker.events_processed == 6
+
+    print("[PASS] Stats repeated batch test passed")
+
+
+def test_player_details_filled_later():
+    """A player first seen without info picks it up from a later batch."""
+    from kloppy.domain import EventType
+    from src.stats_tracker import StatsTracker
+
+    tracker = StatsTracker()
+    tracker.process_events([_event('p1', EventType.PASS)], {})
+    assert tracker.get_player_stats('p1')['name'] == ''
+
+    tracker.process_events([_event('p1', EventType.SHOT)], {'p1': {'name': 'One', 'team': 'Home'}})
+    stats = tracker.get_player_stats('p1')
+    assert (stats['name'], stats['team'], stats['touches']) == ('One', 'Home', 2)
+
+    # The dict-of-dicts view carries the same details and counters
+    view = tracker.player_stats['p1']
+    assert view['name'] == 'One' and view['passes_attempted'] == 1 and view['shots'] == 1
+
+    print("[PASS] Stats late player info test passed")
+
+
+if __name__ == "__main__":
+    print("\n" + "="*50)
+    print("Running Stats Tracker Tests")
+    print("="*50 + "\n")
+
+    try:
+        test_pass_and_shot_counts()
+        test_repeated_batches()
+        test_player_details_filled_later()
+
+        print("\n" + "="*50)
+        print("All Stats Tracker tests PASSED!")
+        print("="*50 + "\n")
+
+    except Exception as e:
+        print(f"\nTest FAILED: {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)